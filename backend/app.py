@@ -3,17 +3,33 @@ from flask_cors import CORS
 from config import DevelopmentConfig
 from database import db
 from extensions import bcrypt, jwt
+from services.daily_mission_cache import daily_mission_cache
+from services.mission_generation_worker import mission_generation_worker
+from services.password_hasher import password_hasher
+from services.user_profile_cache import user_profile_cache
+from services.leaderboard import leaderboard
+from services.rate_limiter import rate_limiter
+from services.metrics import init_metrics
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+from services.scheduler_jobs import register_scheduler_jobs
 import atexit
+import click
 
-def create_app(config_class=DevelopmentConfig):
+def create_app(config_class=DevelopmentConfig, start_scheduler=None):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
     db.init_app(app)
     bcrypt.init_app(app)
     jwt.init_app(app)
+    daily_mission_cache.init_app(app)
+    mission_generation_worker.init_app(app)
+    password_hasher.init_app(app)
+    user_profile_cache.init_app(app)
+    leaderboard.init_app(app)
+    rate_limiter.init_app(app)
+    init_metrics(app)
+
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
         app.logger.warning(f'토큰 만료: {jwt_payload}')
@@ -39,14 +55,15 @@ def create_app(config_class=DevelopmentConfig):
 
         if origin and (allow_all or origin in cors_origins):
             response.headers['Access-Control-Allow-Origin'] = origin
-            response.headers.setdefault('Vary', 'Origin')
+            response.vary.add('Origin')
         elif allow_all:
             response.headers['Access-Control-Allow-Origin'] = '*'
 
         response.headers['Access-Control-Allow-Credentials'] = 'true'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With'
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With, X-Guest-Id'
         response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
         response.headers['Access-Control-Max-Age'] = '3600'
+        response.headers['Access-Control-Expose-Headers'] = 'Retry-After'
         return response
     from routes.missions import missions_bp
     from routes.auth import auth_bp
@@ -54,6 +71,9 @@ def create_app(config_class=DevelopmentConfig):
     app.register_blueprint(missions_bp, url_prefix='/api/missions')
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
 
+    with app.app_context():
+        leaderboard.load()
+
     @app.route('/')
     def index():
         return {'message': '도파민 브레이커 API 서버입니다.', 'status': 'running'}
@@ -62,39 +82,96 @@ def create_app(config_class=DevelopmentConfig):
     def health():
         return {'status': 'healthy'}
 
-    scheduler = BackgroundScheduler()
-
-    def scheduled_mission_generation():
-        with app.app_context():
-            from services.ai_mission_generator import generate_and_save_daily_missions
-            generate_and_save_daily_missions()
-
-    scheduler.add_job(
-        func=scheduled_mission_generation,
-        trigger=CronTrigger(hour=0, minute=1),
-        id='daily_mission_generation',
-        name='Generate daily missions at midnight',
-        replace_existing=True
-    )
-
-    scheduler.start()
-    atexit.register(lambda: scheduler.shutdown())
+    @app.route('/health/db-pool')
+    def db_pool_health():
+        from utils.db_pool import pool_status
+        return pool_status(db.engine)
+
+    @app.route('/metrics')
+    def metrics():
+        from services.metrics import render_metrics, pool_metric_lines
+        from utils.db_pool import pool_status
+        body = render_metrics(pool_metric_lines(pool_status(db.engine)))
+        return body, 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+    @app.cli.command('rebuild-medal-tallies')
+    @click.option('--batch-size', default=1000, show_default=True)
+    def rebuild_medal_tallies_command(batch_size):
+        """mission_records로부터 사용자별 메달 집계를 재계산"""
+        from services.medal_tally import rebuild_medal_tallies
+        rebuild_medal_tallies(batch_size=batch_size, log=click.echo)
+
+    @app.cli.command('rebuild-user-stats')
+    @click.option('--batch-size', default=1000, show_default=True)
+    def rebuild_user_stats_command(batch_size):
+        """mission_records로부터 사용자별 일별/누적 통계와 연속 달성 일수를 재계산"""
+        from services.user_stats import rebuild_user_stats
+        rebuild_user_stats(batch_size=batch_size, log=click.echo)
+
+    @app.cli.command('rebuild-leaderboard')
+    def rebuild_leaderboard_command():
+        """메달 집계/일별 통계로 주간·전체 리더보드를 다시 채움 (Redis 사용 시 공유 리더보드 갱신)"""
+        leaderboard.rebuild()
+        click.echo('리더보드를 다시 채웠습니다.')
+
+    @app.cli.command('migrate-schema')
+    def migrate_schema_command():
+        """적용되지 않은 스키마 마이그레이션 실행 (배포 시 웹 워커를 띄우기 전에 실행)"""
+        from services.schema_migrations import run_migrations
+        if not run_migrations(log=click.echo):
+            raise SystemExit(1)
+
+    @app.cli.command('schema-status')
+    def schema_status_command():
+        """스키마 마이그레이션 적용 현황 출력"""
+        from services.schema_migrations import MIGRATIONS, applied_versions
+        applied = applied_versions()
+        for version, description, _ in MIGRATIONS:
+            click.echo(f'{"적용됨" if version in applied else "대기"}  {version:>3}  {description}')
+
+    @app.cli.command('check-query-plans')
+    def check_query_plans_command():
+        """미션 엔드포인트 쿼리의 EXPLAIN 결과를 출력하고 전체 스캔이 있으면 실패"""
+        from services.query_plans import check_query_plans
+        failures = check_query_plans(log=click.echo)
+        if failures:
+            click.echo(f'전체 스캔 쿼리: {", ".join(failures)}')
+            raise SystemExit(1)
+
+    @app.cli.command('migrate-daily-mission-items')
+    def migrate_daily_mission_items_command():
+        """기존 daily_missions 컬럼을 daily_mission_items 행으로 변환"""
+        from services.daily_mission_store import migrate_wide_daily_missions
+        migrate_wide_daily_missions(log=click.echo)
+
+    # RUN_SCHEDULER=0이면 웹 워커에서는 스케줄러를 띄우지 않는다 (run_scheduler.py로 별도 실행)
+    if start_scheduler is None:
+        start_scheduler = app.config['RUN_SCHEDULER']
+
+    if start_scheduler:
+        scheduler = BackgroundScheduler()
+        register_scheduler_jobs(scheduler, app)
+        scheduler.start()
+        atexit.register(lambda: scheduler.shutdown())
+
+    atexit.register(mission_generation_worker.shutdown)
+    atexit.register(password_hasher.shutdown)
 
     return app
 
 if __name__ == '__main__':
     app = create_app()
     with app.app_context():
-        db.create_all()
+        from services.schema_migrations import run_migrations
+        run_migrations(log=app.logger.info)
+        leaderboard.rebuild()
 
-        from services.ai_mission_generator import generate_and_save_daily_missions
-        from models.daily_mission import DailyMission
+        from services.daily_mission_store import load_daily_mission_list
         from datetime import datetime
 
         today = datetime.now().date()
-        existing_mission = DailyMission.query.filter_by(date=today).first()
-        if not existing_mission:
+        if load_daily_mission_list(today) is None:
             app.logger.info("오늘 미션이 없습니다. 즉시 생성합니다.")
-            generate_and_save_daily_missions()
+        mission_generation_worker.submit(today, days_ahead=app.config['MISSION_BUFFER_DAYS'])
 
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    app.run(debug=app.config['DEBUG'], host='0.0.0.0', port=5001)
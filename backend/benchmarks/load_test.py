@@ -0,0 +1,377 @@
+"""
+미션/인증 API 부하 테스트
+
+SQLite(기본) 또는 로컬 MySQL에 사용자, 미션 기록, 오늘의 미션을 지정한 양만큼 채운 뒤
+엔드포인트별로 고정 동시성의 요청을 보내 지연 시간(p50/p95/p99), 처리량, 요청당 SQL 쿼리 수를 측정한다.
+Gemini 호출은 미션 풀을 돌려주는 대체 생성기로 바꾸므로 API 키 없이 실행된다.
+결과는 JSON으로 저장하며, --compare로 이전 결과와 비교해 회귀를 표시한다.
+
+Usage:
+    python benchmarks/load_test.py --users 200 --records 50000 --days 30 --concurrency 8 --requests 500
+    python benchmarks/load_test.py --database-url mysql+pymysql://root:@localhost/dopamine_breaker_bench
+    python benchmarks/load_test.py --output after.json --compare before.json --threshold 10
+    python benchmarks/load_test.py --base-url http://localhost:5001 --scenarios medals recent
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+from app import create_app  # noqa: E402
+from config import DevelopmentConfig  # noqa: E402
+from database import db  # noqa: E402
+from models.mission import MissionRecord  # noqa: E402
+from models.user import UserModel  # noqa: E402
+from models.daily_mission import TIER_SLOTS  # noqa: E402
+from services.ai_mission_generator import generate_and_save_daily_missions  # noqa: E402
+from services.fallback_missions import pick_fallback_missions  # noqa: E402
+from services.leaderboard import leaderboard  # noqa: E402
+from services.medal_tally import rebuild_medal_tallies  # noqa: E402
+from services.password_hasher import password_hasher  # noqa: E402
+from services.schema_migrations import run_migrations  # noqa: E402
+from services.user_stats import rebuild_user_stats  # noqa: E402
+
+RESULTS_FORMAT_VERSION = 1
+PASSWORD = 'load-test-password'
+SEED_CHUNK_SIZE = 1000
+TIERS = [tier for tier, _ in TIER_SLOTS]
+PRESET_IDS = list(range(1, sum(count for _, count in TIER_SLOTS) + 1))
+# 결과 비교 시 값이 클수록 나쁜 지표 / 작을수록 나쁜 지표
+LOWER_IS_BETTER = ('p50_ms', 'p95_ms', 'p99_ms', 'queries_per_request')
+HIGHER_IS_BETTER = ('throughput_rps',)
+
+
+class StubMissionGenerator:
+    """Gemini 대신 미션 풀에서 미션을 돌려주는 생성기 (latency초만큼 응답 지연을 흉내)"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+
+    def generate_with_retry(self, previous_missions=None, **kwargs):
+        time.sleep(self.latency)
+        return pick_fallback_missions(datetime.now().date(), previous_missions)
+
+
+def build_app(args):
+    engine_options = {}
+    if args.database_url.startswith('sqlite'):
+        # 여러 스레드가 같은 파일에 쓰므로 잠금 대기 시간을 늘림
+        engine_options['connect_args'] = {'timeout': 30}
+
+    config_class = type('LoadTestConfig', (DevelopmentConfig,), {
+        'DEBUG': False,
+        'SQLALCHEMY_ECHO': False,
+        'SQLALCHEMY_DATABASE_URI': args.database_url,
+        'SQLALCHEMY_ENGINE_OPTIONS': engine_options,
+        'GEMINI_API_KEY': None,
+        'RUN_SCHEDULER': False,
+        # 같은 토큰/IP로 반복 요청하므로 요청 한도는 끄고 측정
+        'RATE_LIMIT_ENABLED': False,
+        'BCRYPT_LOG_ROUNDS': args.bcrypt_rounds,
+        'SLOW_QUERY_THRESHOLD_MS': 10 ** 6,
+    })
+    return create_app(config_class, start_scheduler=False)
+
+
+def seed(app, args, log=print):
+    """사용자, 오늘의 미션, 미션 기록을 채우고 집계 테이블을 재계산 (이미 채워져 있으면 건너뜀)"""
+    rng = random.Random(args.seed)
+
+    with app.app_context():
+        run_migrations(log=lambda message: None)
+
+        if UserModel.query.filter(UserModel.username.like('loadtest_%')).count() >= args.users:
+            log('기존 시드 데이터를 사용합니다. (--reseed로 다시 생성)')
+            return
+
+        started = time.perf_counter()
+        password_hash = password_hasher.generate_password_hash(PASSWORD)
+        db.session.execute(insert(UserModel), [
+            {'username': f'loadtest_{index}', 'email': f'loadtest_{index}@example.com', 'password_hash': password_hash}
+            for index in range(args.users)
+        ])
+        db.session.commit()
+        user_ids = [user_id for (user_id,) in db.session.query(UserModel.id).filter(
+            UserModel.username.like('loadtest_%')
+        )]
+
+        today = datetime.now().date()
+        generator = StubMissionGenerator()
+        for offset in range(args.days - 1, -1, -1):
+            generate_and_save_daily_missions(today - timedelta(days=offset), generator=generator)
+
+        now = datetime.utcnow()
+        guest_ids = [f'loadtest-guest-{index:04d}' for index in range(max(1, args.users // 10))]
+        for start in range(0, args.records, SEED_CHUNK_SIZE):
+            rows = []
+            for _ in range(min(SEED_CHUNK_SIZE, args.records - start)):
+                completed = rng.random() < 0.8
+                is_guest = rng.random() < args.guest_ratio
+                rows.append({
+                    'user_id': None if is_guest else rng.choice(user_ids),
+                    'guest_id': rng.choice(guest_ids) if is_guest else None,
+                    'preset_mission_id': rng.choice(PRESET_IDS),
+                    'tier': rng.choice(TIERS),
+                    'title': '부하 테스트 미션',
+                    'completed_at': now - timedelta(seconds=rng.randrange(args.days * 86400)),
+                    'actual_duration': rng.randint(5, 60) if completed else 0,
+                    'notes': None if completed else 'failed',
+                })
+            db.session.execute(insert(MissionRecord), rows)
+            db.session.commit()
+
+        quiet = lambda message: None  # noqa: E731
+        rebuild_medal_tallies(log=quiet)
+        rebuild_user_stats(log=quiet)
+        leaderboard.rebuild()
+        log(f'시드 완료: 사용자 {args.users}명, 기록 {args.records}개, {args.days}일 ({time.perf_counter() - started:.1f}s)')
+
+
+class InProcessClient:
+    """Flask 테스트 클라이언트로 요청 (스레드마다 별도 클라이언트)"""
+
+    def __init__(self, app):
+        self._app = app
+        self._local = threading.local()
+
+    def request(self, method, path, body=None, headers=None):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self._app.test_client()
+        response = client.open(path, method=method, json=body, headers=headers or {})
+        return response.status_code, response.headers.get('X-DB-Query-Count'), response.get_json(silent=True)
+
+
+class HttpClient:
+    """실행 중인 서버(--base-url)로 요청"""
+
+    def __init__(self, base_url):
+        self._base_url = base_url.rstrip('/')
+
+    def request(self, method, path, body=None, headers=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(
+            self._base_url + path,
+            data=data,
+            method=method,
+            headers={'Content-Type': 'application/json', **(headers or {})}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                payload = response.read()
+                status, query_count = response.status, response.headers.get('X-DB-Query-Count')
+        except urllib.error.HTTPError as e:
+            payload = e.read()
+            status, query_count = e.code, e.headers.get('X-DB-Query-Count')
+        try:
+            payload = json.loads(payload) if payload else None
+        except ValueError:
+            payload = None
+        return status, query_count, payload
+
+
+def login_users(client, args):
+    """인증이 필요한 시나리오에서 사용할 토큰 (사용자 최대 --token-users명)"""
+    tokens = []
+    for index in range(min(args.users, args.token_users)):
+        status, _, payload = client.request(
+            'POST', '/api/auth/login', {'username': f'loadtest_{index}', 'password': PASSWORD}
+        )
+        if status == 200:
+            tokens.append(payload['access_token'])
+    if not tokens:
+        raise SystemExit('로그인에 실패했습니다. 시드 데이터와 --bcrypt-rounds를 확인하세요.')
+    return tokens
+
+
+def build_scenarios(tokens, args):
+    """
+    시나리오 이름 -> (rng를 받아 (method, path, body, headers)를 만드는 함수)
+    """
+    def auth(rng):
+        return {'Authorization': f'Bearer {rng.choice(tokens)}'}
+
+    def complete(rng):
+        preset_id = rng.choice(PRESET_IDS)
+        return 'POST', '/api/missions/presets/complete', {
+            'preset_mission_id': preset_id,
+            'tier': TIERS[0] if preset_id <= 5 else TIERS[1] if preset_id <= 10 else TIERS[2],
+            'title': '부하 테스트 미션',
+            'duration': rng.randint(5, 60),
+        }, auth(rng)
+
+    def login(rng):
+        index = rng.randrange(min(args.users, args.token_users))
+        return 'POST', '/api/auth/login', {'username': f'loadtest_{index}', 'password': PASSWORD}, {}
+
+    return {
+        'presets': lambda rng: ('GET', '/api/missions/presets', None, auth(rng)),
+        'complete': complete,
+        'medals': lambda rng: ('GET', '/api/missions/medals', None, auth(rng)),
+        'recent': lambda rng: ('GET', '/api/missions/recent?limit=5', None, auth(rng)),
+        'by_tier': lambda rng: ('GET', f'/api/missions/by-tier/{rng.choice(TIERS)}', None, auth(rng)),
+        'profile_summary': lambda rng: ('GET', '/api/missions/profile-summary', None, auth(rng)),
+        'records': lambda rng: ('GET', '/api/missions/records?limit=20', None, {}),
+        'login': login,
+        'me': lambda rng: ('GET', '/api/auth/me', None, auth(rng)),
+    }
+
+
+def percentile(sorted_values, percent):
+    """최근접 순위 방식 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_scenario(client, make_request, args, seed_value):
+    rng_lock = threading.Lock()
+    rng = random.Random(seed_value)
+
+    def next_request():
+        with rng_lock:
+            return make_request(rng)
+
+    def call(_):
+        method, path, body, headers = next_request()
+        started = time.perf_counter()
+        status, query_count, _ = client.request(method, path, body, headers)
+        return time.perf_counter() - started, status, query_count
+
+    for _ in range(args.warmup):
+        call(None)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        samples = list(pool.map(call, range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(sample[0] * 1000 for sample in samples)
+    query_counts = [int(sample[2]) for sample in samples if sample[2] is not None]
+    errors = sum(1 for sample in samples if sample[1] >= 400)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'throughput_rps': round(len(samples) / elapsed, 2),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'max_ms': round(latencies[-1], 3),
+        'queries_per_request': round(sum(query_counts) / len(query_counts), 2) if query_counts else None,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    기준 결과 대비 변화율을 출력하고 threshold(%)를 넘게 나빠진 (시나리오, 지표) 목록을 반환
+    """
+    regressions = []
+    print(f'\n{"scenario":<16} {"metric":<20} {"baseline":>10} {"current":>10} {"change":>8}')
+    for name, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            worse = change > threshold if metric in LOWER_IS_BETTER else change < -threshold
+            if worse:
+                regressions.append((name, metric))
+            print(f'{name:<16} {metric:<20} {before:>10} {after:>10} {change:>+7.1f}%{" !" if worse else ""}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default=f'sqlite:///{os.path.join(tempfile.gettempdir(), "dopamine_breaker_load_test.db")}')
+    parser.add_argument('--base-url', help='지정하면 실행 중인 서버로 요청 (시드는 --database-url에 수행)')
+    parser.add_argument('--reseed', action='store_true', help='기존 SQLite 파일을 지우고 다시 시드')
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--guest-ratio', type=float, default=0.1)
+    parser.add_argument('--token-users', type=int, default=20, help='로그인해 토큰을 만들어 둘 사용자 수')
+    parser.add_argument('--scenarios', nargs='+', help='기본값: 모든 시나리오')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='시나리오별 요청 수')
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--bcrypt-rounds', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='load_test_results.json')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=10.0, help='회귀로 표시할 악화 비율(%%)')
+    args = parser.parse_args()
+
+    if args.reseed and args.database_url.startswith('sqlite:///'):
+        path = args.database_url[len('sqlite:///'):]
+        if os.path.exists(path):
+            os.remove(path)
+
+    app = build_app(args)
+    seed(app, args)
+
+    client = HttpClient(args.base_url) if args.base_url else InProcessClient(app)
+    tokens = login_users(client, args)
+    scenarios = build_scenarios(tokens, args)
+    names = args.scenarios or list(scenarios)
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        raise SystemExit(f'알 수 없는 시나리오: {", ".join(unknown)} (가능: {", ".join(scenarios)})')
+
+    results = {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'created_at': datetime.utcnow().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'database': app.config['SQLALCHEMY_DATABASE_URI'].split('://')[0],
+            'target': args.base_url or 'in-process',
+        },
+        'parameters': {
+            key: getattr(args, key) for key in (
+                'users', 'records', 'days', 'guest_ratio', 'concurrency', 'requests', 'warmup', 'bcrypt_rounds', 'seed'
+            )
+        },
+        'scenarios': {},
+    }
+
+    print(f'{"scenario":<16} {"rps":>8} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"queries":>8} {"errors":>7}')
+    for index, name in enumerate(names):
+        result = run_scenario(client, scenarios[name], args, args.seed + index)
+        results['scenarios'][name] = result
+        print(
+            f'{name:<16} {result["throughput_rps"]:>8} {result["p50_ms"]:>8} {result["p95_ms"]:>8} '
+            f'{result["p99_ms"]:>8} {result["queries_per_request"] if result["queries_per_request"] is not None else "-":>8} '
+            f'{result["errors"]:>7}'
+        )
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f'\n결과 저장: {args.output}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f'\n{len(regressions)}개 지표가 {args.threshold}% 넘게 나빠졌습니다.')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
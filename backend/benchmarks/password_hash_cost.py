@@ -0,0 +1,61 @@
+"""
+bcrypt work factor별 로그인(비밀번호 검증) 처리량 측정
+
+요청 스레드에서 바로 검증하는 경우와 프로세스 풀로 넘기는 경우를 비교한다.
+
+Usage:
+    python benchmarks/password_hash_cost.py --rounds 10 11 12 13 --concurrency 8 --requests 64
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.password_hasher import PasswordHasher, _hash_password  # noqa: E402
+
+
+def run(rounds, workers, concurrency, requests):
+    hasher = PasswordHasher()
+    hasher.init_app(SimpleNamespace(config={
+        'BCRYPT_LOG_ROUNDS': rounds,
+        'PASSWORD_HASH_TIMEOUT': None,
+        'PASSWORD_HASH_WORKERS': workers,
+        'PASSWORD_HASH_MAX_QUEUE': requests,
+    }))
+    password_hash = _hash_password('benchmark-password', rounds)
+
+    # 프로세스 풀 기동 비용은 측정에서 제외
+    hasher.check_password_hash(password_hash, 'benchmark-password')
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(
+            lambda _: hasher.check_password_hash(password_hash, 'benchmark-password'),
+            range(requests)
+        ))
+    elapsed = time.perf_counter() - started
+    hasher.shutdown()
+    return requests / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, nargs='+', default=[10, 11, 12, 13])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=64)
+    args = parser.parse_args()
+
+    print(f'{"rounds":>6} {"inline logins/s":>16} {"pool logins/s":>14}')
+    for rounds in args.rounds:
+        inline = run(rounds, 0, args.concurrency, args.requests)
+        pooled = run(rounds, args.workers, args.concurrency, args.requests)
+        print(f'{rounds:>6} {inline:>16.1f} {pooled:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
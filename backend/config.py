@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from utils.db_pool import TimedQueuePool
 
 load_dotenv()
 
@@ -11,6 +12,47 @@ class Config:
     JWT_HEADER_TYPE = 'Bearer'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
+    # 설정 시 오늘의 미션 캐시를 워커 간에 공유 (예: redis://localhost:6379/0)
+    MISSION_CACHE_REDIS_URL = os.environ.get('MISSION_CACHE_REDIS_URL')
+    # 설정 시 리더보드를 Redis sorted set으로 공유 (없으면 MISSION_CACHE_REDIS_URL 사용)
+    LEADERBOARD_REDIS_URL = os.environ.get('LEADERBOARD_REDIS_URL')
+    # AI 미션 생성 요청당 타임아웃(초), 재시도 횟수, 지수 백오프 기본 대기(초)
+    MISSION_GENERATION_TIMEOUT = int(os.environ.get('MISSION_GENERATION_TIMEOUT', 30))
+    MISSION_GENERATION_MAX_ATTEMPTS = int(os.environ.get('MISSION_GENERATION_MAX_ATTEMPTS', 3))
+    MISSION_GENERATION_BACKOFF_SECONDS = float(os.environ.get('MISSION_GENERATION_BACKOFF_SECONDS', 2))
+    # 오늘 이후 미리 생성해 둘 미션 일수
+    MISSION_BUFFER_DAYS = int(os.environ.get('MISSION_BUFFER_DAYS', 3))
+    # 미션 생성 작업 DB 잠금 유지 시간(초), 잠금 보유 프로세스가 죽어도 이후 자동 만료
+    MISSION_GENERATION_LOCK_TTL = int(os.environ.get('MISSION_GENERATION_LOCK_TTL', 900))
+    # 0이면 웹 프로세스에서 스케줄러를 실행하지 않음 (run_scheduler.py로 별도 실행)
+    RUN_SCHEDULER = os.environ.get('RUN_SCHEDULER', '1') == '1'
+    # bcrypt work factor, 변경 시 다음 로그인에서 새 cost로 재해싱
+    BCRYPT_LOG_ROUNDS = int(os.environ.get('BCRYPT_LOG_ROUNDS', 12))
+    # 해싱 프로세스 수 (미설정 시 CPU 수, 0이면 요청 스레드에서 실행)와 추가 대기 허용 개수
+    PASSWORD_HASH_WORKERS = int(os.environ['PASSWORD_HASH_WORKERS']) if os.environ.get('PASSWORD_HASH_WORKERS') else None
+    PASSWORD_HASH_MAX_QUEUE = int(os.environ.get('PASSWORD_HASH_MAX_QUEUE', 32))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 10))
+    # 액세스 토큰에 표시용 username/created_at 클레임을 넣음 (/me는 프로필 캐시와 DB로 응답)
+    JWT_PROFILE_CLAIMS = os.environ.get('JWT_PROFILE_CLAIMS', '1') == '1'
+    USER_PROFILE_CACHE_TTL = int(os.environ.get('USER_PROFILE_CACHE_TTL', 300))
+    # 설정 시 /me 프로필 캐시를 워커 간에 공유하여 수정/삭제가 즉시 반영됨 (없으면 MISSION_CACHE_REDIS_URL 사용)
+    USER_PROFILE_CACHE_REDIS_URL = os.environ.get('USER_PROFILE_CACHE_REDIS_URL')
+    # 이 시간(ms) 이상 걸린 SQL 쿼리는 경고 로그로 남김
+    SLOW_QUERY_THRESHOLD_MS = int(os.environ.get('SLOW_QUERY_THRESHOLD_MS', 200))
+    # 사용자 id(비로그인은 IP)별 토큰 버킷 요청 한도, 값은 '횟수/기간'(second, minute, hour, day)
+    RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', '1') == '1'
+    # 설정 시 요청 한도를 Redis에 공유 (없으면 워커별로 집계)
+    RATE_LIMIT_STORAGE_URL = os.environ.get('RATE_LIMIT_STORAGE_URL')
+    RATE_LIMITS = {
+        'auth_login': os.environ.get('RATE_LIMIT_AUTH_LOGIN', '10/minute'),
+        'auth_register': os.environ.get('RATE_LIMIT_AUTH_REGISTER', '5/minute'),
+        'mission_complete': os.environ.get('RATE_LIMIT_MISSION_COMPLETE', '30/minute'),
+        'presets_complete': os.environ.get('RATE_LIMIT_PRESETS_COMPLETE', '30/minute'),
+        'presets_fail': os.environ.get('RATE_LIMIT_PRESETS_FAIL', '30/minute'),
+        'presets_batch': os.environ.get('RATE_LIMIT_PRESETS_BATCH', '10/minute'),
+        'records_import': os.environ.get('RATE_LIMIT_RECORDS_IMPORT', '5/hour'),
+        'generate_daily': os.environ.get('RATE_LIMIT_GENERATE_DAILY', '3/hour'),
+    }
     CORS_HEADERS = 'Content-Type'
     _raw_cors_origins = os.environ.get(
         'CORS_ORIGINS',
@@ -33,6 +75,16 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     DEBUG = False
     SQLALCHEMY_ECHO = False
+    # 워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW) <= MySQL max_connections가 되도록 설정
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': TimedQueuePool,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        # MySQL wait_timeout보다 짧게 유지하여 끊긴 커넥션 재사용 방지
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 280)),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '1') == '1'
+    }
 
 config = {
     'development': DevelopmentConfig,
@@ -1,8 +1,25 @@
 from .mission import Mission, MissionRecord
 from .user import UserModel
+from .daily_mission import DailyMission, DailyMissionItem
+from .daily_completion import DailyPresetCompletion, GuestPresetCompletion
+from .medal_tally import UserMedalTally
+from .job_lock import JobLock
+from .user_stats import UserDailyStats, UserStats
+from .schema_migration import SchemaMigration
+from .mission_generation_job import MissionGenerationJob
 
 __all__ = [
     'Mission',
     'MissionRecord',
     'UserModel',
+    'DailyMission',
+    'DailyMissionItem',
+    'DailyPresetCompletion',
+    'GuestPresetCompletion',
+    'UserMedalTally',
+    'JobLock',
+    'UserDailyStats',
+    'UserStats',
+    'SchemaMigration',
+    'MissionGenerationJob',
 ]
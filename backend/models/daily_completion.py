@@ -0,0 +1,27 @@
+from database import db
+
+
+class DailyPresetCompletion(db.Model):
+    """사용자별/일자별 완료(또는 실패)한 프리셋 미션 비트맵"""
+    __tablename__ = 'daily_preset_completions'
+
+    user_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    date = db.Column(db.Date, primary_key=True)
+    # 프리셋 미션 id 1~13을 비트 0~12에 저장
+    completed_mask = db.Column(db.SmallInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<DailyPresetCompletion user_id={self.user_id} date={self.date} mask={self.completed_mask:#06x}>'
+
+
+class GuestPresetCompletion(db.Model):
+    """비로그인 기기(게스트 id)별/일자별 완료(또는 실패)한 프리셋 미션 비트맵, 로그인 시 사용자 비트맵으로 옮긴다"""
+    __tablename__ = 'guest_preset_completions'
+
+    guest_id = db.Column(db.String(36), primary_key=True)
+    date = db.Column(db.Date, primary_key=True, index=True)
+    # 프리셋 미션 id 1~13을 비트 0~12에 저장
+    completed_mask = db.Column(db.SmallInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<GuestPresetCompletion guest_id={self.guest_id} date={self.date} mask={self.completed_mask:#06x}>'
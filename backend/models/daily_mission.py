@@ -1,82 +1,57 @@
 from datetime import datetime
 from database import db
 
+# 티어 순서와 티어별 기본 미션 개수 (슬롯 번호 = 프리셋 미션 id)
+TIER_SLOTS = (('bronze', 5), ('silver', 5), ('gold', 3))
+
+
 class DailyMission(db.Model):
     __tablename__ = 'daily_missions'
 
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.Date, nullable=False, unique=True, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    bronze_1_title = db.Column(db.String(100), nullable=False)
-    bronze_1_description = db.Column(db.Text, nullable=False)
-    bronze_1_duration = db.Column(db.Integer, nullable=False)
-
-    bronze_2_title = db.Column(db.String(100), nullable=False)
-    bronze_2_description = db.Column(db.Text, nullable=False)
-    bronze_2_duration = db.Column(db.Integer, nullable=False)
-
-    bronze_3_title = db.Column(db.String(100), nullable=False)
-    bronze_3_description = db.Column(db.Text, nullable=False)
-    bronze_3_duration = db.Column(db.Integer, nullable=False)
-
-    bronze_4_title = db.Column(db.String(100), nullable=False)
-    bronze_4_description = db.Column(db.Text, nullable=False)
-    bronze_4_duration = db.Column(db.Integer, nullable=False)
-
-    bronze_5_title = db.Column(db.String(100), nullable=False)
-    bronze_5_description = db.Column(db.Text, nullable=False)
-    bronze_5_duration = db.Column(db.Integer, nullable=False)
-
-    silver_1_title = db.Column(db.String(100), nullable=False)
-    silver_1_description = db.Column(db.Text, nullable=False)
-    silver_1_duration = db.Column(db.Integer, nullable=False)
-
-    silver_2_title = db.Column(db.String(100), nullable=False)
-    silver_2_description = db.Column(db.Text, nullable=False)
-    silver_2_duration = db.Column(db.Integer, nullable=False)
-
-    silver_3_title = db.Column(db.String(100), nullable=False)
-    silver_3_description = db.Column(db.Text, nullable=False)
-    silver_3_duration = db.Column(db.Integer, nullable=False)
-
-    silver_4_title = db.Column(db.String(100), nullable=False)
-    silver_4_description = db.Column(db.Text, nullable=False)
-    silver_4_duration = db.Column(db.Integer, nullable=False)
+    items = db.relationship(
+        'DailyMissionItem',
+        order_by='DailyMissionItem.slot',
+        lazy=True,
+        cascade='all, delete-orphan'
+    )
 
-    silver_5_title = db.Column(db.String(100), nullable=False)
-    silver_5_description = db.Column(db.Text, nullable=False)
-    silver_5_duration = db.Column(db.Integer, nullable=False)
+    def __repr__(self):
+        return f'<DailyMission {self.date}>'
 
-    gold_1_title = db.Column(db.String(100), nullable=False)
-    gold_1_description = db.Column(db.Text, nullable=False)
-    gold_1_duration = db.Column(db.Integer, nullable=False)
+    def to_mission_list(self):
+        return [item.to_dict() for item in self.items]
 
-    gold_2_title = db.Column(db.String(100), nullable=False)
-    gold_2_description = db.Column(db.Text, nullable=False)
-    gold_2_duration = db.Column(db.Integer, nullable=False)
 
-    gold_3_title = db.Column(db.String(100), nullable=False)
-    gold_3_description = db.Column(db.Text, nullable=False)
-    gold_3_duration = db.Column(db.Integer, nullable=False)
+class DailyMissionItem(db.Model):
+    """오늘의 미션 한 개 (날짜별 슬롯 단위)"""
+    __tablename__ = 'daily_mission_items'
+    __table_args__ = (
+        db.UniqueConstraint('date', 'slot', name='uq_daily_mission_items_date_slot'),
+        db.Index('ix_daily_mission_items_date_tier', 'date', 'tier'),
+    )
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    id = db.Column(db.Integer, primary_key=True)
+    date = db.Column(db.Date, db.ForeignKey('daily_missions.date', ondelete='CASCADE'), nullable=False)
+    slot = db.Column(db.SmallInteger, nullable=False)
+    tier = db.Column(db.String(20), nullable=False)
+    title = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    duration = db.Column(db.Integer, nullable=False)
+    category = db.Column(db.String(50), nullable=False, default='ai_generated')
 
     def __repr__(self):
-        return f'<DailyMission {self.date}>'
-
-    def to_mission_list(self):
-        return [
-            {'id': 1, 'title': self.bronze_1_title, 'description': self.bronze_1_description, 'duration': self.bronze_1_duration, 'tier': 'bronze', 'category': 'ai_generated'},
-            {'id': 2, 'title': self.bronze_2_title, 'description': self.bronze_2_description, 'duration': self.bronze_2_duration, 'tier': 'bronze', 'category': 'ai_generated'},
-            {'id': 3, 'title': self.bronze_3_title, 'description': self.bronze_3_description, 'duration': self.bronze_3_duration, 'tier': 'bronze', 'category': 'ai_generated'},
-            {'id': 4, 'title': self.bronze_4_title, 'description': self.bronze_4_description, 'duration': self.bronze_4_duration, 'tier': 'bronze', 'category': 'ai_generated'},
-            {'id': 5, 'title': self.bronze_5_title, 'description': self.bronze_5_description, 'duration': self.bronze_5_duration, 'tier': 'bronze', 'category': 'ai_generated'},
-            {'id': 6, 'title': self.silver_1_title, 'description': self.silver_1_description, 'duration': self.silver_1_duration, 'tier': 'silver', 'category': 'ai_generated'},
-            {'id': 7, 'title': self.silver_2_title, 'description': self.silver_2_description, 'duration': self.silver_2_duration, 'tier': 'silver', 'category': 'ai_generated'},
-            {'id': 8, 'title': self.silver_3_title, 'description': self.silver_3_description, 'duration': self.silver_3_duration, 'tier': 'silver', 'category': 'ai_generated'},
-            {'id': 9, 'title': self.silver_4_title, 'description': self.silver_4_description, 'duration': self.silver_4_duration, 'tier': 'silver', 'category': 'ai_generated'},
-            {'id': 10, 'title': self.silver_5_title, 'description': self.silver_5_description, 'duration': self.silver_5_duration, 'tier': 'silver', 'category': 'ai_generated'},
-            {'id': 11, 'title': self.gold_1_title, 'description': self.gold_1_description, 'duration': self.gold_1_duration, 'tier': 'gold', 'category': 'ai_generated'},
-            {'id': 12, 'title': self.gold_2_title, 'description': self.gold_2_description, 'duration': self.gold_2_duration, 'tier': 'gold', 'category': 'ai_generated'},
-            {'id': 13, 'title': self.gold_3_title, 'description': self.gold_3_description, 'duration': self.gold_3_duration, 'tier': 'gold', 'category': 'ai_generated'}
-        ]
+        return f'<DailyMissionItem {self.date} #{self.slot} {self.tier}>'
+
+    def to_dict(self):
+        return {
+            'id': self.slot,
+            'title': self.title,
+            'description': self.description,
+            'duration': self.duration,
+            'tier': self.tier,
+            'category': self.category
+        }
@@ -0,0 +1,13 @@
+from database import db
+
+
+class JobLock(db.Model):
+    """여러 프로세스/노드 중 하나만 작업을 실행하도록 하는 DB 행 잠금"""
+    __tablename__ = 'job_locks'
+
+    name = db.Column(db.String(100), primary_key=True)
+    owner = db.Column(db.String(100), nullable=False)
+    locked_until = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'<JobLock {self.name} owner={self.owner} until={self.locked_until}>'
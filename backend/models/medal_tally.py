@@ -0,0 +1,18 @@
+from database import db
+
+
+class UserMedalTally(db.Model):
+    """사용자별 획득 메달 누적 개수"""
+    __tablename__ = 'user_medal_tallies'
+
+    # 0: 비로그인 사용자 기록
+    user_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    bronze = db.Column(db.Integer, nullable=False, default=0)
+    silver = db.Column(db.Integer, nullable=False, default=0)
+    gold = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<UserMedalTally user_id={self.user_id} {self.bronze}/{self.silver}/{self.gold}>'
+
+    def to_dict(self):
+        return {'bronze': self.bronze, 'silver': self.silver, 'gold': self.gold}
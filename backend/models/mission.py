@@ -1,4 +1,5 @@
 from datetime import datetime
+from sqlalchemy.orm import selectinload
 from database import db
 
 class Mission(db.Model):
@@ -13,7 +14,7 @@ class Mission(db.Model):
     category = db.Column(db.String(50))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    records = db.relationship('MissionRecord', backref='mission', lazy=True)
+    records = db.relationship('MissionRecord', back_populates='mission', lazy=True)
 
     def __repr__(self):
         return f'<Mission {self.title}>'
@@ -33,6 +34,11 @@ class Mission(db.Model):
 class MissionRecord(db.Model):
     """미션 완료 기록 모델"""
     __tablename__ = 'mission_records'
+    __table_args__ = (
+        db.Index('ix_mission_records_user_completed_at', 'user_id', 'completed_at'),
+        # /by-tier, /profile-summary의 user_id = ? AND tier = ? ORDER BY completed_at 조회용
+        db.Index('ix_mission_records_user_tier_completed_at', 'user_id', 'tier', 'completed_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     # nullable=True: 비로그인 사용자 미션 기록 지원
@@ -47,6 +53,12 @@ class MissionRecord(db.Model):
     # actual_duration=0: 실패/취소된 미션, >0: 완료된 미션
     actual_duration = db.Column(db.Integer)
     notes = db.Column(db.Text)
+    # 오프라인 일괄 전송 시 클라이언트가 부여한 id (재전송 중복 방지)
+    client_id = db.Column(db.String(64), unique=True, nullable=True)
+    # 비로그인 기기의 게스트 id (로그인 시 user_id로 옮기고 비운다)
+    guest_id = db.Column(db.String(36), nullable=True, index=True)
+
+    mission = db.relationship('Mission', back_populates='records')
 
     def __repr__(self):
         return f'<MissionRecord mission_id={self.mission_id} completed_at={self.completed_at}>'
@@ -65,3 +77,49 @@ class MissionRecord(db.Model):
             'actual_duration': self.actual_duration,
             'notes': self.notes
         }
+
+    @classmethod
+    def query_with_mission(cls):
+        """연관 미션을 페이지당 한 번의 IN 쿼리로 미리 로딩하는 쿼리 (N+1 방지)"""
+        return cls.query.options(selectinload(cls.mission))
+
+    @classmethod
+    def client_ids_query(cls, client_ids):
+        """이미 저장된 client_id를 (client_id 고유 인덱스로) 조회하는 쿼리"""
+        return db.session.query(cls.client_id).filter(cls.client_id.in_(list(client_ids)))
+
+    @classmethod
+    def preset_summary_query(cls):
+        """
+        프리셋 미션 목록용 컬럼만 조회하는 쿼리
+
+        ORM 객체 대신 가벼운 행 튜플을 반환하며 preset_row_to_dict로 직렬화한다.
+        프리셋 기록은 연관 미션이 없으므로 missions 테이블을 조회하지 않는다.
+        """
+        return db.session.query(
+            cls.id,
+            cls.mission_id,
+            cls.preset_mission_id,
+            cls.tier,
+            cls.title,
+            cls.description,
+            cls.completed_at,
+            cls.actual_duration,
+            cls.notes
+        )
+
+    @staticmethod
+    def preset_row_to_dict(row):
+        """preset_summary_query 결과 행을 to_dict와 같은 형태로 변환"""
+        return {
+            'id': row.id,
+            'mission_id': row.mission_id,
+            'preset_mission_id': row.preset_mission_id,
+            'tier': row.tier,
+            'title': row.title,
+            'description': row.description,
+            'mission': None,
+            'completed_at': row.completed_at.isoformat() if row.completed_at else None,
+            'actual_duration': row.actual_duration,
+            'notes': row.notes
+        }
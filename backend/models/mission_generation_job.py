@@ -0,0 +1,42 @@
+import json
+from datetime import datetime
+from database import db
+
+
+class MissionGenerationJob(db.Model):
+    """백그라운드 미션 생성 작업 상태 (어느 워커에서든 작업 id로 조회할 수 있도록 DB에 저장)"""
+    __tablename__ = 'mission_generation_jobs'
+    __table_args__ = (
+        # 같은 날짜의 진행 중인 작업 조회용
+        db.Index('ix_mission_generation_jobs_date_status', 'date', 'status'),
+    )
+
+    id = db.Column(db.String(32), primary_key=True)
+    date = db.Column(db.Date, nullable=False)
+    days_ahead = db.Column(db.Integer, nullable=False, default=0)
+    # queued, running, succeeded, failed, skipped
+    status = db.Column(db.String(20), nullable=False, default='queued')
+    # 날짜별 생성 결과 JSON ({"2024-01-01": "ai", ...})
+    result = db.Column(db.Text, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    # 대기 중이거나 실행 중인 동안만 date 값을 갖는다 (유니크 키로 날짜당 진행 중인 작업을 하나로 제한)
+    active_date = db.Column(db.Date, nullable=True, unique=True)
+    # 작업자가 마지막으로 진행 상황을 기록한 시각 (잠금 TTL 동안 갱신이 없으면 죽은 작업으로 봄)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<MissionGenerationJob {self.id} date={self.date} status={self.status}>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'date': self.date.isoformat(),
+            'days_ahead': self.days_ahead,
+            'status': self.status,
+            'result': json.loads(self.result) if self.result else None,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
@@ -0,0 +1,14 @@
+from datetime import datetime
+from database import db
+
+
+class SchemaMigration(db.Model):
+    """적용된 스키마 마이그레이션 버전 (services/schema_migrations.py 참고)"""
+    __tablename__ = 'schema_migrations'
+
+    version = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    description = db.Column(db.String(200), nullable=False)
+    applied_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<SchemaMigration {self.version}>'
@@ -12,3 +12,11 @@ class UserModel(db.Model):
 
     def __repr__(self):
         return f'<User {self.username}>'
+
+    def to_profile_dict(self):
+        return {
+            'id': self.id,
+            'username': self.username,
+            'email': self.email,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
@@ -0,0 +1,47 @@
+from database import db
+
+
+class UserDailyStats(db.Model):
+    """사용자별/일자별 미션 통계 (일자는 mission_records.completed_at 기준)"""
+    __tablename__ = 'user_daily_stats'
+
+    # 0: 비로그인 사용자 기록
+    user_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    date = db.Column(db.Date, primary_key=True)
+    completed = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+    focus_minutes = db.Column(db.Integer, nullable=False, default=0)
+    bronze = db.Column(db.Integer, nullable=False, default=0)
+    silver = db.Column(db.Integer, nullable=False, default=0)
+    gold = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<UserDailyStats user_id={self.user_id} date={self.date}>'
+
+    def to_dict(self):
+        return {
+            'date': self.date.isoformat(),
+            'completed': self.completed,
+            'failed': self.failed,
+            'focus_minutes': self.focus_minutes,
+            'tiers': {'bronze': self.bronze, 'silver': self.silver, 'gold': self.gold}
+        }
+
+
+class UserStats(db.Model):
+    """사용자별 누적 미션 통계와 연속 성공 일수"""
+    __tablename__ = 'user_stats'
+
+    user_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    completed = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+    focus_minutes = db.Column(db.Integer, nullable=False, default=0)
+    bronze = db.Column(db.Integer, nullable=False, default=0)
+    silver = db.Column(db.Integer, nullable=False, default=0)
+    gold = db.Column(db.Integer, nullable=False, default=0)
+    current_streak = db.Column(db.Integer, nullable=False, default=0)
+    longest_streak = db.Column(db.Integer, nullable=False, default=0)
+    last_completed_date = db.Column(db.Date, nullable=True)
+
+    def __repr__(self):
+        return f'<UserStats user_id={self.user_id} streak={self.current_streak}>'
@@ -1,13 +1,28 @@
 from flask import request, jsonify, Blueprint, current_app
 from models.user import UserModel
 from database import db
-from extensions import bcrypt
+from utils.auth_helpers import get_guest_id
+from services.rate_limiter import rate_limit
+from services.password_hasher import password_hasher, PasswordHasherBusyError
+from services.guest_claim import claim_guest_records
+from services.user_profile_cache import user_profile_cache, profile_claims
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from sqlalchemy.exc import IntegrityError
 import datetime
 
 auth_bp = Blueprint('auth', __name__)
 
+def _duplicated_field(error):
+    """유니크 키 위반 오류 메시지에서 중복된 컬럼(username/email)을 추출, 어느 쪽도 아니면 None"""
+    message = str(error.orig)
+    for field in ('email', 'username'):
+        # MySQL 8 / SQLite: users.email, MySQL 5.7: key 'email'
+        if f'users.{field}' in message or f"key '{field}'" in message:
+            return field
+    return None
+
 @auth_bp.route('/register', methods=['POST'])
+@rate_limit('auth_register')
 def register():
     try:
         data = request.get_json()
@@ -26,29 +41,58 @@ def register():
             current_app.logger.warning('필수 필드가 누락되었습니다.')
             return jsonify({'message': '사용자명, 이메일, 비밀번호는 필수입니다.'}), 400
 
-        if UserModel.query.filter_by(username=username).first():
-            current_app.logger.warning(f'중복된 사용자명: {username}')
-            return jsonify({'message': '이미 존재하는 사용자명입니다.'}), 409
-
-        if UserModel.query.filter_by(email=email).first():
-            current_app.logger.warning(f'중복된 이메일: {email}')
-            return jsonify({'message': '이미 존재하는 이메일입니다.'}), 409
-
-        hashed_password = bcrypt.generate_password_hash(password).decode('utf-8')
+        hashed_password = password_hasher.generate_password_hash(password)
 
+        # 사전 중복 조회 없이 INSERT 한 번으로 처리하고, 유니크 키 위반을 409로 변환
         new_user = UserModel(username=username, email=email, password_hash=hashed_password)
         db.session.add(new_user)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            field = _duplicated_field(e)
+            if field == 'email':
+                current_app.logger.warning(f'중복된 이메일: {email}')
+                return jsonify({'message': '이미 존재하는 이메일입니다.'}), 409
+            if field == 'username':
+                current_app.logger.warning(f'중복된 사용자명: {username}')
+                return jsonify({'message': '이미 존재하는 사용자명입니다.'}), 409
+            # 사용자명/이메일 중복이 아닌 제약 조건 위반은 일반 오류로 처리
+            raise
 
         current_app.logger.info(f'회원가입 성공: user_id={new_user.id}, username={username}')
         return jsonify({'message': '회원가입이 완료되었습니다.'}), 201
 
+    except PasswordHasherBusyError:
+        current_app.logger.warning('비밀번호 해싱 대기열이 가득 찼거나 시간이 초과되었습니다.')
+        return jsonify({'message': '요청이 많아 잠시 후 다시 시도해주세요.'}), 503, {'Retry-After': '1'}
+
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f'회원가입 중 오류 발생: {str(e)}', exc_info=True)
         return jsonify({'message': '회원가입 중 오류가 발생했습니다.', 'error': str(e)}), 500
 
+def _rehash_password(user, password):
+    """BCRYPT_LOG_ROUNDS가 바뀐 경우 로그인 시 새 cost로 다시 해싱하여 저장"""
+    try:
+        user.password_hash = password_hasher.generate_password_hash(password)
+        db.session.commit()
+        current_app.logger.info(f'비밀번호 재해싱: user_id={user.id}, rounds={password_hasher.rounds}')
+    except PasswordHasherBusyError:
+        # 재해싱은 다음 로그인으로 미룬다
+        db.session.rollback()
+
+def _claim_guest_records(user_id):
+    """로그인 전 이 기기(X-Guest-Id)에서 남긴 기록을 계정으로 옮긴다, 실패해도 로그인은 진행"""
+    try:
+        return claim_guest_records(user_id, get_guest_id())
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f'게스트 기록 이전 실패: user_id={user_id}, {str(e)}', exc_info=True)
+        return 0
+
 @auth_bp.route('/login', methods=['POST'])
+@rate_limit('auth_login')
 def login():
     try:
         data = request.get_json()
@@ -68,15 +112,28 @@ def login():
 
         user = UserModel.query.filter_by(username=username).first()
 
-        if user and bcrypt.check_password_hash(user.password_hash, password):
+        if user and password_hasher.check_password_hash(user.password_hash, password):
+            if password_hasher.needs_rehash(user.password_hash):
+                _rehash_password(user, password)
+
             expires = datetime.timedelta(days=1)
-            access_token = create_access_token(identity=str(user.id), expires_delta=expires)
+            claims = profile_claims(user) if current_app.config['JWT_PROFILE_CLAIMS'] else None
+            access_token = create_access_token(
+                identity=str(user.id),
+                expires_delta=expires,
+                additional_claims=claims
+            )
+            claimed = _claim_guest_records(user.id)
             current_app.logger.info(f'로그인 성공: user_id={user.id}, username={username}')
-            return jsonify(access_token=access_token), 200
+            return jsonify(access_token=access_token, claimed_records=claimed), 200
 
         current_app.logger.warning(f'로그인 실패: username={username}')
         return jsonify({'message': '사용자명 또는 비밀번호가 올바르지 않습니다.'}), 401
 
+    except PasswordHasherBusyError:
+        current_app.logger.warning('비밀번호 해싱 대기열이 가득 찼거나 시간이 초과되었습니다.')
+        return jsonify({'message': '요청이 많아 잠시 후 다시 시도해주세요.'}), 503, {'Retry-After': '1'}
+
     except Exception as e:
         current_app.logger.error(f'로그인 중 오류 발생: {str(e)}', exc_info=True)
         return jsonify({'message': '로그인 중 오류가 발생했습니다.', 'error': str(e)}), 500
@@ -85,22 +142,23 @@ def login():
 @jwt_required()
 def get_current_user():
     try:
-        current_app.logger.info('사용자 정보 조회 엔드포인트 호출됨')
-        user_id = get_jwt_identity()
-        current_app.logger.info(f'JWT에서 추출한 user_id: {user_id}')
-        user = UserModel.query.get(int(user_id))
+        user_id = int(get_jwt_identity())
+
+        # 프로필 캐시에 없으면 DB에서 조회 (수정/삭제 시 캐시가 무효화되므로 삭제된 사용자는 404)
+        profile = user_profile_cache.get(user_id)
+        if profile:
+            return jsonify(profile), 200
+
+        user = db.session.get(UserModel, user_id)
 
         if not user:
             current_app.logger.warning(f'사용자를 찾을 수 없음: user_id={user_id}')
             return jsonify({'message': '사용자를 찾을 수 없습니다.'}), 404
 
-        current_app.logger.info(f'사용자 정보 조회: user_id={user_id}, username={user.username}')
-        return jsonify({
-            'id': user.id,
-            'username': user.username,
-            'email': user.email,
-            'created_at': user.created_at.isoformat() if user.created_at else None
-        }), 200
+        profile = user.to_profile_dict()
+        user_profile_cache.set(user_id, profile)
+        current_app.logger.debug(f'사용자 정보 조회: user_id={user_id}, username={user.username}')
+        return jsonify(profile), 200
 
     except Exception as e:
         current_app.logger.error(f'사용자 정보 조회 중 오류 발생: {str(e)}', exc_info=True)
@@ -1,45 +1,62 @@
-from flask import Blueprint, request, jsonify
-from datetime import datetime
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from flask_jwt_extended import jwt_required
+from datetime import datetime, time, timedelta
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+import io
 from database import db
 from models.mission import Mission, MissionRecord
-from models.daily_mission import DailyMission
-from utils.auth_helpers import get_current_user_id
-from utils.error_handlers import handle_db_errors, validate_json_payload, success_response
+from models.user import UserModel
+from utils.auth_helpers import get_current_user_id, get_guest_id
+from utils.error_handlers import handle_db_errors, validate_json_payload, success_response, error_response
+from utils.http_cache import conditional_json_response
+from services.rate_limiter import rate_limit
+from utils.pagination import get_page_size, keyset_paginate, cached_total, InvalidCursorError
+from services.daily_mission_cache import get_daily_mission_list
+from services.completion_index import get_completed_mask, preset_bit, mark_preset_done
+from services.leaderboard import leaderboard, PERIODS as LEADERBOARD_PERIODS
+from services.medal_tally import increment_medal, get_medals, validate_result
+from services.user_stats import record_mission_result, get_user_stats
+from services.profile_summary import build_profile_summary, completed_presets_query
+from services.batch_results import record_batch_results, validate_batch_item, MAX_BATCH_SIZE
+from services.record_transfer import export_ndjson, export_csv, import_records
+from utils.local_time import local_date
 
 missions_bp = Blueprint('missions', __name__)
 
 @missions_bp.route('', methods=['GET'])
 def get_all_missions():
-    missions = Mission.query.all()
-    return jsonify([mission.to_dict() for mission in missions]), 200
+    # 미션은 추가만 되므로 (개수, 최대 id)가 같으면 이전 응답 본문과 ETag를 재사용
+    version = tuple(db.session.query(func.count(Mission.id), func.max(Mission.id)).one())
+    return conditional_json_response(
+        'missions',
+        version,
+        lambda: [mission.to_dict() for mission in Mission.query.all()]
+    )
 
 
 @missions_bp.route('/presets', methods=['GET'])
 def get_mission_presets_list():
     today = datetime.now().date()
-    daily_mission = DailyMission.query.filter_by(date=today).first()
+    all_presets = get_daily_mission_list(today)
 
-    if not daily_mission:
+    if all_presets is None:
         return jsonify({'error': '오늘의 미션이 아직 생성되지 않았습니다.'}), 404
 
-    all_presets = daily_mission.to_mission_list()
-
-    # 오늘 완료한 프리셋 미션 목록을 조회하여 중복 수행 방지
-    today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    completed_today = db.session.query(MissionRecord).filter(
-        MissionRecord.preset_mission_id.isnot(None),
-        MissionRecord.completed_at >= today_start
-    ).all()
-
-    completed_ids = {record.preset_mission_id for record in completed_today}
-    available_presets = [m for m in all_presets if m['id'] not in completed_ids]
+    # 오늘 완료한 프리셋 미션 비트맵으로 중복 수행 방지
+    completed_mask = get_completed_mask(get_current_user_id(), today, get_guest_id())
+    available_presets = [m for m in all_presets if not completed_mask & preset_bit(m['id'])]
 
     return jsonify({'missions': available_presets}), 200
 
 @missions_bp.route('/<int:mission_id>', methods=['GET'])
 def get_mission(mission_id):
-    mission = Mission.query.get_or_404(mission_id)
-    return jsonify(mission.to_dict()), 200
+    # 미션은 생성 후 수정되지 않으므로 한 번 만든 응답 본문을 계속 사용
+    return conditional_json_response(
+        ('mission', mission_id),
+        None,
+        lambda: Mission.query.get_or_404(mission_id).to_dict()
+    )
 
 @missions_bp.route('/<int:mission_id>/start', methods=['POST'])
 def start_mission(mission_id):
@@ -50,6 +67,7 @@ def start_mission(mission_id):
     }), 200
 
 @missions_bp.route('/<int:mission_id>/complete', methods=['POST'])
+@rate_limit('mission_complete')
 def complete_mission(mission_id):
     mission = Mission.query.get_or_404(mission_id)
     data = request.get_json() or {}
@@ -57,11 +75,13 @@ def complete_mission(mission_id):
     record = MissionRecord(
         mission_id=mission_id,
         actual_duration=data.get('actual_duration', mission.duration),
-        notes=data.get('notes')
+        notes=data.get('notes'),
+        completed_at=datetime.utcnow()
     )
 
     try:
         db.session.add(record)
+        record_mission_result(None, record)
         db.session.commit()
         return jsonify(record.to_dict()), 201
     except Exception as e:
@@ -70,47 +90,120 @@ def complete_mission(mission_id):
 
 @missions_bp.route('/records', methods=['GET'])
 def get_mission_records():
-    limit = request.args.get('limit', 10, type=int)
-    offset = request.args.get('offset', 0, type=int)
-
-    records = MissionRecord.query\
-        .order_by(MissionRecord.completed_at.desc())\
-        .limit(limit)\
-        .offset(offset)\
-        .all()
+    limit = get_page_size()
 
-    total = MissionRecord.query.count()
-
-    return jsonify({
+    try:
+        records, next_cursor = keyset_paginate(
+            MissionRecord.query_with_mission(),
+            MissionRecord.completed_at,
+            MissionRecord.id,
+            cursor=request.args.get('cursor'),
+            limit=limit
+        )
+    except InvalidCursorError:
+        return error_response('유효하지 않은 커서입니다.')
+
+    response = {
         'records': [record.to_dict() for record in records],
-        'total': total,
         'limit': limit,
-        'offset': offset
-    }), 200
+        'next_cursor': next_cursor
+    }
+
+    # 전체 개수는 요청한 경우에만 캐시된 근사값으로 제공
+    if request.args.get('include_total') == '1':
+        response['total'] = cached_total('mission_records', MissionRecord.query)
+
+    return jsonify(response), 200
+
+@missions_bp.route('/records/export', methods=['GET'])
+@jwt_required()
+def export_mission_records():
+    """로그인한 사용자의 미션 기록을 NDJSON/CSV로 스트리밍 (메모리 사용량 일정)"""
+    user_id = get_current_user_id()
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in ('ndjson', 'csv'):
+        return error_response('format은 ndjson 또는 csv여야 합니다.')
+
+    since = request.args.get('since')
+    try:
+        since = datetime.fromisoformat(since) if since else None
+    except ValueError:
+        return error_response('since 형식이 올바르지 않습니다.')
+
+    if fmt == 'csv':
+        body, mimetype = export_csv(user_id, since), 'text/csv'
+    else:
+        body, mimetype = export_ndjson(user_id, since), 'application/x-ndjson'
+
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=mission_records.{fmt}'}
+    )
+
+
+@missions_bp.route('/records/import', methods=['POST'])
+@jwt_required()
+@rate_limit('records_import')
+@handle_db_errors
+def import_mission_records():
+    """
+    NDJSON(기본) 또는 CSV(Content-Type: text/csv) 본문의 미션 기록을 로그인한 사용자의 기록으로 청크 단위 일괄 저장
+
+    한 트랜잭션으로 저장하므로 잘못된 행(400), 동시 저장된 client_id(409), DB 오류(500)가 나면
+    아무 행도 저장되지 않는다.
+    """
+    fmt = 'csv' if request.mimetype == 'text/csv' else 'ndjson'
+    stream = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+
+    try:
+        imported, skipped = import_records(stream, get_current_user_id(), fmt)
+    except (ValueError, UnicodeDecodeError) as e:
+        db.session.rollback()
+        return error_response(str(e))
+    except IntegrityError:
+        db.session.rollback()
+        return error_response('같은 기록을 다른 요청에서 저장하는 중입니다. 잠시 후 다시 가져오세요.', status=409)
+
+    return success_response({'imported': imported, 'skipped': skipped}, status=201)
 
 @missions_bp.route('/presets/complete', methods=['POST'])
+@rate_limit('presets_complete')
 @validate_json_payload(['preset_mission_id'])
 @handle_db_errors
 def complete_preset_mission():
     data = request.get_json()
     user_id = get_current_user_id()
 
+    error = validate_result(data.get('tier'), data.get('duration'))
+    if error:
+        return error_response(error)
+
     record = MissionRecord(
         user_id=user_id,
+        guest_id=None if user_id else get_guest_id(),
         preset_mission_id=data['preset_mission_id'],
         tier=data.get('tier'),
         title=data.get('title'),
         description=data.get('description'),
         actual_duration=data.get('duration'),
-        notes=data.get('notes')
+        notes=data.get('notes'),
+        completed_at=datetime.utcnow()
     )
 
     db.session.add(record)
+    mark_preset_done(user_id, data['preset_mission_id'], datetime.now().date(), record.guest_id)
+    if record.actual_duration and record.actual_duration > 0:
+        increment_medal(user_id, record.tier)
+    record_mission_result(user_id, record)
     db.session.commit()
+    if record.actual_duration and record.actual_duration > 0:
+        leaderboard.add_medals(user_id, {local_date(record.completed_at): {record.tier: 1}})
     return success_response(record.to_dict(), status=201)
 
 
 @missions_bp.route('/presets/fail', methods=['POST'])
+@rate_limit('presets_fail')
 @validate_json_payload(['preset_mission_id'])
 @handle_db_errors
 def fail_preset_mission():
@@ -118,18 +211,26 @@ def fail_preset_mission():
     data = request.get_json()
     user_id = get_current_user_id()
 
+    error = validate_result(data.get('tier'), None)
+    if error:
+        return error_response(error)
+
     # actual_duration=0, notes='failed'로 실패 기록 (완료한 미션과 구분)
     record = MissionRecord(
         user_id=user_id,
+        guest_id=None if user_id else get_guest_id(),
         preset_mission_id=data['preset_mission_id'],
         tier=data.get('tier'),
         title=data.get('title'),
         description=data.get('description'),
         actual_duration=0,
-        notes='failed'
+        notes='failed',
+        completed_at=datetime.utcnow()
     )
 
     db.session.add(record)
+    mark_preset_done(user_id, data['preset_mission_id'], datetime.now().date(), record.guest_id)
+    record_mission_result(user_id, record)
     db.session.commit()
     return success_response(
         {'record': record.to_dict()},
@@ -138,70 +239,139 @@ def fail_preset_mission():
     )
 
 
-@missions_bp.route('/medals', methods=['GET'])
-def get_earned_medals():
+@missions_bp.route('/presets/batch', methods=['POST'])
+@rate_limit('presets_batch')
+@validate_json_payload(['results'])
+@handle_db_errors
+def record_preset_results_batch():
+    """오프라인 동안 쌓인 완료/실패 결과 일괄 저장 (client_id 기준 멱등)"""
+    items = request.get_json()['results']
     user_id = get_current_user_id()
 
-    # 티어가 있고 실제 완료한 미션만 필터링 (실패 기록 제외)
-    query = MissionRecord.query.filter(
-        MissionRecord.tier.isnot(None),
-        MissionRecord.actual_duration > 0
-    )
+    if not isinstance(items, list) or not items:
+        return error_response('results는 비어 있지 않은 배열이어야 합니다.')
+    if len(items) > MAX_BATCH_SIZE:
+        return error_response(f'한 번에 최대 {MAX_BATCH_SIZE}개까지 전송할 수 있습니다.')
 
-    if user_id:
-        # 로그인 전 완료한 미션(user_id=None) + 로그인 후 본인 미션만 조회
-        query = query.filter((MissionRecord.user_id == user_id) | (MissionRecord.user_id.is_(None)))
+    errors = {}
+    for index, item in enumerate(items):
+        error = validate_batch_item(item)
+        if error:
+            errors[index] = error
+    if errors:
+        return jsonify({'error': '유효하지 않은 항목이 있습니다.', 'errors': errors}), 400
 
-    records = query.all()
+    created, skipped = record_batch_results(user_id, items, guest_id=get_guest_id())
+    return success_response(
+        {'created': created, 'skipped': skipped},
+        status=201 if created else 200
+    )
 
-    medals = {'bronze': 0, 'silver': 0, 'gold': 0}
-    for record in records:
-        if record.tier in medals:
-            medals[record.tier] += 1
+
+@missions_bp.route('/medals', methods=['GET'])
+def get_earned_medals():
+    user_id = get_current_user_id()
+    medals = get_medals(user_id, get_guest_id())
 
     return success_response({'medals': medals})
 
 
-@missions_bp.route('/recent', methods=['GET'])
-def get_recent_completed_missions():
-    limit = request.args.get('limit', 5, type=int)
+@missions_bp.route('/stats', methods=['GET'])
+def get_mission_stats():
+    """누적/오늘 완료 수, 집중 시간, 연속 달성 일수 (미리 집계된 행에서 조회)"""
     user_id = get_current_user_id()
+    return success_response({'stats': get_user_stats(user_id)})
 
-    query = MissionRecord.query.filter(
-        MissionRecord.preset_mission_id.isnot(None),
-        MissionRecord.actual_duration > 0
+
+@missions_bp.route('/leaderboard', methods=['GET'])
+def get_leaderboard():
+    """메달 점수 기준 상위 사용자와 내 순위 (period: weekly 또는 all)"""
+    period = request.args.get('period', 'weekly')
+    if period not in LEADERBOARD_PERIODS:
+        return error_response('period는 weekly 또는 all이어야 합니다.')
+
+    limit = get_page_size(default=10)
+    top = leaderboard.top(period, limit)
+    usernames = dict(
+        db.session.query(UserModel.id, UserModel.username).filter(
+            UserModel.id.in_([user_id for user_id, _ in top])
+        )
+    ) if top else {}
+
+    user_id = get_current_user_id()
+    return success_response({
+        'period': period,
+        'entries': [
+            {'rank': rank, 'user_id': member, 'username': usernames.get(member), 'score': score}
+            for rank, (member, score) in enumerate(top, start=1)
+        ],
+        'me': leaderboard.rank(period, user_id) if user_id else None
+    })
+
+
+@missions_bp.route('/profile-summary', methods=['GET'])
+def get_profile_summary():
+    """프로필 화면용 메달 개수, 최근 완료 미션, 티어별 완료 미션 (recent_limit, tier_limit)"""
+    user_id = get_current_user_id()
+    summary = build_profile_summary(
+        user_id,
+        guest_id=get_guest_id(),
+        recent_limit=get_page_size(default=5, param='recent_limit'),
+        tier_limit=get_page_size(default=50, param='tier_limit')
     )
+    return success_response(summary)
 
-    if user_id:
-        # 로그인 전 완료한 미션(user_id=None) + 로그인 후 본인 미션만 조회
-        query = query.filter((MissionRecord.user_id == user_id) | (MissionRecord.user_id.is_(None)))
 
-    records = query.order_by(MissionRecord.completed_at.desc()).limit(limit).all()
+@missions_bp.route('/recent', methods=['GET'])
+def get_recent_completed_missions():
+    limit = get_page_size(default=5)
+    user_id = get_current_user_id()
 
-    return success_response({'missions': [record.to_dict() for record in records]})
+    query = completed_presets_query(user_id, get_guest_id())
+
+    try:
+        records, next_cursor = keyset_paginate(
+            query,
+            MissionRecord.completed_at,
+            MissionRecord.id,
+            cursor=request.args.get('cursor'),
+            limit=limit
+        )
+    except InvalidCursorError:
+        return error_response('유효하지 않은 커서입니다.')
+
+    return success_response({
+        'missions': [MissionRecord.preset_row_to_dict(row) for row in records],
+        'next_cursor': next_cursor
+    })
 
 
 @missions_bp.route('/by-tier/<tier>', methods=['GET'])
 def get_missions_by_tier(tier):
     """특정 티어의 완료한 미션 목록 조회"""
+    limit = get_page_size(default=50)
     user_id = get_current_user_id()
 
     if tier not in ['bronze', 'silver', 'gold']:
         return jsonify({'error': 'Invalid tier. Must be bronze, silver, or gold'}), 400
 
-    query = MissionRecord.query.filter(
-        MissionRecord.tier == tier,
-        MissionRecord.preset_mission_id.isnot(None),
-        MissionRecord.actual_duration > 0
-    )
-
-    if user_id:
-        # 로그인 전 완료한 미션(user_id=None) + 로그인 후 본인 미션만 조회
-        query = query.filter((MissionRecord.user_id == user_id) | (MissionRecord.user_id.is_(None)))
+    query = completed_presets_query(user_id, get_guest_id(), tier)
 
-    records = query.order_by(MissionRecord.completed_at.desc()).all()
-
-    return success_response({'missions': [record.to_dict() for record in records]})
+    try:
+        records, next_cursor = keyset_paginate(
+            query,
+            MissionRecord.completed_at,
+            MissionRecord.id,
+            cursor=request.args.get('cursor'),
+            limit=limit
+        )
+    except InvalidCursorError:
+        return error_response('유효하지 않은 커서입니다.')
+
+    return success_response({
+        'missions': [MissionRecord.preset_row_to_dict(row) for row in records],
+        'next_cursor': next_cursor
+    })
 
 
 @missions_bp.route('', methods=['POST'])
@@ -229,25 +399,40 @@ def create_mission():
 
 
 @missions_bp.route('/generate-daily', methods=['POST'])
+@rate_limit('generate_daily')
 def generate_daily_missions_manually():
-    from services.ai_mission_generator import generate_and_save_daily_missions
+    from services.mission_generation_worker import mission_generation_worker
 
-    try:
-        generate_and_save_daily_missions()
-        return jsonify({'message': '오늘의 미션이 성공적으로 생성되었습니다.'}), 201
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    # 같은 날짜 작업이 대기/실행 중이면 새로 만들지 않고 그 작업을 돌려준다 (모델 호출은 한 번만)
+    job = mission_generation_worker.submit()
+    if job.pop('collapsed', False):
+        return jsonify({'message': '이미 진행 중인 오늘의 미션 생성 작업이 있습니다.', 'job': job}), 202
+    return jsonify({'message': '오늘의 미션 생성 작업이 등록되었습니다.', 'job': job}), 202
+
+
+@missions_bp.route('/generate-daily/<job_id>', methods=['GET'])
+def get_generation_job(job_id):
+    from services.mission_generation_worker import mission_generation_worker
+
+    job = mission_generation_worker.get(job_id)
+    if not job:
+        return error_response('작업을 찾을 수 없습니다.', 404)
+    return jsonify({'job': job}), 200
 
 
 @missions_bp.route('/daily', methods=['GET'])
 def get_today_missions():
     today = datetime.now().date()
-    daily_mission = DailyMission.query.filter_by(date=today).first()
+    missions = get_daily_mission_list(today)
 
-    if not daily_mission:
+    if missions is None:
         return jsonify({'error': '오늘의 미션이 아직 생성되지 않았습니다.'}), 404
 
-    return jsonify({
-        'date': daily_mission.date.isoformat(),
-        'missions': daily_mission.to_mission_list()
-    }), 200
+    # 자정에 미션이 바뀌므로 그 전까지만 캐시되도록 max-age 제한
+    seconds_to_midnight = int((datetime.combine(today + timedelta(days=1), time.min) - datetime.now()).total_seconds())
+    return conditional_json_response(
+        ('daily', today),
+        today,
+        lambda: {'date': today.isoformat(), 'missions': missions},
+        max_age=max(0, min(300, seconds_to_midnight))
+    )
@@ -0,0 +1,19 @@
+"""
+웹 워커와 분리된 단독 스케줄러 프로세스
+
+gunicorn 등으로 여러 웹 워커를 띄울 때는 웹 프로세스에 RUN_SCHEDULER=0을 설정하고
+이 스크립트를 하나만 실행한다.
+
+Usage:
+    python run_scheduler.py
+"""
+from apscheduler.schedulers.blocking import BlockingScheduler
+from app import create_app
+from services.scheduler_jobs import register_scheduler_jobs
+
+if __name__ == '__main__':
+    app = create_app(start_scheduler=False)
+    scheduler = BlockingScheduler()
+    register_scheduler_jobs(scheduler, app)
+    app.logger.info('단독 스케줄러를 시작합니다.')
+    scheduler.start()
@@ -1,15 +1,154 @@
 import google.generativeai as genai
-import json
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 from flask import current_app
+from models.daily_mission import TIER_SLOTS
+from services.medal_tally import TIER_DURATION_RANGES
+from services.mission_stream_parser import IncrementalMissionParser
+
+# 유효하지 않은 슬롯만 다시 요청하는 최대 횟수
+MAX_REPAIR_ROUNDS = 2
+
+
+def _log(message, level='info'):
+    try:
+        if level == 'error':
+            current_app.logger.error(message)
+        else:
+            current_app.logger.info(message)
+    except RuntimeError:
+        print(message)
+
 
 class AIMissionGenerator:
-    def __init__(self, api_key):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+    def __init__(self, api_key=None, model=None):
+        # model을 직접 넘기면 Gemini 대신 사용 (로컬 테스트용 가짜 모델 등)
+        if model is None:
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model = model
+
+    def generate_with_retry(self, previous_missions=None, max_attempts=3, timeout=None, backoff_seconds=2):
+        """
+        실패 시 지수 백오프(backoff_seconds * 2^n)로 재시도하며 미션을 생성
+
+        Raises:
+            Exception: max_attempts번 모두 실패한 경우 마지막 오류
+        """
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return self.generate_daily_missions(previous_missions, timeout=timeout)
+            except Exception:
+                if attempt == max_attempts:
+                    raise
+                time.sleep(backoff_seconds * (2 ** (attempt - 1)))
+
+    def generate_daily_missions(self, previous_missions=None, timeout=None, stream=True):
+        """
+        모델 응답을 스트리밍으로 받으며 미션을 하나씩 검증하고,
+        유효하지 않았던 슬롯만 다시 요청하여 13개 미션을 완성
+        """
+        try:
+            _log("AI 미션 생성 시작")
+
+            missions_data = {tier: [] for tier, _ in TIER_SLOTS}
+            # 미션 풀 대체와 같이 전날 미션과 같은 제목은 받지 않는다
+            previous_titles = {mission['title'] for mission in previous_missions or []}
+            self._collect_missions(
+                self._build_prompt(previous_missions), missions_data, timeout, stream, previous_titles
+            )
+
+            for _ in range(MAX_REPAIR_ROUNDS):
+                missing = self._missing_counts(missions_data)
+                if not missing:
+                    break
+                _log(f"유효하지 않은 슬롯만 다시 생성합니다: {missing}")
+                repair_prompt = self._build_repair_prompt(missing, missions_data, previous_missions)
+                self._collect_missions(repair_prompt, missions_data, timeout, stream, previous_titles)
+
+            if not self._validate_missions(missions_data):
+                counts = ', '.join(f"{tier}: {len(missions)}" for tier, missions in missions_data.items())
+                raise ValueError(f"유효성 검증 실패 - {counts}")
 
-    def generate_daily_missions(self, previous_missions=None):
+            _log("AI 미션 생성 성공")
+            return missions_data
+
+        except Exception as e:
+            error_msg = f"AI 미션 생성 실패: {str(e)}"
+            _log(error_msg, 'error')
+            raise Exception(error_msg)
+
+    def _collect_missions(self, prompt, missions_data, timeout=None, stream=True, previous_titles=()):
+        """
+        응답 청크가 도착하는 대로 미션을 파싱·검증하여 빈 슬롯에 채운다
+
+        google-generativeai 0.3.2의 generate_content는 요청별 타임아웃 인자를 받지 않으므로
+        응답을 끝까지 읽는 작업을 별도 스레드에서 실행하고 timeout초까지만 기다린다.
+        시간 안에 끝나지 않으면 TimeoutError를 던지며, 늦게 도착한 미션은 반영하지 않는다.
+        이미 채운 미션이나 previous_titles(전날 미션)와 제목이 같은 미션은 건너뛴다.
+        """
+        slot_counts = {tier: count - len(missions_data[tier]) for tier, count in TIER_SLOTS}
+        taken_titles = {mission['title'] for missions in missions_data.values() for mission in missions}
+        taken_titles |= set(previous_titles)
+
+        if not timeout:
+            accepted, rejected = self._read_missions(prompt, stream, slot_counts, taken_titles)
+        else:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mission-model-request')
+            try:
+                future = executor.submit(self._read_missions, prompt, stream, slot_counts, taken_titles)
+                accepted, rejected = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                raise TimeoutError(f"모델 응답이 {timeout}초 안에 끝나지 않았습니다.")
+            finally:
+                # 응답을 기다리는 스레드는 끊을 수 없으므로 기다리지 않고 버린다
+                executor.shutdown(wait=False)
+
+        for tier, mission in rejected:
+            _log(f"유효하지 않은 {tier} 미션을 건너뜁니다: {mission}")
+        for tier, mission in accepted:
+            missions_data[tier].append(mission)
+
+    def _read_missions(self, prompt, stream, slot_counts, taken_titles):
+        """
+        모델 응답을 읽어 (채택한 미션 목록, 건너뛴 미션 목록)을 반환
+
+        slot_counts는 티어별 남은 슬롯 수, taken_titles는 이미 사용한 제목이며 둘 다 이 함수 안에서만 갱신된다.
+        """
+        response = self.model.generate_content(prompt, stream=stream)
+
+        parser = IncrementalMissionParser()
+        accepted = []
+        rejected = []
+
+        for chunk in (response if stream else [response]):
+            try:
+                text = chunk.text
+            except ValueError:
+                # 텍스트가 없는 청크 (종료 사유만 담긴 마지막 청크 등)
+                continue
+
+            for tier, mission in parser.feed(text):
+                if slot_counts.get(tier, 0) <= 0:
+                    continue
+                if not self._validate_mission(tier, mission) or mission['title'] in taken_titles:
+                    rejected.append((tier, mission))
+                    continue
+                accepted.append((tier, mission))
+                slot_counts[tier] -= 1
+                taken_titles.add(mission['title'])
+
+        return accepted, rejected
+
+    def _missing_counts(self, missions_data):
+        return {
+            tier: count - len(missions_data[tier])
+            for tier, count in TIER_SLOTS
+            if len(missions_data[tier]) < count
+        }
+
+    def _build_prompt(self, previous_missions=None):
         previous_missions_text = ""
         if previous_missions:
             previous_missions_text = "\n\n전날 생성된 미션들 (이와 겹치지 않게 해주세요):\n"
@@ -60,161 +199,147 @@ class AIMissionGenerator:
     {{"title": "제목", "description": "설명", "duration": 30, "category": "health"}}
   ]
 }}"""
+        return prompt
 
-        try:
-            try:
-                current_app.logger.info("AI 미션 생성 시작")
-            except RuntimeError:
-                print("AI 미션 생성 시작")
-
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
-
-            try:
-                current_app.logger.info(f"AI 응답 원본: {response_text[:200]}...")
-            except RuntimeError:
-                print(f"AI 응답 원본: {response_text[:200]}...")
-
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                response_text = json_match.group(0)
-            else:
-                raise ValueError("응답에서 JSON을 찾을 수 없습니다.")
+    def _build_repair_prompt(self, missing, missions_data, previous_missions=None):
+        requirements = ''
+        for tier, count in missing.items():
+            low, high = TIER_DURATION_RANGES[tier]
+            requirements += f"- {tier} 미션 {count}개: duration {low}~{high}\n"
 
-            try:
-                current_app.logger.info(f"파싱된 JSON: {response_text[:200]}...")
-            except RuntimeError:
-                print(f"파싱된 JSON: {response_text[:200]}...")
+        excluded = [mission for missions in missions_data.values() for mission in missions]
+        excluded += previous_missions or []
+        excluded_text = ''.join(f"- {mission['title']}\n" for mission in excluded)
 
-            missions_data = json.loads(response_text)
+        example = ', '.join(
+            f'"{tier}": [{{"title": "제목", "description": "설명", "duration": {TIER_DURATION_RANGES[tier][0]}, "category": "physical"}}]'
+            for tier in missing
+        )
 
-            if not self._validate_missions(missions_data):
-                error_msg = f"유효성 검증 실패 - bronze: {len(missions_data.get('bronze', []))}, silver: {len(missions_data.get('silver', []))}, gold: {len(missions_data.get('gold', []))}"
-                raise ValueError(error_msg)
+        return f"""도파민 디톡스를 위한 건강한 활동 미션을 아래 개수만큼만 생성해주세요.
 
-            try:
-                current_app.logger.info("AI 미션 생성 성공")
-            except RuntimeError:
-                print("AI 미션 생성 성공")
+{requirements}
+각 미션:
+- title: 한글로 간결하게 (10자 이내)
+- description: 실제 지시 내용만 담은 문장 (20자 이내, ~하세요 형태)
+- category: physical, mental, health, social, creative 중 하나
 
-            return missions_data
+아래 미션과 겹치지 않게 해주세요:
+{excluded_text}
+아래 JSON 형식으로만 응답해주세요:
+{{{example}}}"""
 
-        except Exception as e:
-            error_msg = f"AI 미션 생성 실패: {str(e)}"
-            try:
-                current_app.logger.error(error_msg)
-            except RuntimeError:
-                print(error_msg)
-            raise Exception(error_msg)
+    def _validate_mission(self, tier, mission):
+        try:
+            low, high = TIER_DURATION_RANGES[tier]
+            return (
+                isinstance(mission['title'], str) and 0 < len(mission['title'].strip()) <= 100
+                and isinstance(mission['description'], str) and mission['description'].strip() != ''
+                and isinstance(mission['duration'], int)
+                and low <= mission['duration'] <= high
+            )
+        except (KeyError, TypeError):
+            return False
 
     def _validate_missions(self, missions_data):
-        try:
-            if len(missions_data.get('bronze', [])) != 5:
+        for tier, count in TIER_SLOTS:
+            missions = missions_data.get(tier, [])
+            if len(missions) != count:
                 return False
-            if len(missions_data.get('silver', [])) != 5:
-                return False
-            if len(missions_data.get('gold', [])) != 3:
+            if not all(self._validate_mission(tier, mission) for mission in missions):
                 return False
+        return True
 
-            for mission in missions_data['bronze']:
-                if not (3 <= mission['duration'] <= 10):
-                    return False
 
-            for mission in missions_data['silver']:
-                if not (10 <= mission['duration'] <= 20):
-                    return False
+def generate_and_save_daily_missions(date=None, generator=None):
+    """
+    지정한 날짜(기본값: 오늘)의 미션을 생성하여 저장
 
-            for mission in missions_data['gold']:
-                if not (20 <= mission['duration'] <= 40):
-                    return False
+    AI 생성이 재시도 후에도 실패하거나 API 키가 없으면 미리 준비된 미션 풀을 사용한다.
 
-            return True
+    Returns:
+        str: 'existing'(이미 있음), 'ai'(AI 생성), 'fallback'(미션 풀 사용), 'failed'(저장 실패)
+    """
+    from database import db
+    from services.daily_mission_cache import daily_mission_cache
+    from services.daily_mission_store import save_daily_missions, load_daily_mission_list
+    from services.fallback_missions import pick_fallback_missions
 
-        except (KeyError, TypeError):
-            return False
+    date = date or datetime.now().date()
 
+    existing_missions = load_daily_mission_list(date)
+    if existing_missions is not None:
+        daily_mission_cache.set(date, existing_missions)
+        _log(f"{date} 미션이 이미 생성되어 있습니다.")
+        return 'existing'
 
-def generate_and_save_daily_missions():
-    from database import db
-    from models.daily_mission import DailyMission
+    previous_missions = load_daily_mission_list(date - timedelta(days=1))
 
-    def log(message, level='info'):
+    api_key = current_app.config.get('GEMINI_API_KEY')
+    if generator is None and api_key:
+        generator = AIMissionGenerator(api_key)
+
+    missions_data = None
+    source = 'ai'
+    if generator is None:
+        _log("GEMINI_API_KEY가 설정되지 않았습니다. 미션 풀을 사용합니다.", 'error')
+    else:
         try:
-            if level == 'error':
-                current_app.logger.error(message)
-            else:
-                current_app.logger.info(message)
-        except RuntimeError:
-            print(message)
+            missions_data = generator.generate_with_retry(
+                previous_missions,
+                max_attempts=current_app.config.get('MISSION_GENERATION_MAX_ATTEMPTS', 3),
+                timeout=current_app.config.get('MISSION_GENERATION_TIMEOUT', 30),
+                backoff_seconds=current_app.config.get('MISSION_GENERATION_BACKOFF_SECONDS', 2)
+            )
+        except Exception as e:
+            _log(f"AI 미션 생성 재시도 실패, 미션 풀을 사용합니다: {str(e)}", 'error')
 
-    api_key = current_app.config.get('GEMINI_API_KEY')
-    if not api_key:
-        log("GEMINI_API_KEY가 설정되지 않았습니다.", 'error')
-        return
-
-    today = datetime.now().date()
-
-    existing_mission = DailyMission.query.filter_by(date=today).first()
-    if existing_mission:
-        log(f"오늘({today}) 미션이 이미 생성되어 있습니다.")
-        return
-
-    yesterday = today - timedelta(days=1)
-    previous_daily_mission = DailyMission.query.filter_by(date=yesterday).first()
-    previous_missions = None
-    if previous_daily_mission:
-        previous_missions = previous_daily_mission.to_mission_list()
-
-    generator = AIMissionGenerator(api_key)
-    missions_data = generator.generate_daily_missions(previous_missions)
-
-    daily_mission = DailyMission(
-        date=today,
-        bronze_1_title=missions_data['bronze'][0]['title'],
-        bronze_1_description=missions_data['bronze'][0]['description'],
-        bronze_1_duration=missions_data['bronze'][0]['duration'],
-        bronze_2_title=missions_data['bronze'][1]['title'],
-        bronze_2_description=missions_data['bronze'][1]['description'],
-        bronze_2_duration=missions_data['bronze'][1]['duration'],
-        bronze_3_title=missions_data['bronze'][2]['title'],
-        bronze_3_description=missions_data['bronze'][2]['description'],
-        bronze_3_duration=missions_data['bronze'][2]['duration'],
-        bronze_4_title=missions_data['bronze'][3]['title'],
-        bronze_4_description=missions_data['bronze'][3]['description'],
-        bronze_4_duration=missions_data['bronze'][3]['duration'],
-        bronze_5_title=missions_data['bronze'][4]['title'],
-        bronze_5_description=missions_data['bronze'][4]['description'],
-        bronze_5_duration=missions_data['bronze'][4]['duration'],
-        silver_1_title=missions_data['silver'][0]['title'],
-        silver_1_description=missions_data['silver'][0]['description'],
-        silver_1_duration=missions_data['silver'][0]['duration'],
-        silver_2_title=missions_data['silver'][1]['title'],
-        silver_2_description=missions_data['silver'][1]['description'],
-        silver_2_duration=missions_data['silver'][1]['duration'],
-        silver_3_title=missions_data['silver'][2]['title'],
-        silver_3_description=missions_data['silver'][2]['description'],
-        silver_3_duration=missions_data['silver'][2]['duration'],
-        silver_4_title=missions_data['silver'][3]['title'],
-        silver_4_description=missions_data['silver'][3]['description'],
-        silver_4_duration=missions_data['silver'][3]['duration'],
-        silver_5_title=missions_data['silver'][4]['title'],
-        silver_5_description=missions_data['silver'][4]['description'],
-        silver_5_duration=missions_data['silver'][4]['duration'],
-        gold_1_title=missions_data['gold'][0]['title'],
-        gold_1_description=missions_data['gold'][0]['description'],
-        gold_1_duration=missions_data['gold'][0]['duration'],
-        gold_2_title=missions_data['gold'][1]['title'],
-        gold_2_description=missions_data['gold'][1]['description'],
-        gold_2_duration=missions_data['gold'][1]['duration'],
-        gold_3_title=missions_data['gold'][2]['title'],
-        gold_3_description=missions_data['gold'][2]['description'],
-        gold_3_duration=missions_data['gold'][2]['duration'],
-    )
+    if missions_data is None:
+        missions_data = pick_fallback_missions(date, previous_missions)
+        source = 'fallback'
 
     try:
-        db.session.add(daily_mission)
+        save_daily_missions(date, missions_data)
         db.session.commit()
-        log(f"오늘({today}) 미션이 성공적으로 생성되었습니다.")
+        daily_mission_cache.set(date, load_daily_mission_list(date))
+        _log(f"{date} 미션이 성공적으로 생성되었습니다. (source={source})")
+        return source
     except Exception as e:
         db.session.rollback()
-        log(f"미션 저장 실패: {str(e)}", 'error')
+        _log(f"미션 저장 실패: {str(e)}", 'error')
+        return 'failed'
+
+
+def generation_time_limit(max_attempts, timeout, backoff_seconds):
+    """
+    generate_with_retry가 한 날짜에 쓸 수 있는 최대 시간(초)
+
+    시도마다 첫 요청과 슬롯 보완 요청이 각각 timeout초까지 걸리고, 시도 사이에 지수 백오프만큼 쉰다.
+    """
+    requests = max_attempts * (1 + MAX_REPAIR_ROUNDS)
+    backoff = sum(backoff_seconds * (2 ** attempt) for attempt in range(max_attempts - 1))
+    return requests * (timeout or 0) + backoff
+
+
+def fill_mission_buffer(start_date=None, days_ahead=0, generator=None, before_each=None):
+    """
+    start_date부터 days_ahead일 뒤까지 비어 있는 날짜의 미션을 순서대로 생성
+
+    날짜 순서대로 생성하므로 각 날짜는 바로 전날 미션과 겹치지 않는다.
+    before_each(date)는 각 날짜를 생성하기 전에 호출된다 (작업 잠금 연장 등).
+
+    Returns:
+        dict: 날짜(ISO 문자열)별 generate_and_save_daily_missions 결과
+    """
+    start_date = start_date or datetime.now().date()
+
+    results = {}
+    for offset in range(days_ahead + 1):
+        date = start_date + timedelta(days=offset)
+        if before_each:
+            before_each(date)
+        results[date.isoformat()] = generate_and_save_daily_missions(date=date, generator=generator)
+        if results[date.isoformat()] == 'failed':
+            # 전날 미션 없이 다음 날짜를 만들면 중복 방지 조건이 깨지므로 중단
+            break
+    return results
@@ -0,0 +1,136 @@
+from datetime import datetime, timezone
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from database import db
+from models.mission import MissionRecord
+from services.completion_index import PRESET_MISSION_COUNT, mark_presets_done
+from services.leaderboard import leaderboard
+from services.medal_tally import add_medals, validate_result
+from services.user_stats import record_mission_results
+from utils.local_time import local_date
+
+MAX_BATCH_SIZE = 100
+RESULT_TYPES = ('complete', 'fail')
+
+
+def parse_completed_at(value):
+    """
+    ISO 8601 완료 시각을 다른 기록과 같은 naive UTC로 변환 (오프셋이 없으면 UTC로 간주)
+
+    Raises:
+        TypeError, ValueError: 형식이 올바르지 않은 경우
+    """
+    completed_at = datetime.fromisoformat(value)
+    if completed_at.tzinfo is not None:
+        completed_at = completed_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return completed_at
+
+
+def validate_batch_item(item):
+    """
+    일괄 전송 항목 하나를 검증
+
+    Returns:
+        str or None: 오류 메시지, 유효하면 None
+    """
+    if not isinstance(item, dict):
+        return '항목은 객체여야 합니다.'
+
+    missing_fields = [field for field in ('client_id', 'type', 'preset_mission_id') if field not in item]
+    if missing_fields:
+        return f'필수 필드가 누락되었습니다: {", ".join(missing_fields)}'
+
+    if item['type'] not in RESULT_TYPES:
+        return 'type은 complete 또는 fail이어야 합니다.'
+
+    preset_mission_id = item['preset_mission_id']
+    if (
+        not isinstance(preset_mission_id, int) or isinstance(preset_mission_id, bool)
+        or not 1 <= preset_mission_id <= PRESET_MISSION_COUNT
+    ):
+        return f'preset_mission_id는 1~{PRESET_MISSION_COUNT} 사이의 프리셋 미션 id여야 합니다.'
+
+    if not isinstance(item['client_id'], str) or not 0 < len(item['client_id']) <= 64:
+        return 'client_id는 64자 이하 문자열이어야 합니다.'
+
+    # 실패 결과는 duration과 관계없이 0으로 저장
+    error = validate_result(item.get('tier'), item.get('duration') if item['type'] == 'complete' else None)
+    if error:
+        return error
+
+    if item.get('completed_at'):
+        try:
+            parse_completed_at(item['completed_at'])
+        except (TypeError, ValueError):
+            return 'completed_at 형식이 올바르지 않습니다.'
+
+    return None
+
+
+def _build_row(user_id, item, guest_id=None):
+    failed = item['type'] == 'fail'
+    return {
+        'user_id': user_id,
+        'preset_mission_id': item['preset_mission_id'],
+        'tier': item.get('tier'),
+        'title': item.get('title'),
+        'description': item.get('description'),
+        # 실패 기록은 단건 /presets/fail과 같이 actual_duration=0, notes='failed'
+        'actual_duration': 0 if failed else item.get('duration'),
+        'notes': 'failed' if failed else item.get('notes'),
+        'completed_at': parse_completed_at(item['completed_at']) if item.get('completed_at') else datetime.utcnow(),
+        'client_id': item['client_id'],
+        'guest_id': None if user_id else guest_id
+    }
+
+
+def _record(user_id, items, guest_id=None):
+    unique_items = {}
+    for item in items:
+        unique_items.setdefault(item['client_id'], item)
+
+    existing_ids = {client_id for (client_id,) in MissionRecord.client_ids_query(unique_items)}
+    new_items = [item for client_id, item in unique_items.items() if client_id not in existing_ids]
+
+    if new_items:
+        rows = [_build_row(user_id, item, guest_id) for item in new_items]
+        db.session.execute(insert(MissionRecord), rows)
+
+        medal_counts = {}
+        for item in new_items:
+            if item['type'] == 'complete' and (item.get('duration') or 0) > 0:
+                medal_counts[item.get('tier')] = medal_counts.get(item.get('tier'), 0) + 1
+
+        # 단건 /presets/complete, /presets/fail과 같이 서버가 결과를 받은 날의 비트맵에 표시
+        mark_presets_done(user_id, [item['preset_mission_id'] for item in new_items], datetime.now().date(), guest_id)
+        add_medals(user_id, medal_counts)
+        record_mission_results(user_id, [(row['completed_at'], row['tier'], row['actual_duration']) for row in rows])
+
+    db.session.commit()
+
+    if new_items:
+        medals_by_date = {}
+        for row in rows:
+            if (row['actual_duration'] or 0) > 0:
+                counts = medals_by_date.setdefault(local_date(row['completed_at']), {})
+                counts[row['tier']] = counts.get(row['tier'], 0) + 1
+        leaderboard.add_medals(user_id, medals_by_date)
+
+    return [item['client_id'] for item in new_items], sorted(existing_ids)
+
+
+def record_batch_results(user_id, items, guest_id=None):
+    """
+    완료/실패 결과 목록을 일괄 INSERT 한 번과 커밋 한 번으로 저장
+
+    이미 저장된 client_id는 건너뛰므로 같은 배치를 다시 보내도 메달이 중복 집계되지 않는다.
+
+    Returns:
+        tuple: (새로 저장한 client_id 목록, 이미 있어 건너뛴 client_id 목록)
+    """
+    try:
+        return _record(user_id, items, guest_id)
+    except IntegrityError:
+        # 같은 배치가 동시에 재전송된 경우, 먼저 저장된 항목을 건너뛰고 한 번 더 시도
+        db.session.rollback()
+        return _record(user_id, items, guest_id)
@@ -0,0 +1,93 @@
+from sqlalchemy.exc import IntegrityError
+from database import db
+from models.daily_completion import DailyPresetCompletion, GuestPresetCompletion
+
+# 비로그인 사용자의 메달/통계를 모아두는 키
+ANONYMOUS_USER_KEY = 0
+PRESET_MISSION_COUNT = 13
+
+
+def preset_bit(preset_mission_id):
+    """프리셋 미션 id(1~13)에 해당하는 비트, 범위를 벗어나면 0"""
+    try:
+        preset_mission_id = int(preset_mission_id)
+    except (TypeError, ValueError):
+        return 0
+
+    if not 1 <= preset_mission_id <= PRESET_MISSION_COUNT:
+        return 0
+    return 1 << (preset_mission_id - 1)
+
+
+def _completion_owner(user_id, guest_id):
+    """
+    비트맵 테이블과 소유자 조건 (로그인 사용자는 user_id, 비로그인은 게스트 id 기준)
+
+    Returns:
+        tuple: (모델, 소유자 컬럼 값 dict), 둘 다 없으면 (None, None)
+    """
+    if user_id:
+        return DailyPresetCompletion, {'user_id': user_id}
+    if guest_id:
+        return GuestPresetCompletion, {'guest_id': guest_id}
+    return None, None
+
+
+def get_completed_mask(user_id, date, guest_id=None):
+    model, owner = _completion_owner(user_id, guest_id)
+    if model is None:
+        return 0
+
+    row = db.session.get(model, (*owner.values(), date))
+    return row.completed_mask if row else 0
+
+
+def mark_preset_done(user_id, preset_mission_id, date, guest_id=None):
+    """
+    완료/실패 처리된 프리셋 미션의 비트를 세팅한다 (커밋은 호출한 쪽에서 수행)
+    """
+    mark_presets_done(user_id, [preset_mission_id], date, guest_id)
+
+
+def mark_presets_done(user_id, preset_mission_ids, date, guest_id=None):
+    """
+    여러 프리셋 미션의 비트를 UPDATE 한 번으로 세팅한다 (커밋은 호출한 쪽에서 수행)
+
+    게스트 id 없는 비로그인 요청은 기기를 구분할 수 없으므로 기록하지 않는다.
+    """
+    mask = 0
+    for preset_mission_id in preset_mission_ids:
+        mask |= preset_bit(preset_mission_id)
+
+    model, owner = _completion_owner(user_id, guest_id)
+    if mask and model is not None:
+        _mark_mask(model, owner, date, mask)
+
+
+def claim_guest_completions(user_id, guest_id):
+    """게스트 비트맵을 사용자 비트맵에 합치고 삭제한다 (커밋은 호출한 쪽에서 수행)"""
+    rows = GuestPresetCompletion.query.filter_by(guest_id=guest_id).all()
+    for row in rows:
+        if row.completed_mask:
+            _mark_mask(DailyPresetCompletion, {'user_id': user_id}, row.date, row.completed_mask)
+    if rows:
+        GuestPresetCompletion.query.filter_by(guest_id=guest_id).delete(synchronize_session=False)
+
+
+def _mark_mask(model, owner, date, mask):
+    if _or_mask(model, owner, date, mask):
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(model(**owner, date=date, completed_mask=mask))
+    except IntegrityError:
+        # 동시 요청이 먼저 행을 만든 경우
+        _or_mask(model, owner, date, mask)
+
+
+def _or_mask(model, owner, date, mask):
+    return model.query.filter_by(date=date, **owner).update(
+        {model.completed_mask: model.completed_mask.op('|')(mask)},
+        synchronize_session=False
+    )
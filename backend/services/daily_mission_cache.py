@@ -0,0 +1,119 @@
+import json
+import threading
+from datetime import datetime
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class DailyMissionCache:
+    """
+    날짜별 오늘의 미션 직렬화 결과 캐시
+
+    프로세스 로컬 딕셔너리를 기본으로 사용하고, MISSION_CACHE_REDIS_URL이
+    설정되어 있으면 여러 워커가 공유하는 Redis를 2차 저장소로 사용한다.
+    미션은 하루에 한 번만 바뀌므로 날짜를 키로 사용한다.
+    """
+
+    KEY_PREFIX = 'dopamine_breaker:daily_missions:'
+    # 자정 이후에도 전날 키가 잠시 남아 있어도 되도록 여유를 둔 TTL
+    REDIS_TTL_SECONDS = 60 * 60 * 48
+
+    def __init__(self):
+        self._local = {}
+        self._lock = threading.Lock()
+        self._redis = None
+
+    def init_app(self, app):
+        redis_url = app.config.get('MISSION_CACHE_REDIS_URL')
+        if not redis_url:
+            return
+
+        if redis is None:
+            app.logger.warning('MISSION_CACHE_REDIS_URL이 설정되었지만 redis 패키지가 없어 로컬 캐시만 사용합니다.')
+            return
+
+        self._redis = redis.Redis.from_url(redis_url)
+
+    def _key(self, date):
+        return f'{self.KEY_PREFIX}{date.isoformat()}'
+
+    def get(self, date):
+        with self._lock:
+            missions = self._local.get(date)
+        if missions is not None:
+            return missions
+
+        if self._redis is None:
+            return None
+
+        try:
+            raw = self._redis.get(self._key(date))
+        except Exception:
+            # 공유 캐시 장애 시 DB 조회로 대체
+            return None
+
+        if raw is None:
+            return None
+
+        missions = json.loads(raw)
+        with self._lock:
+            self._local[date] = missions
+        return missions
+
+    def set(self, date, missions):
+        today = datetime.now().date()
+        with self._lock:
+            self._local[date] = missions
+            # 스케줄러가 없는 웹 워커에서도 지난 날짜가 쌓이지 않도록 정리
+            for stale in [d for d in self._local if d < today]:
+                del self._local[stale]
+
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.set(
+                self._key(date),
+                json.dumps(missions, ensure_ascii=False),
+                ex=self.REDIS_TTL_SECONDS
+            )
+        except Exception:
+            pass
+
+    def rollover(self, today=None):
+        """자정에 호출하여 지난 날짜의 로컬 캐시 항목을 제거 (미리 생성된 날짜는 유지)"""
+        today = today or datetime.now().date()
+        with self._lock:
+            for date in [d for d in self._local if d < today]:
+                del self._local[date]
+
+    def clear(self):
+        with self._lock:
+            self._local.clear()
+
+
+daily_mission_cache = DailyMissionCache()
+
+
+def get_daily_mission_list(date):
+    """
+    해당 날짜의 미션 목록을 캐시에서 조회하고, 없으면 DB에서 읽어 캐시를 채운다
+
+    Returns:
+        list or None: to_mission_list() 결과 또는 미션이 아직 없으면 None
+    """
+    missions = daily_mission_cache.get(date)
+    if missions is not None:
+        return missions
+
+    from services.daily_mission_store import load_daily_mission_list
+
+    missions = load_daily_mission_list(date)
+    if missions is None:
+        return None
+
+    daily_mission_cache.set(date, missions)
+    return missions
@@ -0,0 +1,117 @@
+from sqlalchemy import insert, inspect, text
+from database import db
+from models.daily_mission import DailyMission, DailyMissionItem, TIER_SLOTS
+
+
+def build_mission_items(date, missions_data):
+    """티어별 미션 딕셔너리를 슬롯 번호가 매겨진 daily_mission_items 행 목록으로 변환"""
+    rows = []
+    slot = 1
+    for tier, _ in TIER_SLOTS:
+        for mission in missions_data.get(tier, []):
+            rows.append({
+                'date': date,
+                'slot': slot,
+                'tier': tier,
+                'title': mission['title'],
+                'description': mission['description'],
+                'duration': mission['duration'],
+                'category': mission.get('category') or 'ai_generated'
+            })
+            slot += 1
+    return rows
+
+
+def save_daily_missions(date, missions_data):
+    """
+    하루치 미션을 헤더 행 1개 + 미션 행 일괄 INSERT 1번으로 저장 (커밋은 호출한 쪽에서 수행)
+    """
+    db.session.add(DailyMission(date=date))
+    db.session.flush()
+    db.session.execute(insert(DailyMissionItem), build_mission_items(date, missions_data))
+
+
+def load_daily_mission_list(date):
+    """
+    해당 날짜의 미션 목록을 (date, tier) 인덱스로 조회
+
+    Returns:
+        list or None: to_mission_list() 형식의 목록 또는 미션이 없으면 None
+    """
+    items = DailyMissionItem.query.filter_by(date=date).order_by(DailyMissionItem.slot).all()
+    if not items:
+        return None
+    return [item.to_dict() for item in items]
+
+
+def _wide_columns():
+    columns = []
+    for tier, count in TIER_SLOTS:
+        for index in range(1, count + 1):
+            for field in ('title', 'description', 'duration'):
+                columns.append(f'{tier}_{index}_{field}')
+    return columns
+
+
+def migrate_wide_daily_missions(log=print):
+    """
+    기존 39개 컬럼 형태의 daily_missions 행을 daily_mission_items로 복사한 뒤
+    더 이상 쓰지 않는 컬럼을 제거한다
+
+    이전 실행이 중단되어 일부 컬럼만 남아 있으면 남은 컬럼의 슬롯만 복사하며,
+    슬롯 번호(= 프리셋 미션 id)는 원래 위치를 유지한다.
+    """
+    existing_columns = {column['name'] for column in inspect(db.engine).get_columns('daily_missions')}
+    wide_columns = [column for column in _wide_columns() if column in existing_columns]
+    if not wide_columns:
+        log('daily_missions에 변환할 기존 컬럼이 없습니다.')
+        return
+
+    migrated_dates = {row.date for row in db.session.query(DailyMissionItem.date).distinct()}
+    rows = db.session.execute(
+        # SQLite도 date를 문자열이 아닌 date 객체로 받도록 타입 지정
+        text(f'SELECT date, {", ".join(wide_columns)} FROM daily_missions').columns(date=db.Date)
+    ).mappings().all()
+
+    slots = []
+    slot = 1
+    for tier, count in TIER_SLOTS:
+        for index in range(1, count + 1):
+            fields = [f'{tier}_{index}_{field}' for field in ('title', 'description', 'duration')]
+            if all(field in existing_columns for field in fields):
+                slots.append((slot, tier, fields))
+            slot += 1
+
+    items = []
+    for row in rows:
+        if row['date'] in migrated_dates:
+            continue
+
+        for slot, tier, (title, description, duration) in slots:
+            if row[title] is None:
+                continue
+            items.append({
+                'date': row['date'],
+                'slot': slot,
+                'tier': tier,
+                'title': row[title],
+                'description': row[description],
+                'duration': row[duration],
+                'category': 'ai_generated'
+            })
+
+    if items:
+        db.session.execute(insert(DailyMissionItem), items)
+    db.session.commit()
+    log(f'daily_mission_items로 {len(items)}개 미션을 복사했습니다.')
+
+    if db.engine.dialect.name == 'mysql':
+        # 컬럼마다 ALTER하면 테이블을 컬럼 수만큼 다시 만들므로 한 문장으로 제거
+        drops = ', '.join(f'DROP COLUMN {column}' for column in wide_columns)
+        db.session.execute(text(f'ALTER TABLE daily_missions {drops}'))
+    else:
+        # SQLite는 ALTER TABLE 한 문장에 변경 하나만 허용
+        for column in wide_columns:
+            db.session.execute(text(f'ALTER TABLE daily_missions DROP COLUMN {column}'))
+    db.session.commit()
+    log(f'daily_missions에서 {len(wide_columns)}개 컬럼을 제거했습니다.')
@@ -0,0 +1,55 @@
+from models.daily_mission import TIER_SLOTS
+
+# AI 미션 생성 실패 시 사용하는 미리 준비된 미션 풀
+FALLBACK_MISSION_POOL = {
+    'bronze': [
+        {'title': '물 한 잔 마시기', 'description': '물 한 잔을 천천히 마시세요', 'duration': 3, 'category': 'health'},
+        {'title': '목 스트레칭', 'description': '목을 좌우로 천천히 돌리세요', 'duration': 3, 'category': 'physical'},
+        {'title': '심호흡 10회', 'description': '4초 들이쉬고 4초 내쉬세요', 'duration': 5, 'category': 'mental'},
+        {'title': '책상 정리', 'description': '책상 위 물건을 제자리에 두세요', 'duration': 5, 'category': 'health'},
+        {'title': '창밖 보기', 'description': '먼 곳을 5분간 바라보세요', 'duration': 5, 'category': 'mental'},
+        {'title': '감사 한 줄', 'description': '감사한 일 하나를 적으세요', 'duration': 5, 'category': 'creative'},
+        {'title': '어깨 풀기', 'description': '어깨를 앞뒤로 10회 돌리세요', 'duration': 7, 'category': 'physical'},
+        {'title': '안부 문자', 'description': '가족에게 안부 문자를 보내세요', 'duration': 7, 'category': 'social'},
+        {'title': '할 일 적기', 'description': '오늘 할 일 3개를 적으세요', 'duration': 10, 'category': 'mental'},
+    ],
+    'silver': [
+        {'title': '동네 산책', 'description': '집 주변을 걸으세요', 'duration': 15, 'category': 'physical'},
+        {'title': '전신 스트레칭', 'description': '전신 스트레칭을 수행하세요', 'duration': 10, 'category': 'physical'},
+        {'title': '명상하기', 'description': '눈을 감고 호흡에 집중하세요', 'duration': 10, 'category': 'mental'},
+        {'title': '일기 쓰기', 'description': '오늘 있었던 일을 적으세요', 'duration': 15, 'category': 'creative'},
+        {'title': '방 청소', 'description': '방 바닥을 청소하세요', 'duration': 15, 'category': 'health'},
+        {'title': '전화 통화', 'description': '친구와 전화로 대화하세요', 'duration': 15, 'category': 'social'},
+        {'title': '그림 그리기', 'description': '보이는 사물 하나를 그리세요', 'duration': 20, 'category': 'creative'},
+        {'title': '계단 오르기', 'description': '계단을 천천히 오르내리세요', 'duration': 10, 'category': 'physical'},
+    ],
+    'gold': [
+        {'title': '독서하기', 'description': '종이책을 읽으세요', 'duration': 30, 'category': 'mental'},
+        {'title': '빠르게 걷기', 'description': '빠른 걸음으로 걸으세요', 'duration': 30, 'category': 'physical'},
+        {'title': '요리하기', 'description': '간단한 음식을 직접 만드세요', 'duration': 40, 'category': 'health'},
+        {'title': '악기 연습', 'description': '악기를 연습하세요', 'duration': 25, 'category': 'creative'},
+        {'title': '홈트레이닝', 'description': '맨몸 운동을 수행하세요', 'duration': 20, 'category': 'physical'},
+    ],
+}
+
+
+def pick_fallback_missions(date, previous_missions=None):
+    """
+    미션 풀에서 날짜별로 순환하며 티어별 미션을 선택 (전날 미션과 겹치는 제목은 뒤로 미룸)
+
+    Returns:
+        dict: generate_daily_missions와 같은 {'bronze': [...], 'silver': [...], 'gold': [...]} 형식
+    """
+    previous_titles = {mission['title'] for mission in previous_missions or []}
+    offset = date.toordinal()
+
+    missions_data = {}
+    for tier, count in TIER_SLOTS:
+        pool = FALLBACK_MISSION_POOL[tier]
+        start = offset % len(pool)
+        rotated = pool[start:] + pool[:start]
+        fresh = [mission for mission in rotated if mission['title'] not in previous_titles]
+        repeated = [mission for mission in rotated if mission['title'] in previous_titles]
+        missions_data[tier] = [dict(mission) for mission in (fresh + repeated)[:count]]
+
+    return missions_data
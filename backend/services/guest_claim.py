@@ -0,0 +1,86 @@
+from database import db
+from models.mission import MissionRecord
+from services.completion_index import claim_guest_completions
+from services.leaderboard import leaderboard
+from services.medal_tally import MEDAL_TIERS, add_medals
+from services.user_stats import record_mission_results, subtract_mission_results
+from utils.local_time import local_date
+
+CLAIM_CHUNK_SIZE = 1000
+
+
+def _lock_unclaimed_rows(record_ids):
+    """아직 옮겨지지 않은 게스트 기록을 FOR UPDATE로 잠가 조회 (동시 로그인은 커밋까지 대기)"""
+    return db.session.query(
+        MissionRecord.id,
+        MissionRecord.tier,
+        MissionRecord.completed_at,
+        MissionRecord.actual_duration
+    ).filter(
+        MissionRecord.id.in_(record_ids),
+        MissionRecord.user_id.is_(None)
+    ).with_for_update().all()
+
+
+def claim_guest_records(user_id, guest_id):
+    """
+    게스트 id로 저장된 비로그인 기록을 로그인한 사용자에게 일괄로 옮긴다
+
+    기록은 청크마다 FOR UPDATE로 잠근 뒤 id 목록 기준 UPDATE로 옮기고(조회 후 새로 들어온 기록은 다음 로그인 때 옮김),
+    메달/통계 집계는 실제로 옮긴 행만큼 비로그인 버킷에서 빼서 사용자 쪽에 더하고,
+    게스트 완료 비트맵은 사용자 비트맵에 합친다. 행 잠금이 없는 DB에서 같은 게스트 id로 동시에 로그인해
+    UPDATE된 행 수가 잠근 행 수와 다르면 다른 요청이 먼저 옮긴 것이므로 전부 되돌리고 0을 반환한다.
+
+    Returns:
+        int: 옮긴 기록 수
+    """
+    if not user_id or not guest_id:
+        return 0
+
+    record_ids = [
+        record_id for (record_id,) in db.session.query(MissionRecord.id).filter(
+            MissionRecord.user_id.is_(None),
+            MissionRecord.guest_id == guest_id
+        ).order_by(MissionRecord.id)
+    ]
+    if not record_ids:
+        return 0
+
+    rows = []
+    for start in range(0, len(record_ids), CLAIM_CHUNK_SIZE):
+        locked = _lock_unclaimed_rows(record_ids[start:start + CLAIM_CHUNK_SIZE])
+        if not locked:
+            continue
+
+        updated = MissionRecord.query.filter(
+            MissionRecord.id.in_([row.id for row in locked]),
+            MissionRecord.user_id.is_(None)
+        ).update({MissionRecord.user_id: user_id, MissionRecord.guest_id: None}, synchronize_session=False)
+        if updated != len(locked):
+            db.session.rollback()
+            return 0
+        rows += locked
+
+    if not rows:
+        db.session.rollback()
+        return 0
+
+    results = [(row.completed_at, row.tier, row.actual_duration) for row in rows if row.completed_at]
+    medal_counts = {}
+    medals_by_date = {}
+    for row in rows:
+        if row.tier in MEDAL_TIERS and (row.actual_duration or 0) > 0:
+            medal_counts[row.tier] = medal_counts.get(row.tier, 0) + 1
+            if row.completed_at:
+                counts = medals_by_date.setdefault(local_date(row.completed_at), {})
+                counts[row.tier] = counts.get(row.tier, 0) + 1
+
+    add_medals(None, {tier: -count for tier, count in medal_counts.items()})
+    add_medals(user_id, medal_counts)
+    subtract_mission_results(None, results)
+    record_mission_results(user_id, results)
+    claim_guest_completions(user_id, guest_id)
+
+    db.session.commit()
+    leaderboard.add_medals(user_id, medals_by_date)
+    return len(rows)
@@ -0,0 +1,77 @@
+import os
+import socket
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from database import db
+from models.job_lock import JobLock
+
+
+def acquire_lock(name, ttl_seconds):
+    """
+    이름이 name인 잠금을 ttl_seconds 동안 획득
+
+    이미 다른 프로세스가 잡고 있으면 None을 반환하고, 만료된 잠금은 가져온다.
+
+    Returns:
+        str or None: 해제 시 사용할 소유자 토큰
+    """
+    now = datetime.utcnow()
+    owner = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+    locked_until = now + timedelta(seconds=ttl_seconds)
+
+    try:
+        db.session.add(JobLock(name=name, owner=owner, locked_until=locked_until))
+        db.session.commit()
+        return owner
+    except IntegrityError:
+        db.session.rollback()
+
+    updated = JobLock.query.filter(
+        JobLock.name == name,
+        JobLock.locked_until < now
+    ).update({'owner': owner, 'locked_until': locked_until}, synchronize_session=False)
+    db.session.commit()
+    return owner if updated else None
+
+
+def renew_lock(name, owner, ttl_seconds):
+    """
+    소유한 잠금의 만료 시각을 지금부터 ttl_seconds 뒤로 연장
+
+    Returns:
+        bool: 연장했으면 True, 만료되어 다른 프로세스가 가져갔으면 False
+    """
+    updated = JobLock.query.filter_by(name=name, owner=owner).update(
+        {'locked_until': datetime.utcnow() + timedelta(seconds=ttl_seconds)},
+        synchronize_session=False
+    )
+    db.session.commit()
+    return bool(updated)
+
+
+def release_lock(name, owner):
+    JobLock.query.filter_by(name=name, owner=owner).delete(synchronize_session=False)
+    db.session.commit()
+
+
+@contextmanager
+def job_lock(name, ttl_seconds):
+    """
+    잠금을 획득한 경우에만 소유자 토큰(획득하지 못하면 None)을 넘겨주고, 블록이 끝나면 해제하는 컨텍스트 매니저
+
+    오래 걸리는 작업은 받은 토큰으로 renew_lock을 호출해 만료 전에 잠금을 연장한다.
+
+    Usage:
+        with job_lock('daily_mission_generation', 900) as owner:
+            if owner:
+                ...
+    """
+    owner = acquire_lock(name, ttl_seconds)
+    try:
+        yield owner
+    finally:
+        if owner is not None:
+            db.session.rollback()
+            release_lock(name, owner)
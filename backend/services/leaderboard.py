@@ -0,0 +1,281 @@
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import func, inspect
+from sortedcontainers import SortedList
+from database import db
+from models.medal_tally import UserMedalTally
+from models.user_stats import UserDailyStats
+from services.completion_index import ANONYMOUS_USER_KEY
+from services.medal_tally import MEDAL_TIERS
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# 티어별 메달 점수
+MEDAL_POINTS = {'bronze': 1, 'silver': 3, 'gold': 5}
+PERIODS = ('weekly', 'all')
+
+
+def medal_points(counts):
+    return sum(MEDAL_POINTS[tier] * (counts.get(tier) or 0) for tier in MEDAL_TIERS)
+
+
+def week_start(date):
+    """통계 일자와 같은 서버 로컬 날짜 기준 주의 월요일"""
+    return date - timedelta(days=date.weekday())
+
+
+class LocalSortedSet:
+    """
+    프로세스 로컬 정렬 집합 (Redis sorted set과 같은 인터페이스)
+
+    (-점수, user_id)를 SortedList에 담으므로 점수 갱신과 순위 조회는 O(log n),
+    상위 K명 조회는 O(K log n)이다. 동점이면 user_id가 작은 쪽이 앞선다.
+    """
+
+    def __init__(self):
+        self._scores = {}
+        self._order = SortedList()
+
+    def incr(self, member, amount):
+        old = self._scores.get(member)
+        if old is not None:
+            self._order.remove((-old, member))
+        score = (old or 0) + amount
+        self._scores[member] = score
+        self._order.add((-score, member))
+
+    def replace(self, scores):
+        self._scores = dict(scores)
+        self._order = SortedList((-score, member) for member, score in self._scores.items())
+
+    def top(self, limit):
+        return [(member, -score) for score, member in self._order[:limit]]
+
+    def rank(self, member):
+        """0부터 시작하는 순위, 점수가 없으면 None"""
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        return self._order.bisect_left((-score, member))
+
+    def score(self, member):
+        return self._scores.get(member)
+
+
+class RedisSortedSet:
+    """여러 워커가 공유하는 Redis sorted set (ZINCRBY/ZREVRANK는 O(log n))"""
+
+    def __init__(self, client, key, ttl=None):
+        self._client = client
+        self._key = key
+        self._ttl = ttl
+
+    def exists(self):
+        return bool(self._client.exists(self._key))
+
+    def incr(self, member, amount):
+        pipe = self._client.pipeline()
+        pipe.zincrby(self._key, amount, member)
+        if self._ttl:
+            pipe.expire(self._key, self._ttl)
+        pipe.execute()
+
+    def replace(self, scores):
+        pipe = self._client.pipeline()
+        pipe.delete(self._key)
+        if scores:
+            pipe.zadd(self._key, scores)
+        if self._ttl:
+            pipe.expire(self._key, self._ttl)
+        pipe.execute()
+
+    def top(self, limit):
+        if limit <= 0:
+            return []
+        return [
+            (int(member), int(score))
+            for member, score in self._client.zrevrange(self._key, 0, limit - 1, withscores=True)
+        ]
+
+    def rank(self, member):
+        return self._client.zrevrank(self._key, member)
+
+    def score(self, member):
+        score = self._client.zscore(self._key, member)
+        return None if score is None else int(score)
+
+
+class Leaderboard:
+    """
+    메달 점수 기준 주간/전체 리더보드
+
+    LEADERBOARD_REDIS_URL(없으면 MISSION_CACHE_REDIS_URL)이 설정되어 있으면
+    Redis sorted set을 공유 저장소로 사용하고, 없으면 프로세스 로컬 정렬 집합을 사용한다.
+    로컬 저장소는 다른 워커의 완료 기록을 반영하지 못하므로 여러 워커를 띄울 때는 Redis를 사용한다.
+    앱 시작 시(load)와 주가 바뀔 때 user_medal_tallies, user_daily_stats에서 다시 채운다.
+    비로그인 버킷은 순위에서 제외한다.
+    """
+
+    KEY_PREFIX = 'dopamine_breaker:leaderboard:'
+    # 지난 주 리더보드는 다음 주가 끝나면 만료
+    WEEKLY_TTL_SECONDS = 60 * 60 * 24 * 14
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._redis = None
+        self._boards = {}
+        self._loaded_week = None
+        self._logger = None
+
+    def init_app(self, app):
+        self._logger = app.logger
+        redis_url = app.config.get('LEADERBOARD_REDIS_URL') or app.config.get('MISSION_CACHE_REDIS_URL')
+        if not redis_url:
+            return
+
+        if redis is None:
+            app.logger.warning('리더보드 Redis URL이 설정되었지만 redis 패키지가 없어 로컬 리더보드를 사용합니다.')
+            return
+
+        self._redis = redis.Redis.from_url(redis_url)
+
+    def _board(self, period, week):
+        key = 'all' if period == 'all' else f'weekly:{week.isoformat()}'
+        board = self._boards.get(key)
+        if board is None:
+            if self._redis is not None:
+                ttl = None if period == 'all' else self.WEEKLY_TTL_SECONDS
+                board = RedisSortedSet(self._redis, self.KEY_PREFIX + key, ttl)
+            else:
+                board = LocalSortedSet()
+            # 지난 주 로컬 보드는 버린다
+            self._boards = {k: v for k, v in self._boards.items() if k == 'all' or k == key}
+            self._boards[key] = board
+        return board
+
+    def _current_week(self):
+        return week_start(datetime.now().date())
+
+    def _ensure_loaded(self):
+        """
+        Returns:
+            tuple: (현재 주 시작일, 이번 호출에서 DB 집계로 다시 채웠는지 여부)
+        """
+        week = self._current_week()
+        if self._loaded_week == week:
+            return week, False
+
+        rebuilt = False
+        with self._lock:
+            if self._loaded_week != week:
+                boards = [self._board(period, week) for period in PERIODS]
+                # 공유 저장소가 이미 채워져 있으면 다른 워커가 만든 점수를 그대로 사용
+                if not all(isinstance(board, RedisSortedSet) and board.exists() for board in boards):
+                    self._rebuild(week)
+                    rebuilt = True
+                self._loaded_week = week
+        return week, rebuilt
+
+    def load(self):
+        """
+        앱 시작 시 리더보드를 미리 채운다 (첫 완료 요청에서 재구성하지 않도록)
+
+        마이그레이션 전이라 집계 테이블이 아직 없거나 실패하면 첫 조회 때 다시 시도한다.
+        """
+        try:
+            if not inspect(db.engine).has_table(UserMedalTally.__tablename__):
+                return
+            self._ensure_loaded()
+        except Exception as e:
+            db.session.rollback()
+            if self._logger:
+                self._logger.warning(f'리더보드를 미리 채우지 못했습니다: {str(e)}')
+
+    def _rebuild(self, week):
+        all_time = {}
+        for tally in UserMedalTally.query.filter(UserMedalTally.user_id != ANONYMOUS_USER_KEY):
+            points = medal_points({tier: getattr(tally, tier) for tier in MEDAL_TIERS})
+            if points:
+                all_time[tally.user_id] = points
+
+        weekly = {}
+        rows = db.session.query(
+            UserDailyStats.user_id,
+            *[func.sum(getattr(UserDailyStats, tier)) for tier in MEDAL_TIERS]
+        ).filter(
+            UserDailyStats.user_id != ANONYMOUS_USER_KEY,
+            UserDailyStats.date >= week
+        ).group_by(UserDailyStats.user_id)
+        for user_id, *counts in rows:
+            points = medal_points(dict(zip(MEDAL_TIERS, (int(count or 0) for count in counts))))
+            if points:
+                weekly[user_id] = points
+
+        self._board('all', week).replace(all_time)
+        self._board('weekly', week).replace(weekly)
+
+    def rebuild(self):
+        """DB의 집계 테이블로 현재 주와 전체 리더보드를 다시 채운다"""
+        with self._lock:
+            week = self._current_week()
+            self._rebuild(week)
+            self._loaded_week = week
+
+    def add_medals(self, user_id, counts_by_date):
+        """
+        커밋된 완료 기록의 메달 점수를 더한다
+
+        Args:
+            user_id: 사용자 id (None이면 무시)
+            counts_by_date: {완료 일자(서버 로컬 날짜, local_date): {tier: 개수}}
+        """
+        if not user_id:
+            return
+
+        try:
+            week, rebuilt = self._ensure_loaded()
+            if rebuilt:
+                # 방금 커밋된 메달이 포함된 집계 테이블로 다시 채웠으므로 더하면 두 번 반영된다
+                return
+
+            total = 0
+            weekly = 0
+            for date, counts in counts_by_date.items():
+                points = medal_points(counts)
+                total += points
+                if week_start(date) == week:
+                    weekly += points
+
+            with self._lock:
+                if total:
+                    self._board('all', week).incr(user_id, total)
+                if weekly:
+                    self._board('weekly', week).incr(user_id, weekly)
+        except Exception as e:
+            # 순위 반영 실패가 완료 기록 저장을 실패시키지 않도록 한다 (다음 재구성 때 복구)
+            if self._logger:
+                self._logger.warning(f'리더보드 갱신 실패: {str(e)}')
+
+    def top(self, period, limit):
+        week, _ = self._ensure_loaded()
+        with self._lock:
+            return self._board(period, week).top(limit)
+
+    def rank(self, period, user_id):
+        """
+        Returns:
+            dict or None: {'rank': 1부터 시작하는 순위, 'score': 점수}, 점수가 없으면 None
+        """
+        week, _ = self._ensure_loaded()
+        with self._lock:
+            board = self._board(period, week)
+            rank = board.rank(user_id)
+            if rank is None:
+                return None
+            return {'rank': rank + 1, 'score': board.score(user_id)}
+
+
+leaderboard = Leaderboard()
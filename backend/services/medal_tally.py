@@ -0,0 +1,131 @@
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from database import db
+from models.mission import MissionRecord
+from models.medal_tally import UserMedalTally
+from services.completion_index import ANONYMOUS_USER_KEY
+
+MEDAL_TIERS = ('bronze', 'silver', 'gold')
+# 티어별 미션 수행 시간(분) 범위
+TIER_DURATION_RANGES = {'bronze': (3, 10), 'silver': (10, 20), 'gold': (20, 40)}
+
+
+def validate_result(tier, duration):
+    """
+    완료/실패 결과의 tier와 duration(분)을 검증
+
+    duration > 0이면 메달이 집계되므로 메달 티어와 해당 티어의 수행 시간 범위를 요구한다.
+
+    Returns:
+        str or None: 오류 메시지, 유효하면 None
+    """
+    if tier is not None and tier not in MEDAL_TIERS:
+        return f'tier는 {", ".join(MEDAL_TIERS)} 중 하나여야 합니다.'
+    if duration is None:
+        return None
+    if not isinstance(duration, int) or isinstance(duration, bool) or duration < 0:
+        return 'duration은 0 이상의 정수여야 합니다.'
+    if duration > 0:
+        if tier is None:
+            return '완료한 미션에는 tier가 필요합니다.'
+        low, high = TIER_DURATION_RANGES[tier]
+        if not low <= duration <= high:
+            return f'{tier} 미션의 duration은 {low}~{high}분이어야 합니다.'
+    return None
+
+
+def increment_medal(user_id, tier):
+    """
+    완료한 미션의 티어 메달 개수를 1 증가시킨다 (커밋은 호출한 쪽에서 수행)
+    """
+    add_medals(user_id, {tier: 1})
+
+
+def add_medals(user_id, counts):
+    """티어별 메달 개수를 UPDATE 한 번으로 더한다 (커밋은 호출한 쪽에서 수행)"""
+    counts = {tier: count for tier, count in counts.items() if tier in MEDAL_TIERS and count}
+    if not counts:
+        return
+
+    key = user_id or ANONYMOUS_USER_KEY
+    if _increment(key, counts):
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(UserMedalTally(user_id=key, **{t: counts.get(t, 0) for t in MEDAL_TIERS}))
+    except IntegrityError:
+        # 동시 요청이 먼저 행을 만든 경우
+        _increment(key, counts)
+
+
+def _increment(key, counts):
+    values = {getattr(UserMedalTally, tier): getattr(UserMedalTally, tier) + count for tier, count in counts.items()}
+    return UserMedalTally.query.filter_by(user_id=key).update(values, synchronize_session=False)
+
+
+def get_medals(user_id, guest_id=None):
+    """
+    로그인 사용자는 본인 집계 행(로그인 시 옮겨진 게스트 기록 포함), 게스트는 해당 게스트 id의 기록,
+    둘 다 없으면 비로그인 버킷의 메달 개수
+    """
+    medals = {tier: 0 for tier in MEDAL_TIERS}
+
+    if not user_id and guest_id:
+        for _, tier, count in count_medals_by_tier(
+            MissionRecord.user_id.is_(None),
+            MissionRecord.guest_id == guest_id
+        ):
+            medals[tier] = count
+        return medals
+
+    tally = db.session.get(UserMedalTally, user_id or ANONYMOUS_USER_KEY)
+    if tally:
+        for tier in MEDAL_TIERS:
+            medals[tier] = getattr(tally, tier)
+    return medals
+
+
+def medal_count_query(*criteria):
+    """mission_records에서 GROUP BY로 (user_id, tier)별 메달 개수를 집계하는 쿼리"""
+    return db.session.query(
+        MissionRecord.user_id,
+        MissionRecord.tier,
+        func.count(MissionRecord.id)
+    ).filter(
+        MissionRecord.tier.in_(MEDAL_TIERS),
+        MissionRecord.actual_duration > 0,
+        *criteria
+    ).group_by(MissionRecord.user_id, MissionRecord.tier)
+
+
+def count_medals_by_tier(*criteria):
+    return medal_count_query(*criteria).all()
+
+
+def rebuild_medal_tallies(batch_size=1000, log=print):
+    """
+    mission_records로부터 user_medal_tallies를 사용자 id 구간 단위로 재계산한다
+    """
+    batches = [(ANONYMOUS_USER_KEY, ANONYMOUS_USER_KEY, [MissionRecord.user_id.is_(None)])]
+
+    max_user_id = db.session.query(func.max(MissionRecord.user_id)).scalar() or 0
+    for start in range(1, max_user_id + 1, batch_size):
+        end = start + batch_size - 1
+        batches.append((start, end, [MissionRecord.user_id.between(start, end)]))
+
+    for start, end, criteria in batches:
+        tallies = {}
+        for user_id, tier, count in count_medals_by_tier(*criteria):
+            key = user_id or ANONYMOUS_USER_KEY
+            tallies.setdefault(key, {t: 0 for t in MEDAL_TIERS})[tier] = count
+
+        UserMedalTally.query.filter(
+            UserMedalTally.user_id.between(start, end)
+        ).delete(synchronize_session=False)
+        db.session.bulk_insert_mappings(
+            UserMedalTally,
+            [{'user_id': key, **counts} for key, counts in tallies.items()]
+        )
+        db.session.commit()
+        log(f'메달 집계 재계산: user_id {start}~{end}, {len(tallies)}명')
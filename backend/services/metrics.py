@@ -0,0 +1,175 @@
+import threading
+import time
+from flask import g, request, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + list(extra or [])
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in items) + '}'
+
+
+class Counter:
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(labels)} {value}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['buckets'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series['buckets']):
+                    lines.append(f'{self.name}_bucket{_format_labels(labels, [("le", bound)])} {count}')
+                lines.append(f'{self.name}_bucket{_format_labels(labels, [("le", "+Inf")])} {series["count"]}')
+                lines.append(f'{self.name}_sum{_format_labels(labels)} {series["sum"]}')
+                lines.append(f'{self.name}_count{_format_labels(labels)} {series["count"]}')
+        return lines
+
+
+request_duration = Histogram(
+    'http_request_duration_seconds', '엔드포인트별 요청 처리 시간'
+)
+request_db_queries = Histogram(
+    'http_request_db_queries', '요청 하나가 실행한 SQL 쿼리 수', buckets=QUERY_COUNT_BUCKETS
+)
+db_query_duration = Histogram(
+    'db_query_duration_seconds', 'SQL 쿼리 실행 시간'
+)
+slow_queries = Counter(
+    'db_slow_queries_total', 'SLOW_QUERY_THRESHOLD_MS를 넘은 SQL 쿼리 수'
+)
+job_duration = Histogram(
+    'job_duration_seconds', '스케줄러/백그라운드 작업 실행 시간'
+)
+rate_limited_requests = Counter(
+    'rate_limited_requests_total', '요청 한도를 넘어 429로 거절한 요청 수'
+)
+
+ALL_METRICS = (request_duration, request_db_queries, db_query_duration, slow_queries, job_duration, rate_limited_requests)
+
+_engine_events_registered = False
+
+
+def init_metrics(app):
+    """
+    요청 처리 시간, 요청당 SQL 쿼리 수, 느린 쿼리 로그를 수집하도록 훅을 등록
+
+    지표는 프로세스별로 집계되므로 여러 워커를 띄우면 워커마다 /metrics를 수집한다.
+    """
+    global _engine_events_registered
+
+    slow_query_seconds = app.config['SLOW_QUERY_THRESHOLD_MS'] / 1000
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started_at = time.perf_counter()
+        g.db_query_count = 0
+
+    @app.after_request
+    def record_request_metrics(response):
+        started_at = g.pop('request_started_at', None)
+        if started_at is None:
+            return response
+
+        endpoint = request.endpoint or 'unmatched'
+        query_count = g.pop('db_query_count', 0)
+        request_duration.observe(
+            time.perf_counter() - started_at,
+            endpoint=endpoint,
+            method=request.method,
+            status=response.status_code
+        )
+        request_db_queries.observe(query_count, endpoint=endpoint)
+        response.headers['X-DB-Query-Count'] = str(query_count)
+        return response
+
+    if _engine_events_registered:
+        return
+    _engine_events_registered = True
+
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started_at', []).append(time.perf_counter())
+
+    @event.listens_for(Engine, 'after_cursor_execute')
+    def record_query_metrics(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_started_at'].pop()
+        db_query_duration.observe(elapsed)
+
+        if has_request_context():
+            g.db_query_count = g.get('db_query_count', 0) + 1
+
+        if elapsed >= slow_query_seconds:
+            slow_queries.inc()
+            app.logger.warning(f'느린 쿼리 ({elapsed * 1000:.1f}ms): {statement[:500]}')
+
+
+def observe_job(job, started_at, status='succeeded'):
+    job_duration.observe(time.perf_counter() - started_at, job=job, status=status)
+
+
+def pool_metric_lines(status):
+    """utils.db_pool.pool_status 결과를 게이지 지표로 변환"""
+    lines = []
+    for key in ('size', 'checked_out', 'checked_in', 'overflow'):
+        if key in status:
+            lines.append(f'# TYPE db_pool_{key} gauge')
+            lines.append(f'db_pool_{key} {status[key]}')
+
+    wait = status['checkout_wait']
+    lines.append('# TYPE db_pool_checkout_wait_seconds summary')
+    lines.append(f'db_pool_checkout_wait_seconds_sum {wait["total_wait_seconds"]}')
+    lines.append(f'db_pool_checkout_wait_seconds_count {wait["checkouts"]}')
+    lines.append('# TYPE db_pool_checkout_wait_seconds_max gauge')
+    lines.append(f'db_pool_checkout_wait_seconds_max {wait["max_wait_seconds"]}')
+    return lines
+
+
+def render_metrics(extra_lines=None):
+    """Prometheus 텍스트 형식으로 모든 지표를 출력"""
+    lines = []
+    for metric in ALL_METRICS:
+        lines.extend(metric.render())
+    lines.extend(extra_lines or [])
+    return '\n'.join(lines) + '\n'
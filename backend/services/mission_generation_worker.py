@@ -0,0 +1,175 @@
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from database import db
+from models.mission_generation_job import MissionGenerationJob
+
+
+class MissionGenerationWorker:
+    """
+    오늘의 미션 생성을 요청 스레드 밖의 백그라운드 스레드에서 실행하는 작업자
+
+    작업 상태는 mission_generation_jobs 테이블에 저장하므로 작업을 등록한 워커가 아니어도 조회할 수 있다.
+    같은 날짜의 작업이 대기 중이거나 실행 중이면 새 작업을 만들지 않고 기존 작업을 반환한다.
+    실행 중인 작업은 날짜마다 생성 잠금을 연장하고 heartbeat_at을 기록한다.
+    """
+
+    LOCK_NAME = 'daily_mission_generation'
+    ACTIVE_STATUSES = ('queued', 'running')
+    # 끝난 작업 기록 보관 기간
+    JOB_RETENTION_DAYS = 7
+
+    def __init__(self):
+        self._app = None
+        self._executor = None
+
+    def init_app(self, app):
+        self._app = app
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mission-generation')
+
+    def submit(self, date=None, generator=None, days_ahead=0):
+        """
+        미션 생성 작업을 등록
+
+        Args:
+            date: 생성 시작 날짜 (기본값: 오늘)
+            generator: AIMissionGenerator 대체 객체
+            days_ahead (int): 시작 날짜 이후 미리 생성해 둘 일수
+
+        Returns:
+            dict: 작업 상태 (기존 작업을 돌려준 경우 collapsed=True)
+        """
+        date = date or datetime.now().date()
+
+        # 요청/스케줄러 스레드 어디서 호출해도 요청 세션과 섞이지 않도록 별도 앱 컨텍스트에서 처리
+        with self._app.app_context():
+            job, created = self._create_or_get_active(date, days_ahead)
+
+        if not created:
+            return dict(job, collapsed=True)
+        self._executor.submit(self._run, job['id'], date, generator, days_ahead)
+        return job
+
+    def _create_or_get_active(self, date, days_ahead):
+        """
+        date의 진행 중인 작업을 돌려주거나 새 작업을 만든다
+
+        진행 중인 작업은 active_date 유니크 키로 날짜당 하나만 존재하므로 동시에 등록해도 한 요청만
+        INSERT에 성공하고, 나머지는 유니크 키 위반 후 그 작업을 다시 조회해 돌려받는다.
+
+        Returns:
+            tuple: (작업 상태 dict, 새로 만들었는지 여부)
+        """
+        while True:
+            now = datetime.utcnow()
+            active = MissionGenerationJob.query.filter_by(active_date=date).first()
+            if active and active.heartbeat_at and active.heartbeat_at >= now - timedelta(seconds=self._lock_ttl()):
+                return active.to_dict(), False
+            if active:
+                # 잠금 TTL 동안 진행 기록이 없는 작업은 작업자가 죽은 것으로 보고 실패 처리
+                MissionGenerationJob.query.filter_by(id=active.id, active_date=date).update({
+                    'status': 'failed',
+                    'error': '작업자가 응답하지 않아 중단된 작업입니다.',
+                    'active_date': None,
+                    'finished_at': now
+                }, synchronize_session=False)
+
+            MissionGenerationJob.query.filter(
+                MissionGenerationJob.created_at < now - timedelta(days=self.JOB_RETENTION_DAYS)
+            ).delete(synchronize_session=False)
+            job = MissionGenerationJob(
+                id=uuid.uuid4().hex, date=date, days_ahead=days_ahead, status='queued',
+                created_at=now, active_date=date, heartbeat_at=now
+            )
+            db.session.add(job)
+            try:
+                db.session.commit()
+                return job.to_dict(), True
+            except IntegrityError:
+                # 다른 요청이 같은 날짜의 작업을 먼저 등록한 경우
+                db.session.rollback()
+
+    def _lock_ttl(self):
+        """
+        생성 잠금 TTL(초)
+
+        잠금은 날짜마다 연장하므로 한 날짜를 생성하는 최대 시간(재시도 x 슬롯 보완 x 타임아웃 + 백오프)보다
+        길어야 한다. 설정값이 그보다 짧으면 최대 시간의 두 배를 사용한다.
+        """
+        from services.ai_mission_generator import generation_time_limit
+
+        config = self._app.config
+        day_limit = generation_time_limit(
+            config['MISSION_GENERATION_MAX_ATTEMPTS'],
+            config['MISSION_GENERATION_TIMEOUT'],
+            config['MISSION_GENERATION_BACKOFF_SECONDS']
+        )
+        return max(config['MISSION_GENERATION_LOCK_TTL'], 2 * day_limit)
+
+    def get(self, job_id):
+        job = db.session.get(MissionGenerationJob, job_id)
+        return job.to_dict() if job else None
+
+    def _update(self, job_id, result=None, **fields):
+        if result is not None:
+            fields['result'] = json.dumps(result)
+        if fields.get('status') not in self.ACTIVE_STATUSES:
+            fields['finished_at'] = datetime.utcnow()
+            fields['active_date'] = None
+        fields['heartbeat_at'] = datetime.utcnow()
+
+        db.session.rollback()
+        MissionGenerationJob.query.filter_by(id=job_id).update(fields, synchronize_session=False)
+        db.session.commit()
+
+    def _heartbeat(self, job_id, owner):
+        """각 날짜를 생성하기 전에 잠금을 연장하고 작업 진행 시각을 기록하는 함수"""
+        from services.job_lock import renew_lock
+
+        def heartbeat(date):
+            if not renew_lock(self.LOCK_NAME, owner, self._lock_ttl()):
+                raise RuntimeError('미션 생성 잠금이 만료되어 다른 작업자가 가져갔습니다.')
+            self._update(job_id, status='running')
+        return heartbeat
+
+    def _run(self, job_id, date, generator, days_ahead):
+        from services.ai_mission_generator import fill_mission_buffer
+        from services.job_lock import job_lock
+        from services.metrics import observe_job
+
+        started_at = time.perf_counter()
+        with self._app.app_context():
+            try:
+                self._update(job_id, status='running')
+                # 여러 워커/노드 중 잠금을 잡은 하나만 생성 (나머지는 Gemini 호출 없이 종료)
+                with job_lock(self.LOCK_NAME, self._lock_ttl()) as owner:
+                    if not owner:
+                        self._update(job_id, status='skipped')
+                        observe_job('mission_generation', started_at, 'skipped')
+                        return
+                    result = fill_mission_buffer(
+                        date, days_ahead, generator=generator, before_each=self._heartbeat(job_id, owner)
+                    )
+
+                status = 'failed' if 'failed' in result.values() else 'succeeded'
+                self._update(job_id, status=status, result=result)
+                observe_job('mission_generation', started_at, status)
+            except Exception as e:
+                self._app.logger.error(f'미션 생성 작업 실패: {str(e)}', exc_info=True)
+                try:
+                    self._update(job_id, status='failed', error=str(e))
+                except Exception:
+                    db.session.rollback()
+                observe_job('mission_generation', started_at, 'failed')
+            finally:
+                db.session.remove()
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+
+mission_generation_worker = MissionGenerationWorker()
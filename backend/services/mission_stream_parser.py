@@ -0,0 +1,63 @@
+import json
+
+
+class IncrementalMissionParser:
+    """
+    스트리밍되는 모델 응답에서 {"bronze": [{...}, ...], ...} 형태의 미션 객체를
+    도착하는 즉시 하나씩 꺼내는 점진적 파서
+
+    전체 응답을 기다리지 않고 청크 단위로 feed()를 호출하면, 닫힌 미션 객체마다
+    (티어, 미션 dict 또는 파싱 실패 시 None)을 반환한다. JSON 앞뒤의 코드 펜스나
+    설명 문구는 무시한다.
+    """
+
+    def __init__(self):
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._string_chars = []
+        self._last_key = None
+        self._tier = None
+        self._item_chars = None
+
+    def feed(self, text):
+        missions = []
+        for char in text:
+            if self._item_chars is not None:
+                self._item_chars.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        self._last_key = ''.join(self._string_chars)
+                elif len(self._stack) == 1:
+                    self._string_chars.append(char)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_chars = []
+            elif char in '{[':
+                if char == '[' and len(self._stack) == 1:
+                    self._tier = self._last_key
+                if char == '{' and self._stack == ['{', '[']:
+                    self._item_chars = ['{']
+                self._stack.append(char)
+            elif char in '}]' and self._stack:
+                self._stack.pop()
+                if char == '}' and self._item_chars is not None and self._stack == ['{', '[']:
+                    missions.append((self._tier, self._parse_item()))
+        return missions
+
+    def _parse_item(self):
+        raw = ''.join(self._item_chars)
+        self._item_chars = None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
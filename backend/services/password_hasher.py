@@ -0,0 +1,99 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+import bcrypt as bcrypt_lib
+
+
+class PasswordHasherBusyError(Exception):
+    """해싱 대기열이 가득 찼거나 제한 시간 안에 해싱이 끝나지 않음"""
+
+
+def _hash_password(password, rounds):
+    return bcrypt_lib.hashpw(password.encode('utf-8'), bcrypt_lib.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _check_password(password_hash, password):
+    try:
+        return bcrypt_lib.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+    except ValueError:
+        return False
+
+
+def hash_rounds(password_hash):
+    """bcrypt 해시 문자열($2b$12$...)에 기록된 work factor"""
+    try:
+        return int(password_hash.split('$')[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """
+    CPU를 많이 쓰는 bcrypt 해싱/검증을 별도 프로세스 풀에서 실행
+
+    요청 스레드가 해싱 동안 다른 요청의 CPU를 빼앗지 않도록 프로세스 풀에 작업을 넘긴다.
+    실행 중 + 대기 중인 작업 수가 workers + max_queue를 넘으면 즉시
+    PasswordHasherBusyError로 거절하고, timeout초 안에 끝나지 않은 작업도 같은 오류로 알린다.
+    PASSWORD_HASH_WORKERS=0이면 요청 스레드에서 실행한다.
+    """
+
+    def __init__(self):
+        self.rounds = 12
+        self.timeout = None
+        self._workers = 0
+        self._slots = None
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def init_app(self, app):
+        self.rounds = app.config['BCRYPT_LOG_ROUNDS']
+        self.timeout = app.config['PASSWORD_HASH_TIMEOUT']
+        self._workers = app.config['PASSWORD_HASH_WORKERS']
+        if self._workers is None:
+            self._workers = os.cpu_count() or 1
+        self._slots = threading.BoundedSemaphore(self._workers + app.config['PASSWORD_HASH_MAX_QUEUE'])
+
+    def _get_executor(self):
+        # gunicorn 등에서 fork 이후 각 워커가 자신의 풀을 갖도록 처음 사용할 때 생성
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            return self._executor
+
+    def _run(self, func, *args):
+        if not self._workers:
+            return func(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusyError()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        # 제한 시간이 지나도 작업은 풀에서 계속 실행되므로 슬롯은 작업이 실제로 끝날 때 반환
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise PasswordHasherBusyError()
+
+    def generate_password_hash(self, password):
+        return self._run(_hash_password, password, self.rounds)
+
+    def check_password_hash(self, password_hash, password):
+        return self._run(_check_password, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """설정된 work factor와 다른 cost로 만들어진 해시인지 여부"""
+        return hash_rounds(password_hash) != self.rounds
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+password_hasher = PasswordHasher()
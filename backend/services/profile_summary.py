@@ -0,0 +1,77 @@
+from sqlalchemy import func
+from database import db
+from models.mission import MissionRecord
+from services.medal_tally import MEDAL_TIERS, get_medals
+from utils.pagination import encode_cursor
+
+
+def owned_records_filter(user_id, guest_id=None):
+    """
+    프로필 목록 조회 대상 기록 조건
+
+    로그인 사용자는 user_id = ? 한 조건만 사용한다 (게스트 기록은 로그인 시 옮겨짐).
+    게스트는 자신의 guest_id 기록, 둘 다 없으면 게스트 id 없이 남은 비로그인 기록
+    """
+    if user_id:
+        return [MissionRecord.user_id == user_id]
+    if guest_id:
+        return [MissionRecord.user_id.is_(None), MissionRecord.guest_id == guest_id]
+    return [MissionRecord.user_id.is_(None), MissionRecord.guest_id.is_(None)]
+
+
+def _page(rows, limit):
+    if len(rows) <= limit:
+        return {'missions': [MissionRecord.preset_row_to_dict(row) for row in rows], 'next_cursor': None}
+
+    rows = rows[:limit]
+    return {
+        'missions': [MissionRecord.preset_row_to_dict(row) for row in rows],
+        # /recent, /by-tier/<tier>의 cursor로 이어서 조회
+        'next_cursor': encode_cursor(rows[-1].completed_at, rows[-1].id)
+    }
+
+
+def completed_presets_query(user_id, guest_id=None, tier=None):
+    """/recent, /by-tier/<tier>와 프로필 요약이 읽는 완료한 프리셋 미션 기록 쿼리"""
+    criteria = [MissionRecord.tier == tier] if tier else []
+    return MissionRecord.preset_summary_query().filter(
+        *criteria,
+        MissionRecord.preset_mission_id.isnot(None),
+        MissionRecord.actual_duration > 0,
+        *owned_records_filter(user_id, guest_id)
+    )
+
+
+def profile_summary_query(user_id, per_tier, guest_id=None):
+    """티어별 ROW_NUMBER() 윈도로 각 티어의 최신 per_tier개씩만 읽는 쿼리 (최신순)"""
+    tier_rank = func.row_number().over(
+        partition_by=MissionRecord.tier,
+        order_by=(MissionRecord.completed_at.desc(), MissionRecord.id.desc())
+    ).label('tier_rank')
+
+    ranked = completed_presets_query(user_id, guest_id).add_columns(tier_rank).subquery()
+
+    return db.session.query(ranked).filter(
+        ranked.c.tier_rank <= per_tier
+    ).order_by(ranked.c.completed_at.desc(), ranked.c.id.desc())
+
+
+def build_profile_summary(user_id, recent_limit=5, tier_limit=50, guest_id=None):
+    """
+    프로필 화면에 필요한 메달 개수, 최근 완료 미션, 티어별 완료 미션을 한 번에 조회
+
+    완료 기록은 티어별 ROW_NUMBER() 윈도 쿼리 한 번으로 각 티어의 최신 N+1개씩만 읽고,
+    최근 목록은 그 결과를 합쳐 정렬해 만든다 (각 티어 상위 N개의 합집합에 전체 상위 N개가 포함됨).
+    메달 개수는 미리 집계된 user_medal_tallies에서 읽는다.
+    """
+    per_tier = max(recent_limit, tier_limit) + 1
+    rows = profile_summary_query(user_id, per_tier, guest_id).all()
+
+    return {
+        'medals': get_medals(user_id, guest_id),
+        'recent': _page(rows, recent_limit),
+        'tiers': {
+            tier: _page([row for row in rows if row.tier == tier], tier_limit)
+            for tier in MEDAL_TIERS
+        }
+    }
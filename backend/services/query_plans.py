@@ -0,0 +1,99 @@
+from datetime import datetime
+from database import db
+from models.mission import MissionRecord
+from services.medal_tally import medal_count_query
+from services.profile_summary import completed_presets_query, profile_summary_query
+from services.record_transfer import export_query
+from utils.pagination import DEFAULT_PAGE_SIZE, keyset_page_query, null_tail_query
+
+SAMPLE_USER_ID = 1
+SAMPLE_GUEST_ID = '00000000-0000-0000-0000-000000000000'
+SAMPLE_CURSOR = (datetime(2000, 1, 1), 1)
+SAMPLE_NULL_CURSOR = (None, 1)
+
+
+def _pages(name, query):
+    """keyset_paginate가 실행하는 첫 페이지, 커서 페이지, NULL 구간 쿼리"""
+    sort_column, id_column = MissionRecord.completed_at, MissionRecord.id
+    return {
+        name: keyset_page_query(query, sort_column, id_column),
+        f'{name} (cursor)': keyset_page_query(query, sort_column, id_column, SAMPLE_CURSOR),
+        f'{name} (cursor, NULL tail)': null_tail_query(query, sort_column, id_column).limit(DEFAULT_PAGE_SIZE),
+        f'{name} (NULL cursor)': keyset_page_query(query, sort_column, id_column, SAMPLE_NULL_CURSOR),
+    }
+
+
+def endpoint_queries():
+    """
+    mission_records를 읽는 미션 엔드포인트 쿼리 (라우트/서비스와 같은 쿼리 빌더로 구성)
+
+    메달/통계/프리셋 완료 비트맵은 집계 테이블의 기본 키 조회라 제외한다.
+    """
+    return {
+        **_pages('GET /records', MissionRecord.query_with_mission()),
+        **_pages('GET /recent', completed_presets_query(SAMPLE_USER_ID)),
+        **_pages('GET /recent (guest)', completed_presets_query(None, SAMPLE_GUEST_ID)),
+        **_pages('GET /by-tier', completed_presets_query(SAMPLE_USER_ID, None, 'gold')),
+        'GET /profile-summary': profile_summary_query(SAMPLE_USER_ID, per_tier=51),
+        'GET /profile-summary (guest)': profile_summary_query(None, per_tier=51, guest_id=SAMPLE_GUEST_ID),
+        'GET /medals (guest)': medal_count_query(
+            MissionRecord.user_id.is_(None),
+            MissionRecord.guest_id == SAMPLE_GUEST_ID
+        ),
+        'GET /records/export': export_query(SAMPLE_USER_ID, since=SAMPLE_CURSOR[0]),
+        'POST /presets/batch': MissionRecord.client_ids_query(['sample-1', 'sample-2']),
+    }
+
+
+def explain(query):
+    """
+    쿼리 실행 계획 중 mission_records 전체 스캔 단계를 반환
+
+    SQLite는 EXPLAIN QUERY PLAN의 'SCAN mission_records'(인덱스 없이), MySQL은 EXPLAIN의 type=ALL을
+    전체 스캔으로 본다.
+
+    Returns:
+        tuple: (실행 계획 행 목록(str), 전체 스캔 단계 목록)
+    """
+    dialect = db.engine.dialect
+    # IN (...) 목록의 확장 파라미터를 개별 자리표시자로 펼쳐서 컴파일
+    compiled = query.statement.compile(dialect=dialect, compile_kwargs={'render_postcompile': True})
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+
+    connection = db.session.connection()
+    if dialect.name == 'sqlite':
+        rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', params).all()
+        steps = [row[-1] for row in rows]
+        full_scans = [
+            step for step in steps
+            if step.startswith(f'SCAN {MissionRecord.__tablename__}') and 'INDEX' not in step
+        ]
+        return steps, full_scans
+
+    rows = connection.exec_driver_sql(f'EXPLAIN {compiled}', params).mappings().all()
+    steps = [
+        f"{row['table']}: type={row['type']}, key={row['key']}, rows={row['rows']}, extra={row['Extra']}"
+        for row in rows
+    ]
+    full_scans = [
+        step for row, step in zip(rows, steps)
+        if row['table'] == MissionRecord.__tablename__ and row['type'] == 'ALL'
+    ]
+    return steps, full_scans
+
+
+def check_query_plans(log=print):
+    """
+    모든 엔드포인트 쿼리의 실행 계획을 출력하고 전체 스캔이 있는 쿼리 이름 목록을 반환
+    """
+    failures = []
+    for name, query in endpoint_queries().items():
+        steps, full_scans = explain(query)
+        log(f'{"FULL SCAN" if full_scans else "OK"} {name}')
+        for step in steps:
+            log(f'    {step}')
+        if full_scans:
+            failures.append(name)
+    return failures
@@ -0,0 +1,194 @@
+import math
+import threading
+import time
+from functools import wraps
+from flask import current_app, jsonify, request
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+PERIOD_SECONDS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_rate(rate):
+    """
+    '10/minute' 형식의 예산을 (버킷 크기, 초당 충전량)으로 변환
+
+    버킷 크기만큼 연속 요청을 허용하고, 이후에는 기간 동안 N개 속도로 충전된다.
+    """
+    count, period = rate.split('/')
+    count = int(count)
+    if count <= 0 or period not in PERIOD_SECONDS:
+        raise ValueError(f'잘못된 요청 한도 형식입니다: {rate}')
+    return count, count / PERIOD_SECONDS[period]
+
+
+class MemoryRateLimitBackend:
+    """
+    프로세스 로컬 토큰 버킷 저장소
+
+    워커마다 따로 집계되므로 워커가 N개이면 실제 허용량은 최대 N배가 된다.
+    """
+
+    MAX_KEYS = 100000
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, refill_rate, now, cost=1):
+        """
+        Returns:
+            tuple: (허용 여부, 남은 토큰 수, 다음 토큰까지 대기 시간(초))
+        """
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + max(0.0, now - updated_at) * refill_rate)
+
+            if tokens >= cost:
+                tokens -= cost
+                allowed, retry_after = True, 0.0
+            else:
+                allowed, retry_after = False, (cost - tokens) / refill_rate
+
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / refill_rate)
+            if len(self._buckets) > self.MAX_KEYS:
+                self._prune(now)
+            return allowed, tokens, retry_after
+
+    def _prune(self, now):
+        # 이미 가득 찼을 버킷은 없는 버킷과 결과가 같으므로 지운다
+        for key in [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]:
+            del self._buckets[key]
+
+
+class RedisRateLimitBackend:
+    """여러 워커/노드가 공유하는 Redis 토큰 버킷 (Lua 스크립트로 원자적으로 갱신)"""
+
+    KEY_PREFIX = 'dopamine_breaker:rate_limit:'
+    SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * refill_rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / refill_rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill_rate) + 1)
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+    def __init__(self, client):
+        self._script = client.register_script(self.SCRIPT)
+
+    def consume(self, key, capacity, refill_rate, now, cost=1):
+        allowed, tokens, retry_after = self._script(
+            keys=[self.KEY_PREFIX + key],
+            args=[capacity, refill_rate, now, cost]
+        )
+        return bool(allowed), float(tokens), float(retry_after)
+
+
+class RateLimiter:
+    """
+    사용자 id(로그인) 또는 IP 기준 토큰 버킷 요청 한도
+
+    예산은 RATE_LIMITS 설정의 이름별 '횟수/기간' 값을 사용한다.
+    RATE_LIMIT_STORAGE_URL이 설정되어 있으면 Redis에 공유하고, 없으면 프로세스 로컬로 집계한다.
+    저장소 장애 시에는 요청을 막지 않는다. 리버스 프록시 뒤에서는 ProxyFix 등으로
+    request.remote_addr가 실제 클라이언트 IP가 되도록 해야 IP별 한도가 의미 있다.
+    """
+
+    def __init__(self):
+        self.backend = MemoryRateLimitBackend()
+        self._budgets = {}
+        self._enabled = True
+
+    def init_app(self, app):
+        self._enabled = app.config['RATE_LIMIT_ENABLED']
+        self._budgets = {name: parse_rate(rate) for name, rate in app.config['RATE_LIMITS'].items()}
+
+        storage_url = app.config.get('RATE_LIMIT_STORAGE_URL')
+        if not storage_url:
+            return
+
+        if redis is None:
+            app.logger.warning('RATE_LIMIT_STORAGE_URL이 설정되었지만 redis 패키지가 없어 프로세스별로 집계합니다.')
+            return
+
+        self.backend = RedisRateLimitBackend(redis.Redis.from_url(storage_url))
+
+    def _client_key(self):
+        from utils.auth_helpers import get_current_user_id
+
+        user_id = get_current_user_id()
+        if user_id:
+            return f'user:{user_id}'
+        return f'ip:{request.remote_addr}'
+
+    def check(self, budget):
+        """
+        현재 요청에 예산 토큰 하나를 사용
+
+        Returns:
+            Flask response or None: 한도를 넘으면 429 응답, 허용되면 None
+        """
+        if not self._enabled or budget not in self._budgets:
+            return None
+
+        capacity, refill_rate = self._budgets[budget]
+        try:
+            allowed, _, retry_after = self.backend.consume(
+                f'{budget}:{self._client_key()}', capacity, refill_rate, time.time()
+            )
+        except Exception as e:
+            current_app.logger.warning(f'요청 한도 저장소 오류로 제한 없이 처리합니다: {str(e)}')
+            return None
+
+        if allowed:
+            return None
+
+        from services.metrics import rate_limited_requests
+        rate_limited_requests.inc(budget=budget)
+
+        retry_after = max(1, math.ceil(retry_after))
+        response = jsonify({'message': '요청이 너무 많습니다. 잠시 후 다시 시도해주세요.', 'retry_after': retry_after})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(retry_after)
+        return response
+
+
+rate_limiter = RateLimiter()
+
+
+def rate_limit(budget):
+    """
+    라우트에 이름이 budget인 요청 한도를 적용하는 데코레이터
+
+    Usage:
+        @auth_bp.route('/login', methods=['POST'])
+        @rate_limit('auth_login')
+        def login():
+            ...
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            limited = rate_limiter.check(budget)
+            if limited is not None:
+                return limited
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
@@ -0,0 +1,213 @@
+import csv
+import io
+import json
+from datetime import datetime
+from sqlalchemy import insert
+from database import db
+from models.mission import MissionRecord
+from services.completion_index import mark_presets_done
+from services.leaderboard import leaderboard
+from services.medal_tally import add_medals, validate_result
+from services.user_stats import record_mission_results
+from utils.local_time import local_date
+
+EXPORT_BATCH_SIZE = 1000
+IMPORT_CHUNK_SIZE = 1000
+# client_id 없이 저장된 기록(단건 완료/실패 등)은 이 접두어 + 기록 id를 client_id로 내보낸다
+EXPORTED_CLIENT_ID_PREFIX = 'record-'
+
+# 내보내기 컬럼 순서 (본인 기록만 내보내므로 user_id는 제외, 기기 식별자인 guest_id도 제외)
+EXPORT_COLUMNS = (
+    'id', 'client_id', 'mission_id', 'preset_mission_id', 'tier', 'title', 'description',
+    'completed_at', 'actual_duration', 'notes'
+)
+# 가져오기 컬럼 (id와 user_id는 서버가 부여, client_id가 이미 있는 행은 건너뛴다)
+IMPORT_COLUMNS = tuple(column for column in EXPORT_COLUMNS if column != 'id')
+INTEGER_COLUMNS = {'mission_id', 'preset_mission_id', 'actual_duration'}
+
+
+def export_query(user_id, since=None):
+    query = db.session.query(*[getattr(MissionRecord, column) for column in EXPORT_COLUMNS]).filter(
+        MissionRecord.user_id == user_id
+    )
+    if since:
+        query = query.filter(MissionRecord.completed_at >= since)
+    # (user_id, completed_at) 인덱스 순서로 읽고, 서버 측 커서로 EXPORT_BATCH_SIZE개씩 가져와 메모리 사용량을 일정하게 유지
+    return query.order_by(MissionRecord.completed_at, MissionRecord.id).yield_per(EXPORT_BATCH_SIZE)
+
+
+def _row_to_dict(row):
+    record = dict(zip(EXPORT_COLUMNS, row))
+    if not record['client_id']:
+        # 다시 가져올 때 같은 기록으로 알아볼 수 있도록 기록 id로 client_id를 만든다
+        record['client_id'] = f'{EXPORTED_CLIENT_ID_PREFIX}{record["id"]}'
+    if record['completed_at']:
+        record['completed_at'] = record['completed_at'].isoformat()
+    return record
+
+
+def export_ndjson(user_id, since=None):
+    for row in export_query(user_id, since):
+        yield json.dumps(_row_to_dict(row), ensure_ascii=False) + '\n'
+
+
+def export_csv(user_id, since=None):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    for index, row in enumerate(export_query(user_id, since), start=1):
+        record = _row_to_dict(row)
+        writer.writerow(['' if record[column] is None else record[column] for column in EXPORT_COLUMNS])
+        if index % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def _normalize(record, user_id):
+    if not isinstance(record, dict):
+        raise ValueError('각 행은 JSON 객체여야 합니다.')
+
+    row = {'user_id': user_id, 'guest_id': None}
+    for column in IMPORT_COLUMNS:
+        value = record.get(column)
+        if value == '':
+            value = None
+        if value is not None and column in INTEGER_COLUMNS:
+            value = int(value)
+        if value is not None and column == 'completed_at':
+            value = datetime.fromisoformat(value)
+        if value is not None and column == 'client_id':
+            value = str(value)
+            if len(value) > 64:
+                raise ValueError('client_id는 64자 이하여야 합니다.')
+        row[column] = value
+
+    error = validate_result(row['tier'], row['actual_duration'])
+    if error:
+        raise ValueError(error)
+    # 단건/일괄 저장과 같이 완료 시각이 없으면 받은 시각으로 저장
+    row['completed_at'] = row['completed_at'] or datetime.utcnow()
+    return row
+
+
+def _parse_ndjson(stream):
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            raise ValueError(f'{line_number}번째 줄이 올바른 JSON이 아닙니다: {str(e)}')
+
+
+def _existing_client_ids(client_ids, user_id):
+    """이미 저장된 client_id (record-<id> 형식은 본인 기록 id로도 확인)"""
+    existing = {client_id for (client_id,) in MissionRecord.client_ids_query(client_ids)}
+
+    record_ids = {
+        int(client_id[len(EXPORTED_CLIENT_ID_PREFIX):]) for client_id in client_ids
+        if client_id.startswith(EXPORTED_CLIENT_ID_PREFIX) and client_id[len(EXPORTED_CLIENT_ID_PREFIX):].isdigit()
+    }
+    if record_ids:
+        existing |= {
+            f'{EXPORTED_CLIENT_ID_PREFIX}{record_id}' for (record_id,) in db.session.query(MissionRecord.id).filter(
+                MissionRecord.user_id == user_id,
+                MissionRecord.id.in_(record_ids)
+            )
+        }
+    return existing
+
+
+def _apply_results(user_id, rows):
+    """저장한 행을 메달 집계, 사용자 통계, 프리셋 완료 비트맵에 반영 (단건/일괄 저장과 같은 트랜잭션)"""
+    medal_counts = {}
+    presets_by_date = {}
+    for row in rows:
+        if (row['actual_duration'] or 0) > 0:
+            medal_counts[row['tier']] = medal_counts.get(row['tier'], 0) + 1
+        if row['preset_mission_id'] is not None:
+            presets_by_date.setdefault(local_date(row['completed_at']), []).append(row['preset_mission_id'])
+
+    add_medals(user_id, medal_counts)
+    record_mission_results(user_id, [(row['completed_at'], row['tier'], row['actual_duration']) for row in rows])
+    for date, preset_mission_ids in presets_by_date.items():
+        mark_presets_done(user_id, preset_mission_ids, date)
+
+
+def _insert_chunk(chunk, user_id):
+    """
+    client_id가 이미 저장되었거나 청크 안에서 반복되는 행을 빼고 INSERT
+
+    Returns:
+        tuple: (저장한 행 목록, 건너뛴 행 수)
+    """
+    client_ids = [row['client_id'] for row in chunk if row['client_id'] is not None]
+    existing = _existing_client_ids(client_ids, user_id) if client_ids else set()
+
+    rows = []
+    for row in chunk:
+        if row['client_id'] is not None:
+            if row['client_id'] in existing:
+                continue
+            existing.add(row['client_id'])
+        rows.append(row)
+
+    if rows:
+        db.session.execute(insert(MissionRecord), rows)
+        _apply_results(user_id, rows)
+    return rows, len(chunk) - len(rows)
+
+
+def _chunks(records, user_id):
+    chunk = []
+    for line_number, record in enumerate(records, start=1):
+        try:
+            chunk.append(_normalize(record, user_id))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'{line_number}번째 행을 읽을 수 없습니다: {str(e)}')
+
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def import_records(stream, user_id, fmt='ndjson'):
+    """
+    NDJSON/CSV 텍스트 스트림의 기록을 IMPORT_CHUNK_SIZE개씩 executemany로 user_id의 기록으로 저장
+
+    파일의 user_id/guest_id는 무시하고, client_id가 이미 있는 행은 건너뛰므로 내보낸 파일을 다시 가져와도
+    중복 저장되지 않는다. tier/actual_duration은 단건 완료와 같이 검증하고, 메달 집계, 사용자 통계,
+    프리셋 완료 비트맵은 같은 트랜잭션에서, 리더보드는 커밋 뒤에 갱신한다.
+    전체를 한 트랜잭션으로 저장하므로 예외가 나면 호출한 쪽에서 롤백하며 아무 행도 저장되지 않는다.
+
+    Returns:
+        tuple: (저장한 행 수, client_id 중복으로 건너뛴 행 수)
+
+    Raises:
+        ValueError: 읽을 수 없거나 유효하지 않은 행이 있는 경우
+        IntegrityError: 같은 client_id가 다른 요청에서 동시에 저장된 경우
+    """
+    records = csv.DictReader(stream) if fmt == 'csv' else _parse_ndjson(stream)
+
+    imported = 0
+    skipped = 0
+    medals_by_date = {}
+    for chunk in _chunks(records, user_id):
+        rows, duplicated = _insert_chunk(chunk, user_id)
+        imported += len(rows)
+        skipped += duplicated
+        for row in rows:
+            if (row['actual_duration'] or 0) > 0:
+                counts = medals_by_date.setdefault(local_date(row['completed_at']), {})
+                counts[row['tier']] = counts.get(row['tier'], 0) + 1
+
+    db.session.commit()
+    leaderboard.add_medals(user_id, medals_by_date)
+    return imported, skipped
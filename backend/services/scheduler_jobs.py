@@ -0,0 +1,54 @@
+import time
+from functools import wraps
+from apscheduler.triggers.cron import CronTrigger
+from services.daily_mission_cache import daily_mission_cache
+from services.metrics import observe_job
+from services.mission_generation_worker import mission_generation_worker
+
+
+def timed_job(name):
+    """스케줄러 작업 실행 시간을 job_duration_seconds 지표로 기록하는 데코레이터"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                result = f(*args, **kwargs)
+            except Exception:
+                observe_job(name, started_at, 'failed')
+                raise
+            observe_job(name, started_at)
+            return result
+        return decorated_function
+    return decorator
+
+
+def register_scheduler_jobs(scheduler, app):
+    """웹 서버 내장 스케줄러와 단독 스케줄러 프로세스가 공통으로 사용하는 작업 등록"""
+
+    # 생성은 백그라운드 작업자에서 실행되므로 여기서는 작업 등록 시간만 잰다
+    # (생성 소요 시간은 작업자의 job_duration_seconds{job="mission_generation"})
+    @timed_job('scheduler.daily_mission_generation_submit')
+    def scheduled_mission_generation():
+        mission_generation_worker.submit(days_ahead=app.config['MISSION_BUFFER_DAYS'])
+
+    # 미션을 며칠 앞서 생성해 두므로 자정 전환은 조회만 하면 된다
+    scheduler.add_job(
+        func=scheduled_mission_generation,
+        trigger=CronTrigger(hour='0,6,12,18', minute=1),
+        id='daily_mission_generation',
+        name='Refill buffered daily missions',
+        replace_existing=True
+    )
+
+    @timed_job('scheduler.daily_mission_cache_rollover')
+    def scheduled_cache_rollover():
+        daily_mission_cache.rollover()
+
+    scheduler.add_job(
+        func=scheduled_cache_rollover,
+        trigger=CronTrigger(hour=0, minute=0),
+        id='daily_mission_cache_rollover',
+        name='Drop stale daily mission cache at midnight',
+        replace_existing=True
+    )
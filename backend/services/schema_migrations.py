@@ -0,0 +1,165 @@
+from sqlalchemy import inspect, text
+from database import db
+import models  # noqa: F401 (create_all이 모든 모델 테이블을 알도록 등록)
+from models.daily_completion import DailyPresetCompletion, GuestPresetCompletion
+from models.job_lock import JobLock
+from models.mission_generation_job import MissionGenerationJob
+from models.schema_migration import SchemaMigration
+from services.job_lock import job_lock
+
+LOCK_NAME = 'schema_migrations'
+LOCK_TTL_SECONDS = 60 * 60
+
+
+def _dialect():
+    return db.engine.dialect.name
+
+
+def _columns(table):
+    return {column['name']: column for column in inspect(db.engine).get_columns(table)}
+
+
+def _has_index(table, columns):
+    """컬럼 구성이 같은 인덱스/유니크 제약이 이미 있는지 (이름은 create_all과 schema.sql이 다를 수 있음)"""
+    inspector = inspect(db.engine)
+    existing = [index['column_names'] for index in inspector.get_indexes(table)]
+    existing += [constraint['column_names'] for constraint in inspector.get_unique_constraints(table)]
+    return list(columns) in existing
+
+
+def add_column(table, name, ddl):
+    """컬럼이 없으면 추가 (MySQL은 테이블 잠금 없이 INPLACE로 추가)"""
+    if name in _columns(table):
+        return False
+
+    online = ', ALGORITHM=INPLACE, LOCK=NONE' if _dialect() == 'mysql' else ''
+    db.session.execute(text(f'ALTER TABLE {table} ADD COLUMN {name} {ddl}{online}'))
+    db.session.commit()
+    return True
+
+
+def create_index(table, name, columns, unique=False):
+    """
+    같은 컬럼 구성의 인덱스가 없으면 생성
+
+    MySQL은 ALGORITHM=INPLACE, LOCK=NONE으로 생성하여 인덱스를 만드는 동안에도
+    INSERT/UPDATE가 막히지 않는다.
+    """
+    if _has_index(table, columns):
+        return False
+
+    online = ' ALGORITHM=INPLACE LOCK=NONE' if _dialect() == 'mysql' else ''
+    unique_keyword = 'UNIQUE ' if unique else ''
+    db.session.execute(text(f'CREATE {unique_keyword}INDEX {name} ON {table} ({", ".join(columns)}){online}'))
+    db.session.commit()
+    return True
+
+
+def _create_missing_tables():
+    # 새 DB는 현재 모델 기준으로 모든 테이블과 인덱스가 생성되어 이후 마이그레이션은 건너뛴다
+    db.metadata.create_all(bind=db.engine, checkfirst=True)
+
+
+def _add_mission_record_columns():
+    # database/schema.sql로 만든 기존 mission_records에 없는 컬럼
+    add_column('mission_records', 'user_id', 'INTEGER NULL')
+    add_column('mission_records', 'preset_mission_id', 'INTEGER NULL')
+    add_column('mission_records', 'tier', 'VARCHAR(20) NULL')
+    add_column('mission_records', 'title', 'VARCHAR(100) NULL')
+    add_column('mission_records', 'description', 'TEXT NULL')
+    add_column('mission_records', 'client_id', 'VARCHAR(64) NULL')
+    add_column('mission_records', 'guest_id', 'VARCHAR(36) NULL')
+
+    # 프리셋 미션 기록은 mission_id가 없으므로 NULL 허용 (SQLite 개발 DB는 처음부터 NULL 허용)
+    mission_id = _columns('mission_records')['mission_id']
+    if _dialect() == 'mysql' and not mission_id['nullable']:
+        db.session.execute(text(
+            'ALTER TABLE mission_records MODIFY mission_id INTEGER NULL, ALGORITHM=INPLACE, LOCK=NONE'
+        ))
+        db.session.commit()
+
+
+def _add_mission_record_indexes():
+    create_index('mission_records', 'ix_mission_records_completed_at', ['completed_at'])
+    create_index('mission_records', 'ix_mission_records_user_completed_at', ['user_id', 'completed_at'])
+    create_index('mission_records', 'ix_mission_records_user_tier_completed_at', ['user_id', 'tier', 'completed_at'])
+    create_index('mission_records', 'ix_mission_records_guest_id', ['guest_id'])
+    create_index('mission_records', 'uq_mission_records_client_id', ['client_id'], unique=True)
+
+
+def _migrate_wide_daily_missions():
+    from services.daily_mission_store import migrate_wide_daily_missions
+    migrate_wide_daily_missions(log=lambda message: None)
+
+
+def _create_mission_generation_jobs():
+    MissionGenerationJob.__table__.create(bind=db.engine, checkfirst=True)
+
+
+def _create_guest_preset_completions():
+    GuestPresetCompletion.__table__.create(bind=db.engine, checkfirst=True)
+    # 모든 게스트가 함께 쓰던 user_id 0 비트맵은 더 이상 읽지 않는다
+    DailyPresetCompletion.query.filter_by(user_id=0).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def _rebuild_user_stats_in_local_dates():
+    # 이전 버전은 일별 통계를 UTC 날짜로 나눴다
+    from services.user_stats import rebuild_user_stats
+    rebuild_user_stats(log=lambda message: None)
+
+
+def _add_mission_generation_job_columns():
+    add_column('mission_generation_jobs', 'active_date', 'DATE NULL')
+    add_column('mission_generation_jobs', 'heartbeat_at', 'DATETIME NULL')
+    create_index('mission_generation_jobs', 'uq_mission_generation_jobs_active_date', ['active_date'], unique=True)
+
+
+# (버전, 설명, 함수) - 적용된 버전은 바꾸지 말고 새 버전을 뒤에 추가한다
+MIGRATIONS = (
+    (1, '모델 기준으로 없는 테이블 생성', _create_missing_tables),
+    (2, 'mission_records 사용자/프리셋/게스트 컬럼 추가', _add_mission_record_columns),
+    (3, 'mission_records 조회용 인덱스 추가', _add_mission_record_indexes),
+    (4, 'daily_missions 기존 컬럼을 daily_mission_items로 변환', _migrate_wide_daily_missions),
+    (5, '미션 생성 작업 상태 테이블 추가', _create_mission_generation_jobs),
+    (6, '게스트별 프리셋 완료 비트맵 테이블 추가', _create_guest_preset_completions),
+    (7, '사용자 일별 통계를 로컬 날짜 기준으로 재계산', _rebuild_user_stats_in_local_dates),
+    (8, '미션 생성 작업 진행 중 날짜/진행 시각 컬럼 추가', _add_mission_generation_job_columns),
+)
+
+
+def applied_versions():
+    if not inspect(db.engine).has_table(SchemaMigration.__tablename__):
+        return set()
+    return {version for (version,) in db.session.query(SchemaMigration.version)}
+
+
+def pending_migrations():
+    applied = applied_versions()
+    return [migration for migration in MIGRATIONS if migration[0] not in applied]
+
+
+def run_migrations(log=print):
+    """
+    적용되지 않은 마이그레이션을 버전 순서대로 실행
+
+    여러 워커가 동시에 시작해도 job_locks 잠금을 잡은 프로세스 하나만 실행한다.
+
+    Returns:
+        bool: 잠금을 얻어 실행했으면 True, 다른 프로세스가 실행 중이면 False
+    """
+    JobLock.__table__.create(bind=db.engine, checkfirst=True)
+    SchemaMigration.__table__.create(bind=db.engine, checkfirst=True)
+
+    with job_lock(LOCK_NAME, LOCK_TTL_SECONDS) as acquired:
+        if not acquired:
+            log('다른 프로세스가 스키마 마이그레이션을 실행 중입니다.')
+            return False
+
+        for version, description, migrate in pending_migrations():
+            log(f'스키마 마이그레이션 {version}: {description}')
+            migrate()
+            db.session.add(SchemaMigration(version=version, description=description))
+            db.session.commit()
+
+    return True
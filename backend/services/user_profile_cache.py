@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from models.user import UserModel
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# 토큰에 넣는 표시용 클레임 (이메일 등 개인정보는 넣지 않는다)
+PROFILE_CLAIM_KEYS = ('username', 'created_at')
+
+
+class UserProfileCache:
+    """
+    사용자 id별 프로필 TTL 캐시 (users 행이 수정/삭제되면 자동 무효화)
+
+    USER_PROFILE_CACHE_REDIS_URL(없으면 MISSION_CACHE_REDIS_URL)이 설정되어 있으면 Redis에만 저장하여
+    한 워커의 무효화가 모든 워커에 바로 반영된다. 없으면 프로세스 로컬에 저장하므로
+    다른 워커에서 바뀐 프로필은 최대 TTL 동안 이전 값으로 보일 수 있다.
+    """
+
+    KEY_PREFIX = 'dopamine_breaker:user_profile:'
+
+    def __init__(self, ttl_seconds=300, max_size=10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+
+    def init_app(self, app):
+        self.ttl_seconds = app.config['USER_PROFILE_CACHE_TTL']
+        redis_url = app.config.get('USER_PROFILE_CACHE_REDIS_URL') or app.config.get('MISSION_CACHE_REDIS_URL')
+        if not redis_url:
+            return
+
+        if redis is None:
+            app.logger.warning('프로필 캐시 Redis URL이 설정되었지만 redis 패키지가 없어 워커별로 캐시합니다.')
+            return
+
+        self._redis = redis.Redis.from_url(redis_url)
+
+    def get(self, user_id):
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(f'{self.KEY_PREFIX}{user_id}')
+            except Exception:
+                # 공유 캐시 장애 시 DB 조회로 대체
+                return None
+            return json.loads(raw) if raw is not None else None
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            profile, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            return profile
+
+    def set(self, user_id, profile):
+        if self._redis is not None:
+            try:
+                self._redis.set(
+                    f'{self.KEY_PREFIX}{user_id}',
+                    json.dumps(profile, ensure_ascii=False),
+                    ex=self.ttl_seconds
+                )
+            except Exception:
+                pass
+            return
+
+        with self._lock:
+            self._entries[user_id] = (profile, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        if self._redis is not None:
+            try:
+                self._redis.delete(f'{self.KEY_PREFIX}{user_id}')
+            except Exception:
+                pass
+
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+user_profile_cache = UserProfileCache()
+
+
+@event.listens_for(UserModel, 'after_update')
+@event.listens_for(UserModel, 'after_delete')
+def _invalidate_user_profile(mapper, connection, target):
+    user_profile_cache.invalidate(target.id)
+
+
+def profile_claims(user):
+    """
+    로그인 시 액세스 토큰에 함께 넣는 표시용 프로필 클레임
+
+    토큰은 만료 전까지 바뀌지 않으므로 /me는 이 클레임이 아닌 캐시/DB 값으로 응답한다.
+    """
+    profile = user.to_profile_dict()
+    return {key: profile[key] for key in PROFILE_CLAIM_KEYS}
@@ -0,0 +1,261 @@
+from datetime import date as date_type, datetime, timedelta
+from sqlalchemy import case, func
+from sqlalchemy.exc import IntegrityError
+from database import db
+from models.mission import MissionRecord
+from models.user_stats import UserDailyStats, UserStats
+from services.completion_index import ANONYMOUS_USER_KEY
+from services.medal_tally import MEDAL_TIERS
+from utils.local_time import local_date, local_date_expression
+
+COUNTER_FIELDS = ('completed', 'failed', 'focus_minutes') + MEDAL_TIERS
+
+
+def _empty_counts():
+    return {field: 0 for field in COUNTER_FIELDS}
+
+
+def _add_result(counts, tier, actual_duration):
+    # 메달 집계와 같이 actual_duration > 0이면 완료, 아니면 실패로 본다
+    if actual_duration and actual_duration > 0:
+        counts['completed'] += 1
+        counts['focus_minutes'] += actual_duration
+        if tier in MEDAL_TIERS:
+            counts[tier] += 1
+    else:
+        counts['failed'] += 1
+
+
+def _add_daily_counts(key, date, counts):
+    counts = {field: value for field, value in counts.items() if value}
+    values = {getattr(UserDailyStats, field): getattr(UserDailyStats, field) + value for field, value in counts.items()}
+    if UserDailyStats.query.filter_by(user_id=key, date=date).update(values, synchronize_session=False):
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(UserDailyStats(user_id=key, date=date, **{f: counts.get(f, 0) for f in COUNTER_FIELDS}))
+    except IntegrityError:
+        # 동시 요청이 먼저 행을 만든 경우
+        UserDailyStats.query.filter_by(user_id=key, date=date).update(values, synchronize_session=False)
+
+
+def _add_total_counts(key, counts):
+    """누적 카운터만 행 잠금 없이 원자적 UPDATE로 더한다 (연속 일수는 갱신하지 않음)"""
+    counts = {field: value for field, value in counts.items() if value}
+    values = {getattr(UserStats, field): getattr(UserStats, field) + value for field, value in counts.items()}
+    if UserStats.query.filter_by(user_id=key).update(values, synchronize_session=False):
+        return
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(UserStats(
+                user_id=key, **{f: counts.get(f, 0) for f in COUNTER_FIELDS}, current_streak=0, longest_streak=0
+            ))
+    except IntegrityError:
+        # 동시 요청이 먼저 행을 만든 경우
+        UserStats.query.filter_by(user_id=key).update(values, synchronize_session=False)
+
+
+def _locked_user_stats(key):
+    stats = db.session.get(UserStats, key, with_for_update=True)
+    if stats is not None:
+        return stats
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(UserStats(user_id=key, **_empty_counts(), current_streak=0, longest_streak=0))
+    except IntegrityError:
+        pass
+    return db.session.get(UserStats, key, with_for_update=True, populate_existing=True)
+
+
+def _streaks(completed_dates):
+    """정렬된 완료 날짜 목록에서 (마지막 날짜로 끝나는 연속 일수, 최장 연속 일수)"""
+    current = longest = 0
+    previous = None
+    for date in completed_dates:
+        current = current + 1 if previous and date == previous + timedelta(days=1) else 1
+        longest = max(longest, current)
+        previous = date
+    return current, longest
+
+
+def _recompute_streaks(stats):
+    db.session.flush()
+    completed_dates = [
+        row.date for row in db.session.query(UserDailyStats.date).filter(
+            UserDailyStats.user_id == stats.user_id,
+            UserDailyStats.completed > 0
+        ).order_by(UserDailyStats.date)
+    ]
+    stats.current_streak, stats.longest_streak = _streaks(completed_dates)
+    stats.last_completed_date = completed_dates[-1] if completed_dates else None
+
+
+def record_mission_results(user_id, results):
+    """
+    완료/실패 결과를 일별·누적 통계에 반영 (커밋은 호출한 쪽에서 수행)
+
+    일별 통계와 연속 일수는 오늘의 미션과 같은 서버 로컬 날짜로 나눈다.
+
+    Args:
+        user_id: 사용자 id 또는 None(비로그인)
+        results: (completed_at, tier, actual_duration) 튜플 목록
+    """
+    key = user_id or ANONYMOUS_USER_KEY
+
+    per_day = {}
+    for completed_at, tier, actual_duration in results:
+        _add_result(per_day.setdefault(local_date(completed_at), _empty_counts()), tier, actual_duration)
+    if not per_day:
+        return
+
+    for date, counts in per_day.items():
+        _add_daily_counts(key, date, counts)
+
+    if key == ANONYMOUS_USER_KEY:
+        # 모든 게스트가 같은 행을 쓰므로 FOR UPDATE로 직렬화하지 않고 카운터만 더한다 (연속 일수 없음)
+        totals = _empty_counts()
+        for counts in per_day.values():
+            for field, value in counts.items():
+                totals[field] += value
+        _add_total_counts(key, totals)
+        return
+
+    stats = _locked_user_stats(key)
+    for date, counts in per_day.items():
+        for field, value in counts.items():
+            setattr(stats, field, getattr(stats, field) + value)
+
+    needs_recompute = False
+    for date in sorted(date for date, counts in per_day.items() if counts['completed']):
+        last = stats.last_completed_date
+        if last is None or date > last:
+            stats.current_streak = stats.current_streak + 1 if last == date - timedelta(days=1) else 1
+            stats.longest_streak = max(stats.longest_streak, stats.current_streak)
+            stats.last_completed_date = date
+        elif date < last:
+            # 오프라인 기록 등 과거 날짜가 늦게 들어오면 해당 사용자의 일별 통계로 다시 계산
+            needs_recompute = True
+
+    if needs_recompute:
+        _recompute_streaks(stats)
+
+
+def subtract_mission_results(user_id, results):
+    """
+    다른 사용자에게 옮겨진 결과만큼 일별·누적 카운터를 뺀다 (연속 일수는 그대로 둔다)
+
+    로그인 시 게스트 기록을 계정으로 옮길 때 비로그인 버킷에서 빼는 용도
+    """
+    key = user_id or ANONYMOUS_USER_KEY
+
+    per_day = {}
+    for completed_at, tier, actual_duration in results:
+        _add_result(per_day.setdefault(local_date(completed_at), _empty_counts()), tier, actual_duration)
+
+    totals = _empty_counts()
+    for date, counts in per_day.items():
+        UserDailyStats.query.filter_by(user_id=key, date=date).update(
+            {getattr(UserDailyStats, field): getattr(UserDailyStats, field) - value for field, value in counts.items() if value},
+            synchronize_session=False
+        )
+        for field, value in counts.items():
+            totals[field] += value
+
+    values = {getattr(UserStats, field): getattr(UserStats, field) - value for field, value in totals.items() if value}
+    if values:
+        UserStats.query.filter_by(user_id=key).update(values, synchronize_session=False)
+
+
+def record_mission_result(user_id, record):
+    """MissionRecord 하나를 통계에 반영 (completed_at이 채워진 뒤 호출)"""
+    record_mission_results(user_id, [(record.completed_at, record.tier, record.actual_duration)])
+
+
+def get_user_stats(user_id):
+    """누적 통계와 오늘 통계를 기본 키 조회 두 번으로 반환"""
+    key = user_id or ANONYMOUS_USER_KEY
+    today = datetime.now().date()
+
+    stats = db.session.get(UserStats, key)
+    daily = db.session.get(UserDailyStats, (key, today))
+
+    result = {field: getattr(stats, field) if stats else 0 for field in ('completed', 'failed', 'focus_minutes')}
+    result['tiers'] = {tier: getattr(stats, tier) if stats else 0 for tier in MEDAL_TIERS}
+    result['longest_streak'] = stats.longest_streak if stats else 0
+    # 어제도 오늘도 완료 기록이 없으면 연속 기록이 끊긴 것으로 본다
+    streak_alive = stats and stats.last_completed_date and stats.last_completed_date >= today - timedelta(days=1)
+    result['current_streak'] = stats.current_streak if streak_alive else 0
+    result['today'] = daily.to_dict() if daily else {'date': today.isoformat(), **_empty_daily()}
+    return result
+
+
+def _empty_daily():
+    return {
+        'completed': 0,
+        'failed': 0,
+        'focus_minutes': 0,
+        'tiers': {tier: 0 for tier in MEDAL_TIERS}
+    }
+
+
+def rebuild_user_stats(batch_size=1000, log=print):
+    """
+    mission_records로부터 user_daily_stats와 user_stats를 사용자 id 구간 단위로 재계산한다
+    """
+    completed = MissionRecord.actual_duration > 0
+    record_date = local_date_expression(MissionRecord.completed_at, db.engine.dialect.name)
+
+    batches = [(ANONYMOUS_USER_KEY, ANONYMOUS_USER_KEY, [MissionRecord.user_id.is_(None)])]
+    max_user_id = db.session.query(func.max(MissionRecord.user_id)).scalar() or 0
+    for start in range(1, max_user_id + 1, batch_size):
+        end = start + batch_size - 1
+        batches.append((start, end, [MissionRecord.user_id.between(start, end)]))
+
+    for start, end, criteria in batches:
+        rows = db.session.query(
+            MissionRecord.user_id,
+            record_date,
+            func.sum(case((completed, 1), else_=0)),
+            func.sum(case((completed, 0), else_=1)),
+            func.sum(case((completed, MissionRecord.actual_duration), else_=0)),
+            *[func.sum(case((completed & (MissionRecord.tier == tier), 1), else_=0)) for tier in MEDAL_TIERS]
+        ).filter(
+            MissionRecord.completed_at.isnot(None),
+            *criteria
+        ).group_by(MissionRecord.user_id, record_date).all()
+
+        daily_rows = []
+        per_user = {}
+        for user_id, date, *values in rows:
+            key = user_id or ANONYMOUS_USER_KEY
+            # SQLite의 date()는 문자열을 반환
+            date = date_type.fromisoformat(date) if isinstance(date, str) else date
+            counts = dict(zip(COUNTER_FIELDS, (int(value or 0) for value in values)))
+            daily_rows.append({'user_id': key, 'date': date, **counts})
+            per_user.setdefault(key, []).append((date, counts))
+
+        user_rows = []
+        for key, days in per_user.items():
+            totals = _empty_counts()
+            for _, counts in days:
+                for field, value in counts.items():
+                    totals[field] += value
+            completed_dates = sorted(date for date, counts in days if counts['completed'])
+            current_streak, longest_streak = _streaks(completed_dates)
+            user_rows.append({
+                'user_id': key,
+                **totals,
+                'current_streak': current_streak,
+                'longest_streak': longest_streak,
+                'last_completed_date': completed_dates[-1] if completed_dates else None
+            })
+
+        UserDailyStats.query.filter(UserDailyStats.user_id.between(start, end)).delete(synchronize_session=False)
+        UserStats.query.filter(UserStats.user_id.between(start, end)).delete(synchronize_session=False)
+        db.session.bulk_insert_mappings(UserDailyStats, daily_rows)
+        db.session.bulk_insert_mappings(UserStats, user_rows)
+        db.session.commit()
+        log(f'사용자 통계 재계산: user_id {start}~{end}, {len(user_rows)}명')
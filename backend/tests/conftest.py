@@ -0,0 +1,109 @@
+"""
+pytest 공용 픽스처
+
+부하 테스트(benchmarks/load_test.py)와 같이 임시 SQLite 파일로 앱을 만들고 스키마 마이그레이션을 적용한다.
+Gemini 호출, 스케줄러, 요청 한도는 끄고 bcrypt cost는 낮춰서 실행한다.
+
+Usage:
+    cd backend && python -m pytest -q
+"""
+import os
+import sys
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from config import DevelopmentConfig  # noqa: E402
+from database import db  # noqa: E402
+from models.user import UserModel  # noqa: E402
+from services.schema_migrations import run_migrations  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    database_path = tmp_path_factory.mktemp('db') / 'test.db'
+    config_class = type('TestConfig', (DevelopmentConfig,), {
+        'DEBUG': False,
+        'TESTING': True,
+        'JWT_SECRET_KEY': 'test-jwt-secret-key-of-at-least-32-bytes',
+        'SQLALCHEMY_ECHO': False,
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database_path}',
+        # 여러 스레드가 같은 파일에 쓰므로 잠금 대기 시간을 늘림
+        'SQLALCHEMY_ENGINE_OPTIONS': {'connect_args': {'timeout': 30}},
+        'GEMINI_API_KEY': None,
+        'MISSION_GENERATION_BACKOFF_SECONDS': 0,
+        'RUN_SCHEDULER': False,
+        'RATE_LIMIT_ENABLED': False,
+        'BCRYPT_LOG_ROUNDS': 4,
+        'PASSWORD_HASH_WORKERS': 0,
+        'SLOW_QUERY_THRESHOLD_MS': 10 ** 6,
+    })
+    app = create_app(config_class, start_scheduler=False)
+    with app.app_context():
+        run_migrations(log=lambda message: None)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def app_context(app):
+    with app.app_context():
+        yield
+        db.session.remove()
+
+
+@pytest.fixture
+def count_queries(app):
+    """
+    블록 안에서 실행된 SQL 문을 기록하는 컨텍스트 매니저 (before_cursor_execute 이벤트)
+
+    Usage:
+        with count_queries() as statements:
+            client.get('/api/missions/records')
+        assert len(statements) == 2
+    """
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return counter
+
+
+@pytest.fixture
+def register_user(app, client):
+    """새 사용자를 가입시키고 로그인하여 (user_id, 인증 헤더)를 반환"""
+    def register(username=None):
+        username = username or f'user_{uuid.uuid4().hex[:12]}'
+        password = 'test-password'
+        response = client.post('/api/auth/register', json={
+            'username': username, 'email': f'{username}@example.com', 'password': password
+        })
+        assert response.status_code == 201, response.get_json()
+
+        response = client.post('/api/auth/login', json={'username': username, 'password': password})
+        assert response.status_code == 200, response.get_json()
+        headers = {'Authorization': f'Bearer {response.get_json()["access_token"]}'}
+
+        with app.app_context():
+            user_id = UserModel.query.filter_by(username=username).one().id
+        return user_id, headers
+    return register
@@ -0,0 +1,102 @@
+import json
+import time
+from datetime import date
+
+import pytest
+
+from services.ai_mission_generator import AIMissionGenerator, generate_and_save_daily_missions
+from services.fallback_missions import FALLBACK_MISSION_POOL
+
+
+class FakeChunk:
+    def __init__(self, text):
+        self._text = text
+
+    @property
+    def text(self):
+        if self._text is None:
+            # 텍스트 없이 종료 사유만 담긴 청크
+            raise ValueError('no text')
+        return self._text
+
+
+class FakeModel:
+    """
+    google-generativeai 0.3.2 GenerativeModel.generate_content와 같은 시그니처의 가짜 모델
+
+    responses의 각 응답(JSON 문자열)을 chunk_size 글자씩 잘라 스트리밍한다.
+    """
+
+    def __init__(self, responses, chunk_size=7, delay=0.0):
+        self.responses = list(responses)
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.prompts = []
+
+    def generate_content(self, contents, *, generation_config=None, safety_settings=None, stream=False):
+        self.prompts.append(contents)
+        time.sleep(self.delay)
+        text = self.responses.pop(0)
+        if not stream:
+            return FakeChunk(text)
+        chunks = [FakeChunk(text[start:start + self.chunk_size]) for start in range(0, len(text), self.chunk_size)]
+        return iter(chunks + [FakeChunk(None)])
+
+
+def _missions(counts=None):
+    counts = counts or {'bronze': 5, 'silver': 5, 'gold': 3}
+    return {tier: [dict(mission) for mission in FALLBACK_MISSION_POOL[tier][:count]] for tier, count in counts.items()}
+
+
+def test_streamed_response_fills_all_slots_without_request_options():
+    model = FakeModel([json.dumps(_missions(), ensure_ascii=False)])
+
+    missions = AIMissionGenerator(model=model).generate_daily_missions(timeout=5)
+
+    assert {tier: len(items) for tier, items in missions.items()} == {'bronze': 5, 'silver': 5, 'gold': 3}
+    assert len(model.prompts) == 1
+
+
+def test_invalid_slots_are_repaired_with_a_second_request():
+    first = _missions()
+    first['gold'][2] = dict(first['gold'][2], duration=5)  # gold 범위(20~40)를 벗어남
+    repair = {'gold': [dict(FALLBACK_MISSION_POOL['gold'][3])]}
+    model = FakeModel([json.dumps(first, ensure_ascii=False), json.dumps(repair, ensure_ascii=False)])
+
+    missions = AIMissionGenerator(model=model).generate_daily_missions(timeout=5)
+
+    assert [mission['title'] for mission in missions['gold']] == [
+        mission['title'] for mission in FALLBACK_MISSION_POOL['gold'][:2] + FALLBACK_MISSION_POOL['gold'][3:4]
+    ]
+    assert len(model.prompts) == 2
+    assert 'gold 미션 1개' in model.prompts[1]
+
+
+def test_slow_model_times_out():
+    model = FakeModel([json.dumps(_missions(), ensure_ascii=False)], delay=1.0)
+
+    with pytest.raises(Exception, match='초 안에 끝나지 않았습니다'):
+        AIMissionGenerator(model=model).generate_daily_missions(timeout=0.1)
+
+
+def test_generate_and_save_uses_model_then_falls_back(app_context):
+    model = FakeModel([json.dumps(_missions(), ensure_ascii=False)])
+    assert generate_and_save_daily_missions(date(2031, 1, 1), generator=AIMissionGenerator(model=model)) == 'ai'
+    assert generate_and_save_daily_missions(date(2031, 1, 1), generator=AIMissionGenerator(model=model)) == 'existing'
+
+    # 재시도(3회) x 슬롯 보완 요청(최대 3번)이 모두 실패하면 미션 풀을 사용
+    broken = FakeModel(['not json'] * 9)
+    assert generate_and_save_daily_missions(date(2031, 1, 2), generator=AIMissionGenerator(model=broken)) == 'fallback'
+
+
+def test_titles_from_the_previous_day_are_repaired():
+    previous = [dict(FALLBACK_MISSION_POOL['bronze'][0])]
+    repair = {'bronze': [dict(FALLBACK_MISSION_POOL['bronze'][5])]}
+    model = FakeModel([json.dumps(_missions(), ensure_ascii=False), json.dumps(repair, ensure_ascii=False)])
+
+    missions = AIMissionGenerator(model=model).generate_daily_missions(previous_missions=previous, timeout=5)
+
+    titles = [mission['title'] for mission in missions['bronze']]
+    assert previous[0]['title'] not in titles
+    assert titles[-1] == FALLBACK_MISSION_POOL['bronze'][5]['title']
+    assert len(model.prompts) == 2
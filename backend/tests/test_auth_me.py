@@ -0,0 +1,30 @@
+from flask_jwt_extended import decode_token
+
+from database import db
+from models.user import UserModel
+
+
+def test_me_reflects_profile_changes_and_deletion(app, client, register_user):
+    user_id, headers = register_user()
+
+    response = client.get('/api/auth/me', headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()['email'].endswith('@example.com')
+
+    with app.app_context():
+        claims = decode_token(headers['Authorization'].split()[1])
+        assert 'email' not in claims
+        assert 'username' in claims
+
+        user = db.session.get(UserModel, user_id)
+        user.username = f'renamed_{user_id}'
+        db.session.commit()
+
+    # 캐시된 프로필이 무효화되어 토큰 발급 이후의 변경이 보인다
+    assert client.get('/api/auth/me', headers=headers).get_json()['username'] == f'renamed_{user_id}'
+
+    with app.app_context():
+        db.session.delete(db.session.get(UserModel, user_id))
+        db.session.commit()
+
+    assert client.get('/api/auth/me', headers=headers).status_code == 404
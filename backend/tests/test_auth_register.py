@@ -0,0 +1,57 @@
+import threading
+import uuid
+
+from sqlalchemy.exc import IntegrityError
+
+from database import db
+
+
+def test_concurrent_registration_creates_one_user(app):
+    username = f'race_{uuid.uuid4().hex[:12]}'
+    barrier = threading.Barrier(2)
+    results = []
+
+    def register(email):
+        client = app.test_client()
+        barrier.wait()
+        response = client.post('/api/auth/register', json={
+            'username': username, 'email': email, 'password': 'test-password'
+        })
+        results.append((response.status_code, response.get_json()['message']))
+
+    threads = [
+        threading.Thread(target=register, args=(f'{username}_{index}@example.com',))
+        for index in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 사전 중복 조회 없이 유니크 키 위반 하나만 409로 변환된다
+    assert sorted(status for status, _ in results) == [201, 409]
+    assert '이미 존재하는 사용자명입니다.' in [message for _, message in results]
+
+
+def test_duplicate_email_is_reported(client):
+    username = f'dup_{uuid.uuid4().hex[:12]}'
+    payload = {'username': username, 'email': f'{username}@example.com', 'password': 'test-password'}
+    assert client.post('/api/auth/register', json=payload).status_code == 201
+
+    response = client.post('/api/auth/register', json=dict(payload, username=f'{username}_2'))
+    assert response.status_code == 409
+    assert response.get_json()['message'] == '이미 존재하는 이메일입니다.'
+
+
+def test_other_constraint_failures_are_not_reported_as_duplicates(client, monkeypatch):
+    def commit():
+        raise IntegrityError('INSERT INTO users ...', {}, Exception('NOT NULL constraint failed: users.created_at'))
+
+    monkeypatch.setattr(db.session, 'commit', commit)
+    username = f'other_{uuid.uuid4().hex[:12]}'
+    response = client.post('/api/auth/register', json={
+        'username': username, 'email': f'{username}@example.com', 'password': 'test-password'
+    })
+
+    assert response.status_code == 500
+    assert response.get_json()['message'] == '회원가입 중 오류가 발생했습니다.'
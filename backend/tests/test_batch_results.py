@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime
+
+from database import db
+from models.mission import MissionRecord
+from services.completion_index import get_completed_mask, preset_bit
+
+
+def _item(**fields):
+    return dict({'client_id': uuid.uuid4().hex, 'type': 'complete', 'preset_mission_id': 1,
+                 'tier': 'bronze', 'duration': 5}, **fields)
+
+
+def test_batch_normalizes_offsets_and_marks_todays_bitmap(app, client, register_user):
+    user_id, headers = register_user()
+    item = _item(preset_mission_id=4, completed_at='2024-01-01T09:00:00+09:00')
+
+    response = client.post('/api/missions/presets/batch', json={'results': [item]}, headers=headers)
+    assert response.status_code == 201
+    assert response.get_json()['created'] == [item['client_id']]
+
+    with app.app_context():
+        record = MissionRecord.query.filter_by(client_id=item['client_id']).one()
+        assert record.completed_at == datetime(2024, 1, 1, 0, 0)
+        # 완료 시각이 과거여도 단건 완료와 같이 받은 날의 비트맵에 표시
+        assert get_completed_mask(user_id, datetime.now().date()) & preset_bit(4)
+        db.session.remove()
+
+
+def test_batch_rejects_unknown_preset_ids(client, register_user):
+    _, headers = register_user()
+    items = [_item(), _item(preset_mission_id=99), _item(preset_mission_id='3')]
+
+    response = client.post('/api/missions/presets/batch', json={'results': items}, headers=headers)
+    assert response.status_code == 400
+    assert sorted(response.get_json()['errors']) == ['1', '2']
+
+
+def test_batch_rejects_out_of_range_tiers_and_durations(client, register_user):
+    _, headers = register_user()
+    items = [_item(tier='platinum'), _item(tier='gold', duration=5), _item(tier=None), _item(type='fail', duration=999)]
+
+    response = client.post('/api/missions/presets/batch', json={'results': items}, headers=headers)
+    assert response.status_code == 400
+    assert sorted(response.get_json()['errors']) == ['0', '1', '2']
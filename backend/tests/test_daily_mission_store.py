@@ -0,0 +1,29 @@
+from datetime import date
+
+from sqlalchemy import inspect, text
+
+from database import db
+from models.daily_mission import DailyMission
+from services.daily_mission_store import load_daily_mission_list, migrate_wide_daily_missions
+
+
+def test_partially_migrated_wide_columns_keep_their_slots(app_context):
+    # 이전 실행이 중단되어 bronze 1번과 gold 3번 슬롯 컬럼만 남은 daily_missions
+    columns = [f'{slot}_{field}' for slot in ('bronze_1', 'gold_3') for field in ('title', 'description', 'duration')]
+    for column in columns:
+        ddl = 'INTEGER' if column.endswith('duration') else 'VARCHAR(100)'
+        db.session.execute(text(f'ALTER TABLE daily_missions ADD COLUMN {column} {ddl}'))
+    db.session.add(DailyMission(date=date(2035, 1, 1)))
+    db.session.commit()
+    db.session.execute(text(
+        'UPDATE daily_missions SET bronze_1_title = :title, bronze_1_description = :title, bronze_1_duration = 3, '
+        'gold_3_title = :gold, gold_3_description = :gold, gold_3_duration = 20 WHERE date = :date'
+    ), {'title': '물 마시기', 'gold': '산책', 'date': date(2035, 1, 1)})
+    db.session.commit()
+
+    migrate_wide_daily_missions(log=lambda message: None)
+
+    missions = load_daily_mission_list(date(2035, 1, 1))
+    assert [(mission['id'], mission['title']) for mission in missions] == [(1, '물 마시기'), (13, '산책')]
+    remaining = {column['name'] for column in inspect(db.engine).get_columns('daily_missions')}
+    assert not remaining & set(columns)
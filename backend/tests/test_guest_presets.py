@@ -0,0 +1,80 @@
+import uuid
+from datetime import date, datetime
+
+import pytest
+
+from database import db
+from models.daily_mission import DailyMission
+from services.ai_mission_generator import generate_and_save_daily_missions
+from services.fallback_missions import pick_fallback_missions
+
+
+class PoolGenerator:
+    def generate_with_retry(self, previous_missions=None, **kwargs):
+        return pick_fallback_missions(date.today(), previous_missions)
+
+
+@pytest.fixture
+def todays_missions(app):
+    with app.app_context():
+        if db.session.get(DailyMission, datetime.now().date()) is None:
+            generate_and_save_daily_missions(datetime.now().date(), generator=PoolGenerator())
+
+
+def _preset_ids(client, headers):
+    response = client.get('/api/missions/presets', headers=headers)
+    assert response.status_code == 200
+    return {mission['id'] for mission in response.get_json()['missions']}
+
+
+def test_guest_completions_are_tracked_per_device_and_claimed_at_login(client, register_user, todays_missions):
+    guest = {'X-Guest-Id': str(uuid.uuid4())}
+    other_guest = {'X-Guest-Id': str(uuid.uuid4())}
+
+    response = client.post('/api/missions/presets/complete', headers=guest, json={
+        'preset_mission_id': 2, 'tier': 'bronze', 'duration': 5
+    })
+    assert response.status_code == 201
+
+    # 완료한 기기에서만 숨겨지고 다른 게스트에게는 그대로 보인다
+    assert 2 not in _preset_ids(client, guest)
+    assert 2 in _preset_ids(client, other_guest)
+
+    # 로그인하면 게스트 기록과 비트맵이 계정으로 옮겨진다
+    username = f'guest_{uuid.uuid4().hex[:12]}'
+    _, headers = register_user(username)
+    response = client.post('/api/auth/login', headers=guest, json={'username': username, 'password': 'test-password'})
+    assert response.get_json()['claimed_records'] == 1
+
+    assert 2 not in _preset_ids(client, headers)
+    assert 2 in _preset_ids(client, guest)
+
+
+def test_rows_claimed_by_a_concurrent_login_are_not_counted_twice(app, client, register_user, monkeypatch):
+    from models.mission import MissionRecord
+    from services import guest_claim
+    from services.medal_tally import get_medals
+
+    guest_id = str(uuid.uuid4())
+    response = client.post('/api/missions/presets/complete', headers={'X-Guest-Id': guest_id}, json={
+        'preset_mission_id': 3, 'tier': 'gold', 'duration': 20
+    })
+    assert response.status_code == 201
+    user_id, _ = register_user()
+
+    lock_unclaimed_rows = guest_claim._lock_unclaimed_rows
+
+    def claimed_by_other_login(record_ids):
+        rows = lock_unclaimed_rows(record_ids)
+        # 행 잠금이 없는 SQLite에서 조회와 UPDATE 사이에 다른 로그인이 먼저 옮긴 상황
+        with db.engine.begin() as connection:
+            connection.execute(
+                MissionRecord.__table__.update().where(MissionRecord.id.in_(record_ids)).values(user_id=user_id)
+            )
+        return rows
+
+    monkeypatch.setattr(guest_claim, '_lock_unclaimed_rows', claimed_by_other_login)
+    with app.app_context():
+        assert guest_claim.claim_guest_records(user_id, guest_id) == 0
+        assert get_medals(user_id)['gold'] == 0
+        db.session.remove()
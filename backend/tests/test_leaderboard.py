@@ -0,0 +1,63 @@
+import pytest
+
+from services.leaderboard import MEDAL_POINTS, LocalSortedSet, leaderboard
+from services.medal_tally import TIER_DURATION_RANGES
+
+
+def _complete(client, headers, tier):
+    response = client.post('/api/missions/presets/complete', headers=headers, json={
+        'preset_mission_id': 1, 'tier': tier, 'duration': TIER_DURATION_RANGES[tier][0]
+    })
+    assert response.status_code == 201
+
+
+def _scores(client, headers):
+    return {
+        period: client.get(f'/api/missions/leaderboard?period={period}', headers=headers).get_json()['me']
+        for period in ('weekly', 'all')
+    }
+
+
+@pytest.mark.parametrize('loaded', [True, False])
+def test_one_completion_adds_its_points_once(app, client, register_user, monkeypatch, loaded):
+    _, headers = register_user()
+    # 주가 바뀌었거나 아직 채우지 않은 워커는 완료 기록 반영 시 집계 테이블에서 다시 채운다
+    monkeypatch.setattr(leaderboard, '_loaded_week', None)
+    if loaded:
+        # 앱 시작 시와 같이 미리 채운 워커
+        with app.app_context():
+            leaderboard.load()
+
+    _complete(client, headers, 'gold')
+
+    scores = _scores(client, headers)
+    assert scores['weekly']['score'] == MEDAL_POINTS['gold']
+    assert scores['all']['score'] == MEDAL_POINTS['gold']
+
+    _complete(client, headers, 'silver')
+    assert _scores(client, headers)['all']['score'] == MEDAL_POINTS['gold'] + MEDAL_POINTS['silver']
+
+
+def test_load_skips_missing_tally_table(app, monkeypatch, caplog):
+    # 마이그레이션 전 새 DB: 경고 없이 건너뛰고 첫 조회 때 채운다
+    monkeypatch.setattr(leaderboard, '_loaded_week', None)
+    monkeypatch.setattr('services.leaderboard.inspect', lambda engine: type('Inspector', (), {
+        'has_table': lambda self, name: False
+    })())
+
+    with app.app_context():
+        leaderboard.load()
+
+    assert leaderboard._loaded_week is None
+    assert '리더보드를 미리 채우지 못했습니다' not in caplog.text
+
+
+def test_local_sorted_set_orders_by_score_then_user_id():
+    board = LocalSortedSet()
+    board.replace({1: 5, 2: 3})
+    board.incr(3, 5)
+    board.incr(2, 4)
+
+    assert board.top(3) == [(2, 7), (1, 5), (3, 5)]
+    assert [board.rank(member) for member in (1, 2, 3, 4)] == [1, 0, 2, None]
+    assert board.score(2) == 7
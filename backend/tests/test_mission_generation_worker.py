@@ -0,0 +1,130 @@
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from database import db
+from models.job_lock import JobLock
+from models.mission_generation_job import MissionGenerationJob
+from services.ai_mission_generator import generation_time_limit
+from services.fallback_missions import pick_fallback_missions
+from services.job_lock import acquire_lock, release_lock, renew_lock
+from services.mission_generation_worker import MissionGenerationWorker
+
+
+class BlockingGenerator:
+    """release가 설정될 때까지 응답을 미루는 생성기"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def generate_with_retry(self, previous_missions=None, **kwargs):
+        self.release.wait(5)
+        return pick_fallback_missions(date(2032, 1, 1), previous_missions)
+
+
+def _wait_finished(app, worker, job_id):
+    for _ in range(100):
+        with app.app_context():
+            job = worker.get(job_id)
+        if job['status'] not in MissionGenerationWorker.ACTIVE_STATUSES:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f'작업이 끝나지 않았습니다: {job}')
+
+
+def test_job_state_is_shared_between_workers(app):
+    worker = MissionGenerationWorker()
+    worker.init_app(app)
+    # 다른 프로세스의 워커 (작업 상태를 메모리에 공유하지 않음)
+    other_worker = MissionGenerationWorker()
+    other_worker.init_app(app)
+
+    generator = BlockingGenerator()
+    job = worker.submit(date(2032, 1, 1), generator=generator)
+    assert job['status'] == 'queued'
+
+    # 진행 중인 같은 날짜 작업은 어느 워커에서 등록해도 기존 작업으로 합쳐진다
+    collapsed = other_worker.submit(date(2032, 1, 1), generator=generator)
+    assert collapsed['collapsed'] is True
+    assert collapsed['id'] == job['id']
+
+    generator.release.set()
+    finished = _wait_finished(app, other_worker, job['id'])
+    assert finished['status'] == 'succeeded'
+    assert finished['result'] == {'2032-01-01': 'ai'}
+    assert finished['finished_at'] is not None
+
+    with app.app_context():
+        assert other_worker.get('missing') is None
+    worker.shutdown()
+    other_worker.shutdown()
+
+
+def test_generation_job_endpoint(client):
+    response = client.get('/api/missions/generate-daily/missing')
+    assert response.status_code == 404
+
+
+def test_concurrent_submits_start_one_job(app):
+    worker = MissionGenerationWorker()
+    worker.init_app(app)
+    generator = BlockingGenerator()
+    barrier = threading.Barrier(4)
+    jobs = []
+
+    def submit():
+        barrier.wait()
+        jobs.append(worker.submit(date(2033, 1, 1), generator=generator))
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({job['id'] for job in jobs}) == 1
+    assert [job.get('collapsed', False) for job in jobs].count(False) == 1
+
+    generator.release.set()
+    assert _wait_finished(app, worker, jobs[0]['id'])['status'] == 'succeeded'
+    worker.shutdown()
+
+
+def test_stale_job_is_replaced(app):
+    worker = MissionGenerationWorker()
+    worker.init_app(app)
+    stale_at = datetime.utcnow() - timedelta(days=1)
+    with app.app_context():
+        db.session.add(MissionGenerationJob(
+            id=uuid.uuid4().hex, date=date(2034, 1, 1), status='running',
+            created_at=stale_at, active_date=date(2034, 1, 1), heartbeat_at=stale_at
+        ))
+        db.session.commit()
+
+    generator = BlockingGenerator()
+    job = worker.submit(date(2034, 1, 1), generator=generator)
+    assert 'collapsed' not in job
+    generator.release.set()
+    assert _wait_finished(app, worker, job['id'])['status'] == 'succeeded'
+    with app.app_context():
+        assert MissionGenerationJob.query.filter_by(date=date(2034, 1, 1), status='failed').count() == 1
+    worker.shutdown()
+
+
+def test_lock_ttl_covers_one_date_and_can_be_renewed(app):
+    worker = MissionGenerationWorker()
+    worker.init_app(app)
+    config = app.config
+    assert worker._lock_ttl() >= generation_time_limit(
+        config['MISSION_GENERATION_MAX_ATTEMPTS'], config['MISSION_GENERATION_TIMEOUT'],
+        config['MISSION_GENERATION_BACKOFF_SECONDS']
+    )
+
+    with app.app_context():
+        owner = acquire_lock('renew-test', 1)
+        assert renew_lock('renew-test', owner, 600)
+        assert db.session.get(JobLock, 'renew-test').locked_until > datetime.utcnow() + timedelta(seconds=500)
+        # 만료되어 다른 프로세스가 가져간 잠금은 연장하지 못한다
+        assert not renew_lock('renew-test', 'someone-else', 600)
+        release_lock('renew-test', owner)
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import db
+from models.mission import MissionRecord
+from utils.pagination import InvalidCursorError, decode_cursor, encode_cursor, keyset_paginate
+
+USER_ID = 900001
+
+
+def _seed_records():
+    base = datetime(2024, 1, 1)
+    records = [
+        MissionRecord(user_id=USER_ID, actual_duration=60, completed_at=base + timedelta(minutes=index))
+        for index in range(5)
+    ]
+    records += [MissionRecord(user_id=USER_ID, actual_duration=60) for _ in range(3)]
+    db.session.add_all(records)
+    db.session.flush()
+    # 기본값(utcnow)이 들어가지 않도록 INSERT 후 NULL로 바꾼다
+    for record in records[5:]:
+        record.completed_at = None
+    db.session.commit()
+    return [record.id for record in records]
+
+
+def test_cursor_round_trip_with_null_sort_value():
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+    assert decode_cursor(encode_cursor(datetime(2024, 1, 1, 9, 30), 3)) == (datetime(2024, 1, 1, 9, 30), 3)
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor('not-a-cursor')
+
+
+def test_keyset_paginate_walks_past_null_sort_values(app_context):
+    ids = _seed_records()
+    query = MissionRecord.query.filter(MissionRecord.user_id == USER_ID)
+
+    seen = []
+    cursor = None
+    while True:
+        rows, cursor = keyset_paginate(query, MissionRecord.completed_at, MissionRecord.id, cursor=cursor, limit=3)
+        seen += [row.id for row in rows]
+        if cursor is None:
+            break
+
+    # 완료 시각 내림차순 다음 NULL 행이 id 내림차순으로 이어지며, 누락/중복 없이 모두 조회된다
+    assert seen == list(reversed(ids[:5])) + list(reversed(ids[5:]))
@@ -0,0 +1,40 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from services.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher()
+    hasher.init_app(SimpleNamespace(config={
+        'BCRYPT_LOG_ROUNDS': 4,
+        'PASSWORD_HASH_TIMEOUT': 0.2,
+        'PASSWORD_HASH_WORKERS': 1,
+        'PASSWORD_HASH_MAX_QUEUE': 0,
+    }))
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hash_and_check_in_process_pool(hasher):
+    password_hash = hasher.generate_password_hash('secret')
+    assert hasher.check_password_hash(password_hash, 'secret')
+    assert not hasher.check_password_hash(password_hash, 'wrong')
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes(hasher):
+    # 풀을 미리 띄워 두어 프로세스 시작 시간이 제한 시간에 포함되지 않도록 함
+    hasher.generate_password_hash('warmup')
+
+    with pytest.raises(PasswordHasherBusyError):
+        hasher._run(time.sleep, 1.0)
+
+    # 시간 초과된 작업이 아직 풀에서 실행 중이므로 대기열 한도(1)가 찬 상태
+    with pytest.raises(PasswordHasherBusyError):
+        hasher.generate_password_hash('secret')
+
+    time.sleep(1.2)
+    assert hasher.check_password_hash(hasher.generate_password_hash('secret'), 'secret')
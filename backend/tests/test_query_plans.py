@@ -0,0 +1,16 @@
+from services.query_plans import check_query_plans, endpoint_queries, explain
+
+
+def test_batch_client_id_lookup_expands_in_parameters(app_context):
+    steps, full_scans = explain(endpoint_queries()['POST /presets/batch'])
+
+    assert steps
+    assert full_scans == []
+
+
+def test_endpoint_queries_do_not_scan_mission_records(app_context):
+    logs = []
+
+    failures = check_query_plans(log=logs.append)
+
+    assert failures == [], '\n'.join(logs)
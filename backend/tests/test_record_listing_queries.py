@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import db
+from models.mission import Mission, MissionRecord
+
+USER_ID = 900101
+
+
+@pytest.fixture(scope='module')
+def seeded_records(app):
+    """연관 미션이 있는 커스텀 기록과 프리셋 기록을 한 페이지 이상 채운다"""
+    with app.app_context():
+        # 다른 테스트의 기록보다 항상 앞에 오도록 먼 미래 시각으로 저장 (/records는 전체 기록 목록)
+        base = datetime(2099, 1, 1)
+        for index in range(25):
+            mission = Mission(title=f'mission {index}', duration=10)
+            db.session.add(mission)
+            db.session.add(MissionRecord(
+                mission=mission, actual_duration=600, completed_at=base + timedelta(seconds=index)
+            ))
+            db.session.add(MissionRecord(
+                user_id=USER_ID, preset_mission_id=index % 13 + 1, tier='gold', title=f'preset {index}',
+                actual_duration=600, completed_at=base + timedelta(seconds=index)
+            ))
+        db.session.commit()
+
+
+@pytest.mark.parametrize('first_page', [True, False])
+def test_record_listing_query_count_does_not_grow_with_page_size(client, count_queries, seeded_records, first_page):
+    params = {}
+    if not first_page:
+        params['cursor'] = client.get('/api/missions/records?limit=1').get_json()['next_cursor']
+
+    counts = []
+    for limit in (2, 20):
+        with count_queries() as statements:
+            response = client.get('/api/missions/records', query_string=dict(params, limit=limit))
+        assert response.status_code == 200
+        records = response.get_json()['records']
+        assert len(records) == limit
+        assert all(record['mission'] is not None for record in records if record['mission_id'])
+        counts.append(len(statements))
+
+    # 기록 페이지 1번 + 연관 미션 selectinload 1번, 행 수와 무관
+    assert counts == [2, 2]
+
+
+def test_preset_listings_use_single_projected_query(app, client, count_queries, seeded_records):
+    from flask_jwt_extended import create_access_token
+
+    with app.app_context():
+        headers = {'Authorization': f'Bearer {create_access_token(identity=str(USER_ID))}'}
+
+    for path in ('/api/missions/recent', '/api/missions/by-tier/gold'):
+        for limit in (2, 20):
+            with count_queries() as statements:
+                response = client.get(f'{path}?limit={limit}', headers=headers)
+            assert response.status_code == 200
+            assert len(response.get_json()['missions']) == limit
+            assert len(statements) == 1, statements
@@ -0,0 +1,99 @@
+import json
+import uuid
+
+from services import record_transfer
+from services.leaderboard import MEDAL_POINTS
+
+
+def _ndjson(rows):
+    return '\n'.join(json.dumps(row) for row in rows) + '\n'
+
+
+def _import(client, headers, rows):
+    return client.post('/api/missions/records/import', data=_ndjson(rows),
+                       content_type='application/x-ndjson', headers=headers)
+
+
+def test_import_is_scoped_to_caller_and_skips_duplicate_client_ids(client, register_user):
+    user_id, headers = register_user()
+    other_user_id, other_headers = register_user()
+    prefix = uuid.uuid4().hex[:8]
+    rows = [
+        {'user_id': other_user_id, 'guest_id': 'someone-else', 'preset_mission_id': 1, 'tier': 'gold',
+         'completed_at': '2024-01-01T00:00:00', 'actual_duration': 20, 'client_id': f'{prefix}-1'},
+        {'preset_mission_id': 2, 'tier': 'bronze', 'completed_at': '2024-01-02T00:00:00',
+         'actual_duration': 5, 'client_id': f'{prefix}-2'},
+        # 파일 안에서 반복된 client_id
+        {'preset_mission_id': 2, 'tier': 'bronze', 'actual_duration': 5, 'client_id': f'{prefix}-2'},
+        {'preset_mission_id': 3, 'tier': 'silver', 'completed_at': '2024-01-03T00:00:00', 'actual_duration': 10},
+    ]
+
+    response = _import(client, headers, rows)
+    assert response.status_code == 201
+    assert response.get_json() == {'imported': 3, 'skipped': 1}
+
+    # 같은 파일을 다시 가져오면 client_id가 있는 행은 건너뛴다
+    response = _import(client, headers, rows[:2])
+    assert response.get_json() == {'imported': 0, 'skipped': 2}
+
+    exported = client.get('/api/missions/records/export', headers=headers)
+    assert exported.status_code == 200
+    records = [json.loads(line) for line in exported.get_data(as_text=True).splitlines()]
+    assert [record['preset_mission_id'] for record in records] == [1, 2, 3]
+    assert all('guest_id' not in record and record['client_id'] for record in records)
+
+    # 내보낸 파일을 그대로 다시 가져와도 (client_id 없이 저장된 기록 포함) 중복 저장되지 않는다
+    response = _import(client, headers, records)
+    assert response.get_json() == {'imported': 0, 'skipped': 3}
+
+    other_export = client.get('/api/missions/records/export?format=csv', headers=other_headers)
+    assert other_export.get_data(as_text=True).splitlines()[1:] == []
+
+
+def test_import_updates_medals_stats_and_leaderboard(client, register_user):
+    _, headers = register_user()
+    rows = [
+        {'preset_mission_id': 1, 'tier': 'gold', 'actual_duration': 20},
+        {'preset_mission_id': 2, 'tier': 'bronze', 'actual_duration': 0, 'notes': 'failed'},
+    ]
+
+    assert _import(client, headers, rows).status_code == 201
+
+    assert client.get('/api/missions/medals', headers=headers).get_json()['medals'] == {
+        'bronze': 0, 'silver': 0, 'gold': 1
+    }
+    stats = client.get('/api/missions/stats', headers=headers).get_json()['stats']
+    assert (stats['completed'], stats['failed'], stats['focus_minutes']) == (1, 1, 20)
+    me = client.get('/api/missions/leaderboard?period=all', headers=headers).get_json()['me']
+    assert me['score'] == MEDAL_POINTS['gold']
+
+
+def test_invalid_rows_reject_the_whole_import(client, register_user, monkeypatch):
+    _, headers = register_user()
+    # 잘못된 행 전에 저장된 청크도 함께 되돌려지는지 확인
+    monkeypatch.setattr(record_transfer, 'IMPORT_CHUNK_SIZE', 1)
+    valid = {'preset_mission_id': 1, 'tier': 'gold', 'actual_duration': 20}
+
+    for invalid in (
+        {'preset_mission_id': 2, 'tier': 'platinum', 'actual_duration': 20},
+        {'preset_mission_id': 2, 'tier': 'gold', 'actual_duration': 100000},
+        {'preset_mission_id': 2, 'actual_duration': 20},
+    ):
+        response = _import(client, headers, [valid, invalid])
+        assert response.status_code == 400
+
+    exported = client.get('/api/missions/records/export', headers=headers)
+    assert exported.get_data(as_text=True) == ''
+
+
+def test_export_requires_login(client):
+    assert client.get('/api/missions/records/export').status_code == 401
+
+
+def test_import_rejects_non_object_rows(client, register_user):
+    _, headers = register_user()
+
+    for body in ('[1]\n', '{"preset_mission_id": 1}\nnot json\n'):
+        response = client.post('/api/missions/records/import', data=body,
+                               content_type='application/x-ndjson', headers=headers)
+        assert response.status_code == 400
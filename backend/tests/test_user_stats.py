@@ -0,0 +1,74 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import db
+from models.mission import MissionRecord
+from models.user_stats import UserDailyStats, UserStats
+from services.completion_index import ANONYMOUS_USER_KEY
+from services.user_stats import get_user_stats, rebuild_user_stats, record_mission_results
+
+
+def test_anonymous_results_update_counters_without_streaks(app_context):
+    before = get_user_stats(None)
+    now = datetime.utcnow()
+
+    record_mission_results(None, [(now, 'gold', 30), (now, 'bronze', 0)])
+    record_mission_results(None, [(now, 'silver', 15)])
+    db.session.commit()
+
+    after = get_user_stats(None)
+    assert after['completed'] == before['completed'] + 2
+    assert after['failed'] == before['failed'] + 1
+    assert after['focus_minutes'] == before['focus_minutes'] + 45
+    assert after['tiers']['gold'] == before['tiers']['gold'] + 1
+    assert db.session.get(UserStats, ANONYMOUS_USER_KEY).current_streak == 0
+
+
+def test_guest_completion_updates_anonymous_bucket(client):
+    headers = {'X-Guest-Id': str(uuid.uuid4())}
+    before = client.get('/api/missions/stats', headers=headers).get_json()['stats']['completed']
+
+    response = client.post('/api/missions/presets/complete', headers=headers, json={
+        'preset_mission_id': 1, 'tier': 'bronze', 'duration': 5
+    })
+    assert response.status_code == 201
+    assert client.get('/api/missions/stats', headers=headers).get_json()['stats']['completed'] == before + 1
+
+
+@pytest.fixture
+def seoul_time(monkeypatch):
+    monkeypatch.setenv('TZ', 'Asia/Seoul')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_daily_stats_and_streaks_use_the_local_day(app_context, seoul_time):
+    user_id = 50000 + uuid.uuid4().int % 10000
+    # KST 08:00 완료는 UTC로는 전날 23:00
+    today = datetime.now().date()
+    morning = datetime.combine(today, datetime.min.time()).replace(hour=8) - timedelta(hours=9)
+    yesterday = morning - timedelta(days=1)
+
+    record_mission_results(user_id, [(yesterday, 'bronze', 5), (morning, 'bronze', 5)])
+    db.session.commit()
+
+    stats = get_user_stats(user_id)
+    assert stats['today']['completed'] == 1
+    assert stats['current_streak'] == 2
+    assert db.session.get(UserDailyStats, (user_id, today)).completed == 1
+
+
+def test_rebuild_buckets_by_local_day(app_context, seoul_time):
+    user_id = 50000 + uuid.uuid4().int % 10000
+    morning = datetime.combine(datetime.now().date(), datetime.min.time()).replace(hour=8) - timedelta(hours=9)
+    db.session.add(MissionRecord(user_id=user_id, tier='bronze', actual_duration=5, completed_at=morning))
+    db.session.commit()
+
+    rebuild_user_stats(log=lambda message: None)
+
+    assert db.session.get(UserDailyStats, (user_id, datetime.now().date())).completed == 1
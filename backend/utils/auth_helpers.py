@@ -1,6 +1,11 @@
+import re
+from flask import request
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
 from functools import wraps
 
+GUEST_ID_HEADER = 'X-Guest-Id'
+GUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9-]{8,36}$')
+
 def get_current_user_id(optional=True):
     """
     현재 요청의 JWT에서 사용자 ID를 추출
@@ -33,3 +38,13 @@ def jwt_optional(f):
         user_id = get_current_user_id(optional=True)
         return f(*args, user_id=user_id, **kwargs)
     return decorated_function
+
+
+def get_guest_id():
+    """
+    비로그인 기기가 X-Guest-Id 헤더로 보낸 게스트 id (UUID 형식), 없거나 형식이 다르면 None
+    """
+    guest_id = request.headers.get(GUEST_ID_HEADER)
+    if guest_id and GUEST_ID_PATTERN.match(guest_id):
+        return guest_id
+    return None
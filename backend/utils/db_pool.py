@@ -0,0 +1,62 @@
+import threading
+import time
+from sqlalchemy.pool import QueuePool
+
+
+class PoolWaitStats:
+    """커넥션 풀에서 커넥션을 얻기까지 기다린 시간 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, wait_seconds):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'total_wait_seconds': round(self.total_wait_seconds, 6),
+                'avg_wait_seconds': round(self.total_wait_seconds / self.checkouts, 6) if self.checkouts else 0.0,
+                'max_wait_seconds': round(self.max_wait_seconds, 6)
+            }
+
+
+pool_wait_stats = PoolWaitStats()
+
+
+class TimedQueuePool(QueuePool):
+    """커넥션 체크아웃 대기 시간을 pool_wait_stats에 기록하는 QueuePool"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_stats.record(time.perf_counter() - started)
+
+
+def pool_status(engine):
+    """
+    현재 풀 사용량과 체크아웃 대기 시간 통계
+
+    워커 수 x (pool_size + max_overflow)가 MySQL max_connections를 넘지 않도록
+    크기를 정할 때 참고한다.
+    """
+    pool = engine.pool
+    status = {'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': pool.overflow()
+        })
+    status['checkout_wait'] = pool_wait_stats.snapshot()
+    return status
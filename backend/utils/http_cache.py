@@ -0,0 +1,52 @@
+import hashlib
+import threading
+from flask import current_app, request
+
+MAX_CACHED_BODIES = 1024
+
+_bodies = {}
+_bodies_lock = threading.Lock()
+
+
+def _get_body(key, version, build_payload):
+    with _bodies_lock:
+        entry = _bodies.get(key)
+    if entry and entry[0] == version:
+        return entry[1], entry[2]
+
+    body = current_app.json.dumps(build_payload())
+    etag = hashlib.sha1(body.encode('utf-8')).hexdigest()
+
+    with _bodies_lock:
+        if len(_bodies) >= MAX_CACHED_BODIES:
+            _bodies.clear()
+        _bodies[key] = (version, body, etag)
+    return body, etag
+
+
+def conditional_json_response(key, version, build_payload, max_age=60):
+    """
+    데이터 버전별로 한 번만 직렬화/해시한 JSON 응답을 ETag와 함께 반환
+
+    같은 key의 version이 바뀌지 않으면 이전에 만든 본문과 ETag를 재사용하고,
+    If-None-Match가 일치하면 본문 없이 304를 반환한다.
+
+    Args:
+        key: 캐시 키 (예: ('daily', date))
+        version: 데이터 버전, 바뀌면 본문과 ETag를 다시 만든다
+        build_payload: 응답 데이터를 만드는 함수
+        max_age (int): Cache-Control max-age(초)
+    """
+    body, etag = _get_body(key, version, build_payload)
+
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    # CORS 응답의 Access-Control-Allow-Origin이 Origin마다 달라지므로 캐시도 Origin별로 분리
+    response.vary.add('Origin')
+    return response
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from sqlalchemy import func, text
+
+
+def local_date(utc_datetime):
+    """
+    naive UTC로 저장된 시각(completed_at 등)의 서버 로컬 날짜
+
+    오늘의 미션과 프리셋 완료 비트맵이 쓰는 datetime.now().date()와 같은 날짜 기준으로 맞춘다.
+    """
+    return utc_datetime.replace(tzinfo=timezone.utc).astimezone().date()
+
+
+def local_date_expression(column, dialect_name):
+    """SQL에서 naive UTC 컬럼을 서버 로컬 날짜로 변환하는 식 (현재 UTC 오프셋 기준)"""
+    offset = int(datetime.now().astimezone().utcoffset().total_seconds())
+    if dialect_name == 'mysql':
+        return func.date(func.timestampadd(text('SECOND'), offset, column))
+    return func.date(column, f'{offset:+d} seconds')
@@ -0,0 +1,113 @@
+import base64
+import json
+import threading
+import time
+from datetime import datetime
+from flask import request
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+TOTAL_CACHE_TTL_SECONDS = 60
+
+_total_cache = {}
+_total_cache_lock = threading.Lock()
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없는 페이지 커서"""
+
+
+def encode_cursor(sort_value, row_id):
+    # 정렬값이 NULL인 행은 null로 인코딩 (내림차순에서 NULL 행은 맨 뒤에 온다)
+    payload = json.dumps([sort_value.isoformat() if sort_value is not None else None, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return (datetime.fromisoformat(sort_value) if sort_value is not None else None), int(row_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise InvalidCursorError(cursor)
+
+
+def get_page_size(default=DEFAULT_PAGE_SIZE, param='limit'):
+    """쿼리 파라미터 limit(또는 param)을 1~MAX_PAGE_SIZE 범위로 제한"""
+    limit = request.args.get(param, default, type=int)
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def null_tail_query(query, sort_column, id_column):
+    """sort_column이 NULL인 행을 id 내림차순으로 읽는 쿼리 (내림차순 정렬에서 맨 뒤 구간)"""
+    return query.filter(sort_column.is_(None)).order_by(id_column.desc())
+
+
+def keyset_page_query(query, sort_column, id_column, after=None, limit=DEFAULT_PAGE_SIZE):
+    """
+    (sort_column, id_column) 내림차순으로 after 다음부터 limit + 1행을 읽는 쿼리
+
+    Args:
+        after (tuple): 직전 페이지 마지막 행의 (정렬값, id), 없으면 첫 페이지
+    """
+    if after is None:
+        return query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+    sort_value, row_id = after
+    if sort_value is None:
+        return null_tail_query(query, sort_column, id_column).filter(id_column < row_id).limit(limit + 1)
+
+    return query.filter(
+        tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+    ).order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def keyset_paginate(query, sort_column, id_column, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """
+    (sort_column, id_column) 내림차순 기준 커서 페이지네이션
+
+    OFFSET 없이 직전 페이지 마지막 행 이후부터 읽으므로 깊은 페이지도
+    첫 페이지와 같은 비용으로 조회된다. sort_column이 NULL인 행은 (MySQL/SQLite 내림차순과 같이)
+    맨 뒤에 id 내림차순으로 이어진다. 튜플 비교는 NULL을 제외하므로 NULL 구간은 따로 조회한다.
+
+    Args:
+        query: 필터가 적용된 쿼리
+        sort_column: 정렬 기준 컬럼 (예: MissionRecord.completed_at)
+        id_column: 동일 정렬값 간 순서를 정하는 고유 컬럼
+        cursor (str): 이전 응답의 next_cursor
+        limit (int): 페이지 크기
+
+    Returns:
+        tuple: (행 목록, 다음 페이지 커서 또는 None)
+    """
+    after = decode_cursor(cursor) if cursor else None
+    rows = keyset_page_query(query, sort_column, id_column, after, limit).all()
+
+    if after is not None and after[0] is not None and len(rows) <= limit:
+        # 정렬값이 있는 행을 모두 읽었으면 NULL 행으로 페이지를 채운다
+        rows += null_tail_query(query, sort_column, id_column).limit(limit + 1 - len(rows)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return rows, next_cursor
+
+
+def cached_total(key, query):
+    """
+    전체 개수를 TTL 동안 캐시하여 반환 (근사값)
+    """
+    now = time.monotonic()
+    with _total_cache_lock:
+        cached = _total_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+
+    total = query.count()
+    with _total_cache_lock:
+        _total_cache[key] = (total, now + TOTAL_CACHE_TTL_SECONDS)
+    return total
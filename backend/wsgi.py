@@ -0,0 +1,14 @@
+"""
+운영용 WSGI 엔트리포인트 (기본값: ProductionConfig)
+
+Usage:
+    RUN_SCHEDULER=0 gunicorn -w 4 -b 0.0.0.0:5001 wsgi:app
+    python run_scheduler.py
+
+APP_CONFIG 환경변수로 config.py의 설정 이름(development/production)을 바꿀 수 있다.
+"""
+import os
+from app import create_app
+from config import config
+
+app = create_app(config[os.environ.get('APP_CONFIG', 'production')])
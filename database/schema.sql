@@ -11,8 +11,7 @@ CREATE TABLE IF NOT EXISTS users (
     username VARCHAR(80) UNIQUE NOT NULL,
     email VARCHAR(120) UNIQUE NOT NULL,
     password_hash VARCHAR(128) NOT NULL,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    INDEX idx_username (username)
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- 스크린타임 테이블
@@ -37,17 +36,138 @@ CREATE TABLE IF NOT EXISTS missions (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
--- 미션 기록 테이블
+-- 미션 기록 테이블 (user_id/guest_id가 모두 NULL이면 게스트 id 없이 남은 비로그인 기록)
 CREATE TABLE IF NOT EXISTS mission_records (
     id INT AUTO_INCREMENT PRIMARY KEY,
-    mission_id INT NOT NULL,
+    user_id INT NULL,
+    mission_id INT NULL,
+    preset_mission_id INT NULL COMMENT '오늘의 미션 슬롯 번호',
+    tier VARCHAR(20) NULL,
+    title VARCHAR(100) NULL,
+    description TEXT NULL,
     completed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    actual_duration INT COMMENT '실제 소요 시간 (분)',
+    actual_duration INT COMMENT '실제 소요 시간 (분), 0이면 실패',
     notes TEXT,
-    INDEX idx_completed_at (completed_at),
+    client_id VARCHAR(64) NULL COMMENT '오프라인 일괄 전송 중복 방지용 id',
+    guest_id VARCHAR(36) NULL COMMENT '비로그인 기기의 게스트 id',
+    UNIQUE KEY uq_mission_records_client_id (client_id),
+    INDEX ix_mission_records_completed_at (completed_at),
+    INDEX ix_mission_records_user_completed_at (user_id, completed_at),
+    INDEX ix_mission_records_user_tier_completed_at (user_id, tier, completed_at),
+    INDEX ix_mission_records_guest_id (guest_id),
+    FOREIGN KEY (user_id) REFERENCES users(id),
     FOREIGN KEY (mission_id) REFERENCES missions(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- 오늘의 미션 (날짜별 헤더)
+CREATE TABLE IF NOT EXISTS daily_missions (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    date DATE NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY ix_daily_missions_date (date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 오늘의 미션 항목 (슬롯 번호 = 프리셋 미션 id)
+CREATE TABLE IF NOT EXISTS daily_mission_items (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    date DATE NOT NULL,
+    slot SMALLINT NOT NULL,
+    tier VARCHAR(20) NOT NULL,
+    title VARCHAR(100) NOT NULL,
+    description TEXT NOT NULL,
+    duration INT NOT NULL COMMENT '분 단위',
+    category VARCHAR(50) NOT NULL DEFAULT 'ai_generated',
+    UNIQUE KEY uq_daily_mission_items_date_slot (date, slot),
+    INDEX ix_daily_mission_items_date_tier (date, tier),
+    FOREIGN KEY (date) REFERENCES daily_missions(date) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자별/일자별 완료한 프리셋 미션 비트맵
+CREATE TABLE IF NOT EXISTS daily_preset_completions (
+    user_id INT NOT NULL,
+    date DATE NOT NULL,
+    completed_mask SMALLINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 비로그인 기기(게스트 id)별 프리셋 미션 완료 비트맵 (로그인 시 daily_preset_completions로 옮김)
+CREATE TABLE IF NOT EXISTS guest_preset_completions (
+    guest_id VARCHAR(36) NOT NULL,
+    date DATE NOT NULL,
+    completed_mask SMALLINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (guest_id, date),
+    INDEX ix_guest_preset_completions_date (date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자별 메달 누적 개수 (user_id 0: 비로그인)
+CREATE TABLE IF NOT EXISTS user_medal_tallies (
+    user_id INT NOT NULL PRIMARY KEY,
+    bronze INT NOT NULL DEFAULT 0,
+    silver INT NOT NULL DEFAULT 0,
+    gold INT NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자별/일자별 미션 통계 (일자는 completed_at 기준, user_id 0: 비로그인)
+CREATE TABLE IF NOT EXISTS user_daily_stats (
+    user_id INT NOT NULL,
+    date DATE NOT NULL,
+    completed INT NOT NULL DEFAULT 0,
+    failed INT NOT NULL DEFAULT 0,
+    focus_minutes INT NOT NULL DEFAULT 0,
+    bronze INT NOT NULL DEFAULT 0,
+    silver INT NOT NULL DEFAULT 0,
+    gold INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자별 누적 미션 통계와 연속 달성 일수
+CREATE TABLE IF NOT EXISTS user_stats (
+    user_id INT NOT NULL PRIMARY KEY,
+    completed INT NOT NULL DEFAULT 0,
+    failed INT NOT NULL DEFAULT 0,
+    focus_minutes INT NOT NULL DEFAULT 0,
+    bronze INT NOT NULL DEFAULT 0,
+    silver INT NOT NULL DEFAULT 0,
+    gold INT NOT NULL DEFAULT 0,
+    current_streak INT NOT NULL DEFAULT 0,
+    longest_streak INT NOT NULL DEFAULT 0,
+    last_completed_date DATE NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 여러 프로세스 중 하나만 작업을 실행하기 위한 잠금
+CREATE TABLE IF NOT EXISTS job_locks (
+    name VARCHAR(100) NOT NULL PRIMARY KEY,
+    owner VARCHAR(100) NOT NULL,
+    locked_until DATETIME NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 백그라운드 미션 생성 작업 상태 (모든 워커가 작업 id로 조회)
+CREATE TABLE IF NOT EXISTS mission_generation_jobs (
+    id VARCHAR(32) NOT NULL PRIMARY KEY,
+    date DATE NOT NULL,
+    days_ahead INT NOT NULL DEFAULT 0,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    result TEXT NULL,
+    error TEXT NULL,
+    created_at DATETIME NOT NULL,
+    finished_at DATETIME NULL,
+    active_date DATE NULL,
+    heartbeat_at DATETIME NULL,
+    UNIQUE KEY uq_mission_generation_jobs_active_date (active_date),
+    INDEX ix_mission_generation_jobs_date_status (date, status),
+    INDEX ix_mission_generation_jobs_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 적용된 스키마 마이그레이션 (backend/services/schema_migrations.py)
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INT NOT NULL PRIMARY KEY,
+    description VARCHAR(200) NOT NULL,
+    applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 버전 기록은 남기지 않는다. 이 파일을 기존 DB에 다시 실행해도 CREATE TABLE IF NOT EXISTS는 기존 테이블을
+-- 바꾸지 않으므로, 이후 flask migrate-schema가 모든 버전을 실행한다 (이미 반영된 변경은 각 마이그레이션이 건너뜀).
+
 -- 업적 테이블
 CREATE TABLE IF NOT EXISTS achievements (
     id INT AUTO_INCREMENT PRIMARY KEY,
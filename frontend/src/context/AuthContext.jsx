@@ -1,5 +1,6 @@
 import React, { createContext, useState, useContext, useEffect } from 'react';
 import axios from 'axios';
+import { getGuestId } from '../services/api';
 
 const AuthContext = createContext(null);
 const API_URL = '/api';
@@ -32,7 +33,12 @@ export const AuthProvider = ({ children }) => {
 
   const login = async (username, password) => {
     try {
-      const response = await axios.post(`${API_URL}/auth/login`, { username, password });
+      // 로그인 전 이 기기에서 남긴 게스트 기록을 계정으로 옮기도록 게스트 id를 함께 보낸다
+      const response = await axios.post(
+        `${API_URL}/auth/login`,
+        { username, password },
+        { headers: { 'X-Guest-Id': getGuestId() } }
+      );
       const { access_token } = response.data;
 
       if (!access_token) throw new Error('No access token');
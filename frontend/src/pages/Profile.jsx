@@ -270,6 +270,7 @@ function Profile() {
     gold: 0,
   });
   const [recentMissions, setRecentMissions] = useState([]);
+  const [tierMissionsCache, setTierMissionsCache] = useState({});
   const [selectedTier, setSelectedTier] = useState(null);
   const [tierMissions, setTierMissions] = useState([]);
   const [isLoadingTier, setIsLoadingTier] = useState(false);
@@ -284,6 +285,13 @@ function Profile() {
   // 메달 클릭 시 해당 티어의 완료한 미션 목록을 모달로 표시
   const handleMedalClick = async (tier) => {
     setSelectedTier(tier);
+
+    // 프로필 요약에서 이미 받아온 목록이 있으면 추가 요청 없이 표시
+    if (tierMissionsCache[tier]) {
+      setTierMissions(tierMissionsCache[tier]);
+      return;
+    }
+
     setIsLoadingTier(true);
     try {
       const missions = await missionApi.getByTier(tier);
@@ -306,17 +314,23 @@ function Profile() {
 
     const fetchData = async () => {
       try {
-        // 메달 통계와 최근 미션을 병렬로 가져와 성능 최적화
-        const [medalsData, recentData] = await Promise.all([
-          missionApi.getMedals(),
-          missionApi.getRecent(5),
-        ]);
-        setMedalStats(medalsData.medals);
-        setRecentMissions(recentData);
+        // 메달 통계, 최근 미션, 티어별 미션을 요청 한 번으로 가져온다
+        const summary = await missionApi.getProfileSummary({ recentLimit: 5 });
+        setMedalStats(summary.medals);
+        setRecentMissions(summary.recent?.missions || []);
+        setTierMissionsCache(
+          Object.fromEntries(
+            Object.entries(summary.tiers || {}).map(([tier, section]) => [
+              tier,
+              section.missions || [],
+            ])
+          )
+        );
       } catch (error) {
         console.error("데이터 불러오기 실패:", error);
         setMedalStats({ bronze: 0, silver: 0, gold: 0 });
         setRecentMissions([]);
+        setTierMissionsCache({});
       }
     };
 
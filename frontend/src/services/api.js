@@ -1,13 +1,31 @@
 import { API_BASE_URL } from "../constants";
 
+const GUEST_ID_KEY = "guestId";
+
+// 비로그인 상태에서 남긴 기록을 로그인 시 계정으로 옮기기 위한 기기별 게스트 id
+export const getGuestId = () => {
+  let guestId = localStorage.getItem(GUEST_ID_KEY);
+  if (!guestId) {
+    guestId = crypto.randomUUID();
+    localStorage.setItem(GUEST_ID_KEY, guestId);
+  }
+  return guestId;
+};
+
+const authHeaders = () => {
+  const token = localStorage.getItem("token");
+  return token ? { Authorization: `Bearer ${token}` } : {};
+};
+
 const apiFetch = async (endpoint, options = {}) => {
   const url = `${API_BASE_URL}${endpoint}`;
   const response = await fetch(url, {
+    ...options,
     headers: {
       "Content-Type": "application/json",
+      "X-Guest-Id": getGuestId(),
       ...options.headers,
     },
-    ...options,
   });
 
   if (!response.ok) {
@@ -21,7 +39,9 @@ const apiFetch = async (endpoint, options = {}) => {
 
 export const missionApi = {
   getPresets: async () => {
-    const data = await apiFetch("/missions/presets");
+    const data = await apiFetch("/missions/presets", {
+      headers: authHeaders(),
+    });
     // API 응답 형식 정규화: 배열 또는 { missions: [] } 형식 모두 처리
     return Array.isArray(data) ? data : data.missions || [];
   },
@@ -29,6 +49,7 @@ export const missionApi = {
   complete: async (mission) => {
     return apiFetch("/missions/presets/complete", {
       method: "POST",
+      headers: authHeaders(),
       body: JSON.stringify({
         preset_mission_id: mission.id,
         tier: mission.tier,
@@ -42,6 +63,7 @@ export const missionApi = {
   fail: async (mission) => {
     return apiFetch("/missions/presets/fail", {
       method: "POST",
+      headers: authHeaders(),
       body: JSON.stringify({
         preset_mission_id: mission.id,
         tier: mission.tier,
@@ -66,6 +88,16 @@ export const missionApi = {
     return data.missions || [];
   },
 
+  // 프로필 화면에 필요한 메달/최근 미션/티어별 미션을 한 번에 조회
+  getProfileSummary: async ({ recentLimit = 5, tierLimit = 50 } = {}) => {
+    return apiFetch(
+      `/missions/profile-summary?recent_limit=${recentLimit}&tier_limit=${tierLimit}`,
+      {
+        headers: authHeaders(),
+      }
+    );
+  },
+
   getByTier: async (tier) => {
     const token = localStorage.getItem("token");
     const data = await apiFetch(`/missions/by-tier/${tier}`, {